@@ -0,0 +1,136 @@
+############################################################
+# Project Name : Todo App
+# File Name    : benchmarks/bench_task.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Memory per task and construction throughput of Task compared to the old dict-based class
+############################################################
+
+from datetime import datetime
+from typing import Callable, Optional
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from todo.task import Task  # noqa: E402
+
+
+class LegacyTask:
+    """
+    The Task class before it used __slots__, kept here as the baseline.
+    """
+
+    def __init__(self, task_id: int, title: str, created_at: datetime, due_date: datetime, is_complete: bool,
+                 note: Optional[str] = None) -> None:
+        self._task_id = task_id
+        self._title = title
+        self._created_at = created_at
+        self._due_date = due_date
+        self._is_complete = is_complete
+        self._note = note
+
+    @property
+    def task_id(self) -> int:
+        return self._task_id
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def due_date(self) -> datetime:
+        return self._due_date
+
+
+def make_rows(count: int) -> list[tuple]:
+    """
+    Builds rows shaped like the ones returned by the database.
+    :param count: Number of rows
+    :return: List of row tuples
+    """
+    created_at = datetime(2025, 6, 16, 9, 0)
+    due_date = datetime(2025, 6, 20, 12, 0)
+    return [(i, f"Task {i}", created_at, due_date, i % 2 == 0, None) for i in range(count)]
+
+
+def memory_per_task(build: Callable[[list[tuple]], list], rows: list[tuple]) -> float:
+    """
+    Measures the memory allocated per task object, excluding the row data it points to.
+    :param build: Function turning the rows into a list of tasks
+    :param rows: Rows to convert
+    :return: Bytes per task
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tasks = build(rows)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the tasks is not part of a task
+    size = after - before - sys.getsizeof(tasks)
+    del tasks
+    return size / len(rows)
+
+
+def throughput(build: Callable[[list[tuple]], list], rows: list[tuple], repeat: int) -> float:
+    """
+    Measures how many tasks are built per second, best of several runs.
+    :param build: Function turning the rows into a list of tasks
+    :param rows: Rows to convert
+    :param repeat: Number of runs
+    :return: Tasks per second
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build(rows)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best
+
+
+def attribute_reads(tasks: list, repeat: int) -> float:
+    """
+    Measures attribute reads per second on task_id, title and due_date, best of several runs.
+    :param tasks: Tasks to read
+    :param repeat: Number of runs
+    :return: Attribute reads per second
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for task in tasks:
+            task.task_id, task.title, task.due_date
+        best = min(best, time.perf_counter() - start)
+    return 3 * len(tasks) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Task representation")
+    parser.add_argument("--tasks", type=int, default=200_000, help="Number of tasks to build")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per throughput measurement")
+    args = parser.parse_args()
+
+    rows = make_rows(args.tasks)
+    variants: dict[str, Callable[[list[tuple]], list]] = {
+        "legacy Task(*row)": lambda data: [LegacyTask(*row) for row in data],
+        "slotted Task(*row)": lambda data: [Task(*row) for row in data],
+        "slotted Task.from_row": lambda data: [Task.from_row(row) for row in data],
+        "slotted Task.from_rows": lambda data: list(Task.from_rows(data)),
+    }
+
+    print(f"{'variant':<24}{'bytes/task':>12}{'tasks/s':>14}{'reads/s':>14}")
+    for name, build in variants.items():
+        memory = memory_per_task(build, rows)
+        rate = throughput(build, rows, args.repeat)
+        reads = attribute_reads(build(rows), args.repeat)
+        print(f"{name:<24}{memory:>12.1f}{rate:>14,.0f}{reads:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
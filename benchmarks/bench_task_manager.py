@@ -0,0 +1,215 @@
+############################################################
+# Project Name : Todo App
+# File Name    : benchmarks/bench_task_manager.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Throughput and latency of TaskManager operations on each storage backend
+############################################################
+
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from typing import Callable
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_config.task_store import BACKENDS, TaskStore, create_store  # noqa: E402
+from todo.task import Task  # noqa: E402
+from todo.task_manager import TaskManager  # noqa: E402
+
+BASE = datetime(2025, 6, 16, 9, 0)
+
+# p99 changes smaller than this are timer and scheduler noise, not regressions
+P99_NOISE_MS: float = 0.05
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+    :param samples: Sorted latencies
+    :param fraction: Percentile between 0 and 1
+    :return: Latency at the percentile
+    """
+    return samples[min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))]
+
+
+def make_task(task_id: int) -> Task:
+    """
+    Builds a benchmark task, a third complete and a tenth without a due date.
+    :param task_id: Task id
+    :return: Task
+    """
+    due_date = BASE + timedelta(hours=task_id % 2000 - 1000) if task_id % 10 else None
+    return Task(task_id, f"Task {task_id}", BASE, due_date, task_id % 3 == 0, None)
+
+
+def open_store(backend: str, directory: str) -> TaskStore:
+    """
+    Opens an empty store of the backend.
+    :param backend: Backend name
+    :param directory: Directory for the SQLite database file
+    :return: Empty store
+    """
+    if backend == "sqlite":
+        os.environ["TODO_SQLITE_PATH"] = os.path.join(directory, "bench.db")
+    store: TaskStore = create_store(backend)
+    if backend == "postgres":
+        with store.db.cursor() as cur:
+            cur.execute("TRUNCATE tasks")
+    return store
+
+
+def measure(operation: Callable[[int], object], count: int) -> dict:
+    """
+    Runs an operation count times and records the latency of every call.
+    :param operation: Called with the run number
+    :param count: Number of calls
+    :return: Dictionary with ops, ops_per_sec, p50_ms and p99_ms
+    """
+    latencies: list[float] = []
+    clock = time.perf_counter
+    total_start: float = clock()
+    for number in range(count):
+        start: float = clock()
+        operation(number)
+        latencies.append(clock() - start)
+    elapsed: float = clock() - total_start
+    latencies.sort()
+    return {
+        "ops": count,
+        "ops_per_sec": round(count / elapsed, 1) if elapsed else None,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+    }
+
+
+def run_backend(backend: str, tasks: int, ops: int, seed: int) -> dict:
+    """
+    Seeds a backend with tasks and measures every operation.
+    :param backend: Backend name
+    :param tasks: Number of tasks seeded before measuring
+    :param ops: Calls per operation, full listings run a tenth as often
+    :param seed: Random seed for the task ids used
+    :return: Results keyed by operation name
+    """
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        # The manager reports every operation with print, which is not what is being measured
+        with redirect_stdout(devnull):
+            manager = TaskManager(store=open_store(backend, directory), cached_stats=False)
+        try:
+            seed_start: float = time.perf_counter()
+            manager.add_tasks(map(make_task, range(1, tasks + 1)))
+            seed_seconds: float = time.perf_counter() - seed_start
+
+            existing = [rng.randint(1, tasks) for _ in range(ops)]
+            incomplete = [task_id for task_id in rng.sample(range(1, tasks + 1), min(tasks, 3 * ops))
+                          if task_id % 3][:ops]
+            new_ids = range(tasks + 1, tasks + ops + 1)
+            cursors: list = [None]
+
+            def next_page(_: int) -> None:
+                cursors[0] = manager.list_tasks(page_size=50, cursor=cursors[0]).next_cursor
+
+            operations: dict[str, tuple[Callable[[int], object], int]] = {
+                "add": (lambda n: manager.add_task(make_task(new_ids[n])), ops),
+                "get": (lambda n: manager.get_task(existing[n]), ops),
+                "is_task": (lambda n: manager.is_task(existing[n]), ops),
+                "update": (lambda n: manager.update_task(make_task(existing[n])), ops),
+                "set_complete": (lambda n: manager.set_complete(incomplete[n]), len(incomplete)),
+                "delete": (lambda n: manager.delete_task(new_ids[n]), ops),
+                "count_total": (lambda n: manager.count_total_tasks(), ops),
+                "count_completed": (lambda n: manager.count_completed_task(), ops),
+                "count_incomplete": (lambda n: manager.count_incompleted_tasks(), ops),
+                "stats": (lambda n: manager.stats(), ops),
+                "list_first_page": (lambda n: manager.list_tasks(is_complete=False, page_size=50), ops),
+                "list_next_page": (next_page, ops),
+                "list_all": (lambda n: sum(1 for _ in manager.iter_tasks()), max(1, ops // 10)),
+                "list_incomplete": (lambda n: sum(1 for _ in manager.iter_tasks(is_complete=False)),
+                                    max(1, ops // 10)),
+            }
+            results: dict = {"seed": {"ops": tasks, "ops_per_sec": round(tasks / seed_seconds, 1)}}
+            with redirect_stdout(devnull):
+                for name, (operation, count) in operations.items():
+                    results[name] = measure(operation, count)
+            return results
+        finally:
+            with redirect_stdout(devnull):
+                manager.close_connection()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Finds operations slower than the baseline by more than the tolerance.
+    Throughput below or p99 latency above the baseline by the tolerance counts as a regression,
+    p99 differences under P99_NOISE_MS are ignored.
+    :param results: Results of this run
+    :param baseline: Results of the baseline run, in the same format
+    :param tolerance: Allowed relative change, 0.2 for 20%
+    :return: One message per regression
+    """
+    regressions: list[str] = []
+    for backend, operations in results["backends"].items():
+        for name, result in operations.items():
+            expected: dict | None = baseline.get("backends", {}).get(backend, {}).get(name)
+            if not expected:
+                continue
+            if expected.get("ops_per_sec") and result["ops_per_sec"] < expected["ops_per_sec"] * (1 - tolerance):
+                regressions.append(f"{backend} {name}: {result['ops_per_sec']:,.0f} ops/s, "
+                                   f"baseline {expected['ops_per_sec']:,.0f} ops/s")
+            p99: float = result.get("p99_ms", 0)
+            if expected.get("p99_ms") and p99 > expected["p99_ms"] * (1 + tolerance) and \
+                    p99 - expected["p99_ms"] > P99_NOISE_MS:
+                regressions.append(f"{backend} {name}: p99 {result['p99_ms']} ms, baseline {expected['p99_ms']} ms")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TaskManager operations")
+    parser.add_argument("--backend", nargs="+", choices=BACKENDS, default=["memory", "sqlite"],
+                        help="Backends to measure, postgres empties the tasks table of the DB_* database")
+    parser.add_argument("--tasks", type=int, default=10_000, help="Tasks seeded before measuring (1k to 1M)")
+    parser.add_argument("--ops", type=int, default=1000, help="Calls per operation")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare with the results stored in this file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown against the baseline")
+    args = parser.parse_args()
+
+    results: dict = {
+        "tasks": args.tasks,
+        "ops": args.ops,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "backends": {},
+    }
+    print(f"{'backend':<10}{'operation':<18}{'ops/s':>14}{'p50 ms':>10}{'p99 ms':>10}")
+    for backend in args.backend:
+        results["backends"][backend] = run_backend(backend, args.tasks, args.ops, args.seed)
+        for name, result in results["backends"][backend].items():
+            print(f"{backend:<10}{name:<18}{result['ops_per_sec']:>14,.0f}"
+                  f"{result.get('p50_ms', ''):>10}{result.get('p99_ms', ''):>10}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions: list[str] = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
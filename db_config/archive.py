@@ -0,0 +1,190 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/archive.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Moves old completed tasks to the monthly partitioned task_archive table and drops old months
+############################################################
+
+from datetime import date, datetime
+from typing import Callable, ContextManager
+import re
+import time
+
+import psycopg2.extensions
+
+# Key of the advisory lock that serializes partition creation between archivers
+ARCHIVE_LOCK_ID: int = 727_002
+
+# Tasks completed before migration 9 have no completion time, their last change stands in for it
+COMPLETED_AT: str = "COALESCE(completed_at, updated_at)"
+
+# Locked rows belong to writers or another archiver and are left for a later batch
+ARCHIVE_CANDIDATES: str = (f"SELECT task_id, date_trunc('month', {COMPLETED_AT} AT TIME ZONE 'UTC')::date "
+                           f"FROM tasks WHERE is_complete AND {COMPLETED_AT} < %s "
+                           f"ORDER BY {COMPLETED_AT} LIMIT %s FOR UPDATE SKIP LOCKED")
+MOVE_TO_ARCHIVE: str = ("WITH moved AS ("
+                        "DELETE FROM tasks WHERE task_id = ANY(%s) AND is_complete "
+                        f"RETURNING task_id, title, created_at, due_date, note, {COMPLETED_AT} AS completed_at) "
+                        "INSERT INTO task_archive (task_id, title, created_at, due_date, note, completed_at) "
+                        "SELECT * FROM moved "
+                        "ON CONFLICT (task_id, completed_at) DO UPDATE SET title = EXCLUDED.title, "
+                        "created_at = EXCLUDED.created_at, due_date = EXCLUDED.due_date, note = EXCLUDED.note, "
+                        "archived_at = EXCLUDED.archived_at")
+# Newest first; bounds on completed_at let the planner skip the partitions of other months
+ARCHIVED_TASKS: str = ("SELECT task_id, title, created_at, due_date, TRUE, note FROM task_archive "
+                       "WHERE completed_at >= COALESCE(%s, '-infinity'::timestamptz) "
+                       "AND completed_at < COALESCE(%s, 'infinity'::timestamptz) "
+                       "ORDER BY completed_at DESC, task_id LIMIT %s")
+# Moves the latest archived copy of a task back unless a live task has its id; one statement, so a
+# conflicting insert fails the whole move
+RESTORE_TASK: str = ("WITH restored AS ("
+                     "DELETE FROM task_archive a USING ("
+                     "SELECT task_id, completed_at FROM task_archive WHERE task_id = %s "
+                     "AND NOT EXISTS (SELECT 1 FROM tasks WHERE task_id = %s) "
+                     "ORDER BY completed_at DESC LIMIT 1) latest "
+                     "WHERE a.task_id = latest.task_id AND a.completed_at = latest.completed_at "
+                     "RETURNING a.task_id, a.title, a.created_at, a.due_date, a.note, a.completed_at) "
+                     "INSERT INTO tasks (task_id, title, created_at, due_date, is_complete, note, completed_at) "
+                     "SELECT task_id, title, created_at, due_date, TRUE, note, completed_at FROM restored "
+                     "RETURNING task_id")
+ARCHIVE_PARTITIONS: str = ("SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                           "WHERE i.inhparent = 'task_archive'::regclass")
+PARTITION_NAME = re.compile(r"task_archive_(\d{4})_(\d{2})")
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    Moves a month forward or back.
+    :param month: Any day of the month
+    :param months: Number of months to add, negative to go back
+    :return: First day of the resulting month
+    """
+    index: int = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """
+    Name of the archive partition holding a completion month.
+    :param month: Any day of the month
+    :return: Table name such as task_archive_2025_06
+    """
+    return f"task_archive_{month.year:04d}_{month.month:02d}"
+
+
+def archive_partitions(conn: psycopg2.extensions.connection) -> dict[str, date]:
+    """
+    Lists the monthly partitions of task_archive.
+    :param conn: Autocommit database connection
+    :return: Partition names mapped to the first day of their month
+    """
+    with conn.cursor() as cur:
+        cur.execute(ARCHIVE_PARTITIONS)
+        names: list[str] = [row[0] for row in cur.fetchall()]
+    partitions: dict[str, date] = {}
+    for name in names:
+        match = PARTITION_NAME.fullmatch(name)
+        if match:
+            partitions[name] = date(int(match.group(1)), int(match.group(2)), 1)
+    return partitions
+
+
+def create_partitions(conn: psycopg2.extensions.connection, months: set[date]) -> None:
+    """
+    Creates the archive partitions of some completion months, in a short transaction of its own since
+    adding a partition locks the whole archive table.
+    :param conn: Autocommit database connection
+    :param months: First days of the months
+    :return: None
+    """
+    conn.autocommit = False
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(%s)", (ARCHIVE_LOCK_ID,))
+            for month in sorted(months):
+                cur.execute(f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF task_archive "
+                            "FOR VALUES FROM (%s) TO (%s)",
+                            (f"{month.isoformat()} 00:00+00", f"{add_months(month, 1).isoformat()} 00:00+00"))
+    finally:
+        conn.autocommit = True
+
+
+def archive_batch(conn: psycopg2.extensions.connection, before: datetime, batch_size: int,
+                  known: set[date]) -> tuple[int, int, set[date]]:
+    """
+    Moves one batch of tasks completed before a time from tasks to task_archive in one transaction,
+    locking only the rows it moves. Nothing is moved when a completion month has no partition yet.
+    :param conn: Autocommit database connection
+    :param before: Tasks completed before this time are archived
+    :param batch_size: Maximum number of tasks moved
+    :param known: First days of the months that have a partition
+    :return: Number of tasks selected, number moved and the months of the selection without a partition
+    """
+    conn.autocommit = False
+    try:
+        with conn, conn.cursor() as cur:
+            cur.execute(ARCHIVE_CANDIDATES, (before, batch_size))
+            candidates: list[tuple] = cur.fetchall()
+            missing: set[date] = {month for _, month in candidates} - known
+            if not candidates or missing:
+                return len(candidates), 0, missing
+            # Tells the change log these deletions are archive moves
+            cur.execute("SET LOCAL todo.archiving = 'on'")
+            cur.execute(MOVE_TO_ARCHIVE, ([task_id for task_id, _ in candidates],))
+            return len(candidates), cur.rowcount, missing
+    finally:
+        conn.autocommit = True
+
+
+def archive_completed(connection: Callable[[], ContextManager[psycopg2.extensions.connection]], before: datetime,
+                      batch_size: int = 1000, pause: float = 0.0, max_batches: int | None = None) -> int:
+    """
+    Moves tasks completed before a time from tasks to task_archive.
+    Each batch is its own transaction locking only the rows it moves, so writers are never held up for long,
+    and takes its own connection, so other callers get the connection during the pauses.
+    :param connection: Gives an autocommit database connection for a with block
+    :param before: Tasks completed before this time are archived
+    :param batch_size: Maximum number of tasks moved per transaction
+    :param pause: Seconds to wait between batches
+    :param max_batches: Stop after this many batches, None to archive every eligible task
+    :return: Number of tasks archived
+    """
+    with connection() as conn:
+        known: set[date] = set(archive_partitions(conn).values())
+    archived: int = 0
+    batches: int = 0
+    while max_batches is None or batches < max_batches:
+        with connection() as conn:
+            selected, moved, missing = archive_batch(conn, before, batch_size, known)
+            if missing:
+                # The row locks were released, the batch is selected again once its partitions exist
+                create_partitions(conn, missing)
+        archived += moved
+        if missing:
+            known |= missing
+            continue
+        batches += 1
+        if selected < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return archived
+
+
+def drop_partitions(conn: psycopg2.extensions.connection, before: date) -> list[str]:
+    """
+    Drops the archive partitions of every month before a month, which removes their tasks at once.
+    :param conn: Autocommit database connection
+    :param before: Partitions of months before the month of this day are dropped
+    :return: Names of the dropped partitions
+    """
+    cutoff: date = add_months(before, 0)
+    dropped: list[str] = []
+    with conn.cursor() as cur:
+        for name, month in sorted(archive_partitions(conn).items(), key=lambda item: item[1]):
+            if month < cutoff:
+                cur.execute(f"DROP TABLE IF EXISTS {name}")
+                dropped.append(name)
+    return dropped
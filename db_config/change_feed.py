@@ -0,0 +1,190 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/change_feed.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Consumer of the task_changes log, woken by LISTEN/NOTIFY and resumable from a sequence number
+############################################################
+
+from datetime import datetime
+from typing import Iterator, NamedTuple
+import logging
+import select
+import threading
+
+import psycopg2
+import psycopg2.extensions
+
+# Channel notified by the task_changes triggers when a transaction logged changes
+CHANGE_CHANNEL: str = "todo_task_changes"
+
+# Kinds of change, "archive" is a task moved to the archive, "truncate" has no task id and means every
+# task was removed
+CHANGE_OPS: tuple[str, ...] = ("insert", "update", "complete", "delete", "archive", "truncate")
+
+# One statement, so the snapshot bounds are those of the rows it reads. A LEFT JOIN keeps one row
+# with the bounds when there are no changes.
+READ_CHANGES: str = ("SELECT pg_snapshot_xmin(s)::text::bigint, pg_snapshot_xmax(s)::text::bigint, "
+                     "c.seq, c.task_id, c.op, c.is_complete, c.changed_at "
+                     "FROM pg_current_snapshot() s LEFT JOIN LATERAL "
+                     "(SELECT seq, task_id, op, is_complete, changed_at FROM task_changes "
+                     "WHERE seq > %s ORDER BY seq LIMIT %s) c ON true")
+LATEST_CHANGE: str = "SELECT COALESCE(MAX(seq), 0) FROM task_changes"
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeEvent(NamedTuple):
+    """
+    One logged change. is_complete is the new state for inserts and updates and None otherwise.
+    """
+    seq: int
+    task_id: int | None
+    op: str
+    is_complete: bool | None
+    changed_at: datetime
+
+
+class ChangeCursor:
+    """
+    Position in the change log. Sequence numbers are taken before commit, so a missing number may
+    belong to a transaction still running; events after it are held back until that transaction has
+    ended, so no event is skipped or delivered out of order.
+    """
+
+    def __init__(self, position: int) -> None:
+        self.position = position
+        # First missing sequence number and the snapshot xmax when it was noticed
+        self._gap: tuple[int, int] | None = None
+
+    def advance(self, rows: list[tuple]) -> list[ChangeEvent]:
+        """
+        Takes the events of a READ_CHANGES result that can be delivered and moves past them.
+        :param rows: Rows returned by READ_CHANGES
+        :return: Events in sequence order, possibly none
+        """
+        events: list[ChangeEvent] = []
+        if not rows:
+            return events
+        xmin, xmax = rows[0][0], rows[0][1]
+        for row in rows:
+            seq = row[2]
+            if seq is None:
+                break
+            if seq != self.position + 1:
+                if self._gap is None or self._gap[0] != self.position + 1:
+                    self._gap = (self.position + 1, xmax)
+                if xmin < self._gap[1]:
+                    # A transaction running when the gap was noticed may still commit it
+                    break
+                # Every such transaction has ended, the numbers were rolled back or never used
+                self._gap = None
+            events.append(ChangeEvent(*row[2:]))
+            self.position = seq
+        return events
+
+
+class ChangeFeed:
+    def __init__(self, after: int | None = None, batch_size: int = 500, poll_interval: float = 1.0,
+                 **connect_params) -> None:
+        """
+        Opens a dedicated connection listening for new changes.
+        :param after: Sequence number of the last event already handled, 0 for the whole log,
+                      None to receive only changes committed from now on
+        :param batch_size: Maximum number of events read per query
+        :param poll_interval: Seconds to wait for a notification before checking the log again
+        :param connect_params: Keyword arguments passed to psycopg2.connect
+        """
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._connect_params = connect_params
+        self._closed = threading.Event()
+        self._conn: psycopg2.extensions.connection = self._connect()
+        if after is None:
+            with self._conn.cursor() as cur:
+                cur.execute(LATEST_CHANGE)
+                after = cur.fetchone()[0]
+        self._cursor = ChangeCursor(after)
+
+    @property
+    def position(self) -> int:
+        """
+        Sequence number of the last event returned, pass it as after to resume.
+        :return: Sequence number
+        """
+        return self._cursor.position
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        """
+        Opens the connection and subscribes to the change channel.
+        :return: Listening connection
+        """
+        conn = psycopg2.connect(**self._connect_params)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(f"LISTEN {CHANGE_CHANNEL}")
+        return conn
+
+    def read(self) -> list[ChangeEvent]:
+        """
+        Reads the next committed events without waiting.
+        :return: Up to batch_size events after the current position, possibly none
+        """
+        with self._conn.cursor() as cur:
+            cur.execute(READ_CHANGES, (self._cursor.position, self.batch_size))
+            rows: list[tuple] = cur.fetchall()
+        # Notifications received so far are covered by this read
+        self._conn.notifies.clear()
+        return self._cursor.advance(rows)
+
+    def _wait(self) -> None:
+        """
+        Waits until a change is notified or the poll interval passes.
+        :return: None
+        """
+        ready, _, _ = select.select([self._conn], [], [], self.poll_interval)
+        if ready:
+            self._conn.poll()
+
+    def _reconnect(self) -> None:
+        """
+        Reopens the connection, retrying until it succeeds or the feed is closed.
+        :return: None
+        """
+        try:
+            self._conn.close()
+        except psycopg2.Error:
+            pass
+        while not self._closed.wait(self.poll_interval):
+            try:
+                self._conn = self._connect()
+                return
+            except psycopg2.Error:
+                continue
+
+    def __iter__(self) -> Iterator[ChangeEvent]:
+        """
+        Yields events as they are committed, blocking in between, until close() is called.
+        A lost connection is reopened and the feed continues from its position.
+        :return: Iterator of events
+        """
+        while not self._closed.is_set():
+            try:
+                events: list[ChangeEvent] = self.read()
+                yield from events
+                if len(events) < self.batch_size:
+                    self._wait()
+            except (OSError, ValueError, psycopg2.Error) as error:
+                if self._closed.is_set():
+                    return
+                logger.warning("Change feed lost its connection: %s", error)
+                self._reconnect()
+
+    def close(self) -> None:
+        """
+        Stops iteration and closes the connection.
+        :return: None
+        """
+        self._closed.set()
+        self._conn.close()
@@ -0,0 +1,208 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/connection_pool.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Thread-safe pool of database connections with health checks and usage stats
+############################################################
+
+from contextlib import contextmanager
+from typing import Iterator
+import threading
+import time
+
+import psycopg2
+import psycopg2.extensions
+
+from .errors import StorageError
+
+
+class PoolError(StorageError):
+    """
+    Raised when a connection cannot be checked out of the pool
+    """
+
+
+class ConnectionPool:
+    def __init__(self, min_size: int = 1, max_size: int = 10, timeout: float | None = 30.0,
+                 check_interval: float = 30.0, **connect_params) -> None:
+        """
+        Creates the pool and opens the minimum number of connections.
+        :param min_size: Number of connections opened up front and kept open
+        :param max_size: Maximum number of connections open at the same time
+        :param timeout: Seconds to wait for a free connection, None waits forever
+        :param check_interval: Connections idle longer than this many seconds are pinged on checkout
+        :param connect_params: Keyword arguments passed to psycopg2.connect
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size min={min_size} max={max_size}")
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self._connect_params = connect_params
+        self._cond = threading.Condition()
+        # Idle connections with the time they were returned, used as a LIFO stack
+        self._idle: list[tuple[psycopg2.extensions.connection, float]] = []
+        self._size = 0
+        self._in_use = 0
+        self._closed = False
+        self._checkouts = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._replaced = 0
+
+        for _ in range(min_size):
+            self._idle.append((self._connect(), time.monotonic()))
+            self._size += 1
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        """
+        Opens a new autocommit connection.
+        :return: New database connection
+        """
+        conn = psycopg2.connect(**self._connect_params)
+        conn.autocommit = True
+        return conn
+
+    def _is_healthy(self, conn: psycopg2.extensions.connection, idle_since: float) -> bool:
+        """
+        Checks that an idle connection is still usable before handing it out.
+        :param conn: Connection to check
+        :param idle_since: Monotonic time the connection was returned to the pool
+        :return: True if the connection can be used else False
+        """
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    def getconn(self) -> psycopg2.extensions.connection:
+        """
+        Checks out a connection, waiting for one to be returned if the pool is exhausted.
+        :return: Healthy database connection
+        """
+        start = time.monotonic()
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolError("Connection pool is closed")
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    conn, idle_since = None, 0.0
+                    self._size += 1
+                    break
+                remaining = None if self.timeout is None else self.timeout - (time.monotonic() - start)
+                if remaining is not None and remaining <= 0:
+                    raise PoolError(f"No connection available after {self.timeout} seconds")
+                waited = True
+                self._cond.wait(remaining)
+            self._in_use += 1
+            self._checkouts += 1
+            if waited:
+                wait_time = time.monotonic() - start
+                self._waits += 1
+                self._total_wait += wait_time
+                self._max_wait = max(self._max_wait, wait_time)
+
+        try:
+            if conn is not None and not self._is_healthy(conn, idle_since):
+                conn.close()
+                conn = None
+                with self._cond:
+                    self._replaced += 1
+            if conn is None:
+                conn = self._connect()
+            return conn
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+    def putconn(self, conn: psycopg2.extensions.connection, close: bool = False) -> None:
+        """
+        Returns a connection to the pool.
+        :param conn: Connection previously returned by getconn
+        :param close: Close the connection instead of keeping it for reuse
+        :return: None
+        """
+        if not close and not conn.closed and \
+                conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                close = True
+        with self._cond:
+            self._in_use -= 1
+            if close or conn.closed or self._closed:
+                self._size -= 1
+                discard = True
+            else:
+                self._idle.append((conn, time.monotonic()))
+                discard = False
+            self._cond.notify()
+        if discard and not conn.closed:
+            conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Checks out a connection for the duration of the with block.
+        Connections that fail with a connection-level error are discarded.
+        :return: Database connection
+        """
+        conn = self.getconn()
+        broken = False
+        try:
+            yield conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        finally:
+            self.putconn(conn, close=broken)
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the pool usage.
+        :return: Dictionary with connection counts and wait times in seconds
+        """
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "total_wait_time": self._total_wait,
+                "max_wait_time": self._max_wait,
+                "avg_wait_time": self._total_wait / self._waits if self._waits else 0.0,
+                "replaced": self._replaced,
+            }
+
+    def close(self) -> None:
+        """
+        Closes every idle connection; connections still checked out are closed when returned.
+        :return: None
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            conn.close()
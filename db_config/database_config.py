@@ -3,180 +3,776 @@
 # File Name    : db_config/database_config.py
 # Author       : @nissubba1
 # Created Date : 2025-06-16
-# Updated Date : 2025-06-17
+# Updated Date : 2026-10-18
 # Description  : Class for creating database connection and performing CRUD operations
 ############################################################
 
 from todo.task import Task
+from .archive import archive_completed, drop_partitions
+from .change_feed import ChangeFeed
+from .connection_pool import ConnectionPool
+from .errors import StorageError
+from .notification_listener import NotificationListener
+from .migrations import Migration, install_task_counters, migrate_schema, remove_task_counters
+from .prepared_statements import PreparedQuery, PreparedStatements
+from .query_stats import QueryStats, instrumented_cursor
+from .replicas import PRIMARY, REPLICA, ROUTES, ReplicaFailure, ReplicaSet
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Callable, Iterable, Iterator, TextIO
+from uuid import uuid4
 from dotenv import load_dotenv
 import psycopg2
+import psycopg2.extensions
+import csv
+import io
+import logging
 import os
+import threading
+import time
 
-load_dotenv()
+# Connection targets whose schema was found up to date by this process
+_current_schemas: set[tuple] = set()
+_env_loaded: bool = False
+
+logger = logging.getLogger(__name__)
+
+
+def load_env() -> None:
+    """
+    Loads the .env file into the environment the first time it is called.
+    Variables already set in the environment are kept.
+    :return: None
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+def get_connection_params() -> dict:
+    """
+    Reads the connection settings from the DB_* environment variables
+    :return: Keyword arguments for psycopg2.connect
+    """
+    return {
+        "host": os.getenv("DB_HOST"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "port": os.getenv("DB_PORT"),
+        "database": os.getenv("DB_DATABASE"),
+    }
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """
+    Reads a boolean environment variable
+    :param name: Name of the environment variable
+    :param default: Value used when the variable is not set
+    :return: True for 1/true/yes/on else False
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
 
 
 class DatabaseConfig:
-    def __init__(self) -> None:
+    def __init__(self, pooled: bool | None = None, lazy: bool | None = None,
+                 replicas: list[str] | None = None) -> None:
+        """
+        Create the database connection, or a connection pool when pooled mode is enabled
+        :param pooled: Use a connection pool, defaults to the DB_POOL_ENABLED environment variable
+        :param lazy: Connect on first use instead of now, defaults to the DB_LAZY_CONNECT environment variable
+        :param replicas: Connection strings of read replicas, defaults to the comma separated DB_REPLICAS
+                         environment variable
         """
-        Create the database connection
+        load_env()
+        if pooled is None:
+            pooled = env_flag("DB_POOL_ENABLED")
+        if lazy is None:
+            lazy = env_flag("DB_LAZY_CONNECT")
+        if replicas is None:
+            replicas = [dsn.strip() for dsn in os.getenv("DB_REPLICAS", "").split(",") if dsn.strip()]
+        self.pooled: bool = pooled
+        self.lazy: bool = lazy
+        # Rows fetched per round trip by server-side cursors
+        self.itersize: int = int(os.getenv("DB_ITERSIZE", "2000"))
+        # Connections usable at the same time, the size of the pool or the one shared connection
+        self.max_connections: int = int(os.getenv("DB_POOL_MAX", "10")) if pooled else 1
+        self.conn = None
+        self.cur = None
+        # Serializes the threads sharing the connection when there is no pool
+        self._shared_lock = threading.RLock()
+        self.pool: ConnectionPool | None = None
+        self.connected: bool = False
+        # Why the last connection attempt failed, reported by the operations that needed it
+        self._connect_error: BaseException | None = None
+        self._connect_lock = threading.Lock()
+        # Every cursor records its statements here unless DB_QUERY_STATS is off
+        self.statistics: QueryStats | None = None
+        self._connect_params: dict = get_connection_params()
+        if env_flag("DB_QUERY_STATS", default=True):
+            slow_ms: str = os.getenv("DB_SLOW_QUERY_MS", "200")
+            self.statistics = QueryStats(slow_threshold=float(slow_ms) / 1000 if slow_ms else None,
+                                         slow_log_size=int(os.getenv("DB_SLOW_QUERY_LOG_SIZE", "100")))
+            self._connect_params["cursor_factory"] = instrumented_cursor(self.statistics)
+        # Named queries are prepared once per connection unless DB_PREPARED_STATEMENTS is off
+        self.prepared = PreparedStatements(enabled=env_flag("DB_PREPARED_STATEMENTS", default=True))
+        # Reads go to the replicas, except for DB_READ_YOUR_WRITES_MS after a write through this configuration
+        self.replicas: ReplicaSet | None = None
+        self._replica_dsns: list[str] = replicas
+        self.read_your_writes: float = float(os.getenv("DB_READ_YOUR_WRITES_MS", "2000")) / 1000
+        self._last_write: float = float("-inf")
+        # Route set by use_route() for the calls of the current thread
+        self._route = threading.local()
+        if not lazy:
+            self.connect()
+
+    def connect(self) -> bool:
         """
+        Opens the connection or the pool and brings the schema up to date, unless already connected.
+        In lazy mode this runs on first use and is retried on the next use if it fails.
+        :return: True if connected else False
+        """
+        with self._connect_lock:
+            if self.connected:
+                return True
+            try:
+                if self.pooled:
+                    timeout = os.getenv("DB_POOL_TIMEOUT", "30")
+                    self.pool = ConnectionPool(
+                        min_size=int(os.getenv("DB_POOL_MIN", "1")),
+                        max_size=self.max_connections,
+                        timeout=float(timeout) if timeout else None,
+                        check_interval=float(os.getenv("DB_POOL_CHECK_INTERVAL", "30")),
+                        **self._connect_params
+                    )
+                else:
+                    self.conn = psycopg2.connect(**self._connect_params)
+                    self.conn.autocommit = True
+                    self.cur = self.conn.cursor()
+                if self._replica_dsns:
+                    timeout = os.getenv("DB_POOL_TIMEOUT", "30")
+                    self.replicas = ReplicaSet(
+                        self._replica_dsns, self._connect_params,
+                        max_size=self.max_connections,
+                        timeout=float(timeout) if timeout else None,
+                        retry_interval=float(os.getenv("DB_REPLICA_RETRY", "30")),
+                        check_interval=float(os.getenv("DB_POOL_CHECK_INTERVAL", "30"))
+                    )
+                self.connected = True
+                self.migrate()
+                self._connect_error = None
+                logger.info("Database connection established")
+                return True
+            except (Exception, psycopg2.DatabaseError) as error:
+                logger.error("Database connection failed: %s", error)
+                self._connect_error = error
+                if self.pool:
+                    self.pool.close()
+                if self.replicas:
+                    self.replicas.close()
+                self.pool = None
+                self.replicas = None
+                self.conn = None
+                self.cur = None
+                self.connected = False
+                return False
+
+    def _ensure_connected(self) -> None:
+        """
+        Connects on first use in lazy mode.
+        :return: None
+        """
+        if self.lazy and not self.connected:
+            self.connect()
+        if not self.connected:
+            raise StorageError("Not connected to the database") from self._connect_error
+
+    def _use_replica(self, route: str | None) -> bool:
+        """
+        Decides whether a statement runs on a replica.
+        :param route: PRIMARY, REPLICA or None for a read that may use a replica
+        :return: True to use a replica else False
+        """
+        if route is None:
+            route = getattr(self._route, "route", None)
+        elif route not in ROUTES:
+            raise ValueError(f"Unknown route {route!r}, expected one of {', '.join(ROUTES)}")
+        if self.replicas is None or route == PRIMARY:
+            return False
+        # Right after a write the replicas may not have it yet
+        return route == REPLICA or time.monotonic() - self._last_write >= self.read_your_writes
+
+    @contextmanager
+    def use_route(self, route: str | None) -> Iterator[None]:
+        """
+        Sends the reads of the current thread to the primary or the replicas for the with block,
+        e.g. with db.use_route(PRIMARY) for a read that must see the latest writes.
+        Statements given a route explicitly keep it.
+        :param route: PRIMARY, REPLICA or None for the default routing
+        :return: None
+        """
+        if route is not None and route not in ROUTES:
+            raise ValueError(f"Unknown route {route!r}, expected one of {', '.join(ROUTES)}")
+        previous: str | None = getattr(self._route, "route", None)
+        self._route.route = route
         try:
-            self.conn = psycopg2.connect(
-                host=os.getenv("DB_HOST"),
-                user=os.getenv("DB_USER"),
-                password=os.getenv("DB_PASSWORD"),
-                port=os.getenv("DB_PORT"),
-                database=os.getenv("DB_DATABASE")
-            )
-            self.conn.autocommit = True
-            self.cur = self.conn.cursor()
-            self.create_table()
-            print("Database connection established")
-        except (Exception, psycopg2.DatabaseError) as error:
-            print("Database connection failed", error)
-            self.conn = None
-            self.cur = None
+            yield
+        finally:
+            self._route.route = previous
+
+    @contextmanager
+    def cursor(self, route: str | None = PRIMARY) -> Iterator[psycopg2.extensions.cursor]:
+        """
+        Gives a cursor for a single operation.
+        In pooled mode a connection is checked out for the with block and returned afterwards,
+        otherwise the shared cursor is used by one thread at a time.
+        :param route: PRIMARY, REPLICA or None for a read that may use a replica
+        :return: Database cursor
+        """
+        self._ensure_connected()
+        if self.pool is None and not self._use_replica(route):
+            with self._shared_lock:
+                yield self.cur
+            return
+        with self.connection(route) as conn:
+            with conn.cursor() as cur:
+                yield cur
+
+    def _read(self, read: Callable[[psycopg2.extensions.cursor], object], route: str | None = None):
+        """
+        Runs a read with a cursor of the route. When the replica connection fails during the read the
+        replica is marked down and the read is retried once, on the next replica or the primary.
+        :param read: Function running the statements on the cursor and returning the result
+        :param route: PRIMARY, REPLICA or None for a read that may use a replica
+        :return: Result of read
+        """
+        try:
+            with self.cursor(route) as cur:
+                return read(cur)
+        except ReplicaFailure as error:
+            logger.warning("Retrying read: %s", error)
+        with self.cursor(route) as cur:
+            return read(cur)
+
+    @contextmanager
+    def _write_cursor(self) -> Iterator[psycopg2.extensions.cursor]:
+        """
+        Gives a cursor on the primary for a write; reads of the next DB_READ_YOUR_WRITES_MS stay on the primary.
+        :return: Database cursor
+        """
+        try:
+            with self.cursor(PRIMARY) as cur:
+                yield cur
+        finally:
+            self._last_write = time.monotonic()
 
-    def fetch_all_tasks(self, query: str, params=None) -> list:
+    @contextmanager
+    def connection(self, route: str | None = PRIMARY) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Gives a connection for the with block, checked out of the pool in pooled mode, otherwise the
+        shared connection, held by one thread at a time.
+        Reads routed to the replicas fall back to the primary when no replica is available.
+        :param route: PRIMARY, REPLICA or None for a read that may use a replica
+        :return: Database connection
+        """
+        self._ensure_connected()
+        if self._use_replica(route):
+            with self.replicas.connection() as conn:
+                if conn is not None:
+                    yield conn
+                    return
+        if self.pool is None:
+            with self._shared_lock:
+                yield self.conn
+            return
+        with self.pool.connection() as conn:
+            yield conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[psycopg2.extensions.cursor]:
+        """
+        Gives a cursor whose statements run in one transaction on the primary.
+        The transaction is committed when the with block finishes and rolled back on error,
+        database errors are raised as StorageError.
+        :return: Database cursor
+        """
+        try:
+            with self.connection() as conn:
+                conn.autocommit = False
+                try:
+                    with conn:
+                        with conn.cursor() as cur:
+                            yield cur
+                finally:
+                    conn.autocommit = True
+        except psycopg2.Error as error:
+            raise StorageError("Error running transaction") from error
+        finally:
+            self._last_write = time.monotonic()
+
+    def pool_stats(self) -> dict | None:
+        """
+        Usage statistics of the connection pool.
+        :return: Dictionary with in-use/idle connections and wait times or None when not pooled
+        """
+        if self.pool is None:
+            return None
+        return self.pool.stats()
+
+    def replica_stats(self) -> list[dict] | None:
+        """
+        Reads and failures of every replica.
+        :return: One dictionary per replica, see ReplicaSet.stats, or None without replicas
+        """
+        if self.replicas is None:
+            return None
+        return self.replicas.stats()
+
+    def query_stats(self) -> dict[str, dict] | None:
+        """
+        Latency, row and error counters of every statement run so far.
+        :return: Dictionary keyed by statement, see QueryStats.snapshot, or None when disabled
+        """
+        if self.statistics is None:
+            return None
+        return self.statistics.snapshot()
+
+    def slow_queries(self) -> list[dict]:
+        """
+        Statements slower than DB_SLOW_QUERY_MS, with their parameters redacted.
+        :return: Slow query log entries, oldest first
+        """
+        if self.statistics is None:
+            return []
+        return self.statistics.slow_queries()
+
+    def query_metrics(self) -> str:
+        """
+        Statement counters in the Prometheus text format.
+        :return: Metrics text, empty when disabled
+        """
+        if self.statistics is None:
+            return ""
+        return self.statistics.prometheus()
+
+    def prepared_stats(self) -> dict[str, dict]:
+        """
+        Plan cache counters of the named queries.
+        :return: Dictionary keyed by query name, see PreparedStatements.stats
+        """
+        return self.prepared.stats()
+
+    def _execute(self, cur: psycopg2.extensions.cursor, query: str | PreparedQuery, params=None) -> None:
+        """
+        Executes a statement, named queries through their prepared statement.
+        :param cur: Cursor to execute with
+        :param query: SQL query or registered named query
+        :param params: Arguments to pass to the SQL query
+        :return: None
+        """
+        if isinstance(query, PreparedQuery):
+            self.prepared.execute(cur, query, params)
+        else:
+            cur.execute(query, params)
+
+    def fetch_all_tasks(self, query: str | PreparedQuery, params=None, route: str | None = None) -> list:
         """
         Fetches all tasks from the database.
         :param query: SQL query to execute
         :param params: Arguments to pass to the SQL query
+        :param route: PRIMARY or REPLICA to override where the query runs
         :return: List of tasks from the database
         """
-        try:
-            self.cur.execute(query, params)
-            result_list: list[tuple] = self.cur.fetchall()
-            task_list: list[Task] = []
+        def read(cur: psycopg2.extensions.cursor) -> list[tuple]:
+            self._execute(cur, query, params)
+            return cur.fetchall()
 
-            for row in result_list:
-                task: Task = Task(*row)
-                task_list.append(task)
+        try:
+            result_list: list[tuple] = self._read(read, route)
+            return list(Task.from_rows(result_list))
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error executing query all") from error
 
-            return task_list
+    def stream_tasks(self, query: str, params=None, itersize: int | None = None,
+                     route: str | None = None) -> Iterator[Task]:
+        """
+        Lazily fetches tasks through a named server-side cursor.
+        Rows are transferred itersize at a time, so the first tasks are available immediately
+        and memory use does not depend on the size of the result.
+        The connection and a transaction stay open until the iterator is exhausted or closed. Without a
+        pool that is the shared connection, so every other caller waits meanwhile: use it with a pool or
+        a dedicated DatabaseConfig, and close the iterator when stopping early. Task listings read in
+        keyset batches instead, see PostgresTaskStore.iter_tasks.
+        :param query: SQL query to execute
+        :param params: Arguments to pass to the SQL query
+        :param itersize: Rows fetched per round trip, defaults to DB_ITERSIZE
+        :param route: PRIMARY or REPLICA to override where the query runs
+        :return: Iterator of tasks from the database
+        """
+        try:
+            with self.connection(route) as conn:
+                # Named cursors only live inside a transaction
+                conn.autocommit = False
+                try:
+                    with conn:
+                        with conn.cursor(name=f"tasks_stream_{uuid4().hex}") as cur:
+                            cur.itersize = itersize or self.itersize
+                            cur.execute(query, params)
+                            yield from Task.from_rows(cur)
+                finally:
+                    conn.autocommit = True
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error executing query all", error)
-            return []
+            raise StorageError("Error streaming tasks") from error
 
-    def fetch_task(self, query: str, params=None) -> Task | None:
+    def fetch_task(self, query: str | PreparedQuery, params=None, route: str | None = None) -> Task | None:
         """
         Fetches a single task from the database.
         :param query: SQL query to execute
         :param params: Arguments to pass to the SQL query
+        :param route: PRIMARY or REPLICA to override where the query runs
         :return: A single Task object or None if not found
         """
+        def read(cur: psycopg2.extensions.cursor) -> tuple | None:
+            self._execute(cur, query, params)
+            return cur.fetchone()
+
         try:
-            self.cur.execute(query, params)
-            row: tuple = self.cur.fetchone()
+            row: tuple | None = self._read(read, route)
             if row:
-                return Task(*row)
+                return Task.from_row(row)
             return None
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error executing query single", error)
-            return None
+            raise StorageError("Error executing query single") from error
 
-    def create_table(self) -> bool:
+    def migrate(self) -> bool:
         """
-        Creates the table if it doesn't already exist.
-        :return: None
+        Brings the schema up to date by applying pending migrations.
+        :return: True if the schema is up to date else False
         """
+        target: tuple = tuple(self._connect_params.get(key) for key in ("host", "port", "database"))
+        if target in _current_schemas:
+            return True
         try:
-            query_stmt: str = ("CREATE TABLE IF NOT EXISTS tasks "
-                               "(task_id INT PRIMARY KEY, "
-                               "title VARCHAR(255), "
-                               "created_at TIMESTAMP, "
-                               "due_date TIMESTAMP, "
-                               "is_complete BOOLEAN, "
-                               "note TEXT);")
-            self.cur.execute(query_stmt)
-            print("Table created successfully")
+            with self.connection() as conn:
+                applied: list[Migration] = migrate_schema(conn)
+            _current_schemas.add(target)
+            for migration in applied:
+                logger.info("Applied migration %s: %s", migration.version, migration.description)
             return True
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error creating table", error)
+            logger.warning("Error migrating database schema: %s", error)
             return False
 
-    def insert_task(self, query, params=None) -> bool:
+    def enable_task_counters(self) -> bool:
         """
-        Inserts a single task from the database.
-        :param query: SQL query to execute
-        :param params: Arguments to pass to the SQL query
-        :return: True if the task was successfully inserted else False
+        Makes writes maintain the task_counters summary table.
+        :return: True if the counters are maintained else False
         """
         try:
-            self.cur.execute(query, params)
+            with self.connection() as conn:
+                if install_task_counters(conn):
+                    logger.info("Task counters enabled")
             return True
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error inserting task", error)
+            logger.warning("Error enabling task counters: %s", error)
             return False
 
-    def delete_task(self, query: str, params=None) -> bool:
+    def disable_task_counters(self) -> bool:
         """
-        Deletes a single task from the database.
-        :param query: SQL query to execute
-        :param params: Arguments to pass to the SQL query
-        :return: True if the task was successfully deleted else False
+        Stops writes from maintaining the task_counters summary table.
+        :return: True if the counters were disabled else False
         """
         try:
-            self.cur.execute(query, params)
+            with self.connection() as conn:
+                remove_task_counters(conn)
             return True
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error deleting task", error)
+            logger.warning("Error disabling task counters: %s", error)
             return False
 
-    def update_task(self, query: str, params=None) -> bool:
+    def archive_completed(self, before: datetime, batch_size: int = 1000, pause: float = 0.0,
+                          max_batches: int | None = None) -> int:
         """
-        Updates a single task from the database.
+        Moves tasks completed before a time to the task_archive table in batches of short transactions.
+        The connection is taken for each batch and given back during the pauses, so other callers of the
+        shared connection run between batches.
+        A failure raises StorageError; the batches committed before it stay archived.
+        :param before: Tasks completed before this time are archived
+        :param batch_size: Maximum number of tasks moved per transaction
+        :param pause: Seconds to wait between batches
+        :param max_batches: Stop after this many batches, None to archive every eligible task
+        :return: Number of tasks archived
+        """
+        try:
+            return archive_completed(self.connection, before, batch_size, pause, max_batches)
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error archiving completed tasks") from error
+        finally:
+            self._last_write = time.monotonic()
+
+    def drop_archive_partitions(self, before: date) -> list[str]:
+        """
+        Drops the archived tasks of every completion month before a month. A failure raises StorageError.
+        :param before: Months before the month of this day are dropped
+        :return: Names of the dropped partitions
+        """
+        try:
+            with self.connection() as conn:
+                return drop_partitions(conn, before)
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error dropping archive partitions") from error
+
+    def notify(self, channel: str, payload: str) -> bool:
+        """
+        Sends a notification to every connection listening on a channel. A failure raises StorageError.
+        :param channel: Notification channel
+        :param payload: Message text
+        :return: True, the notification was sent
+        """
+        try:
+            with self.cursor() as cur:
+                cur.execute("SELECT pg_notify(%s, %s)", (channel, payload))
+            return True
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error sending notification") from error
+
+    def listen(self, channel: str, callback: Callable[[str], None]) -> NotificationListener:
+        """
+        Starts a background listener on a dedicated connection. Failing to connect raises StorageError.
+        :param channel: Notification channel
+        :param callback: Called with the payload of every notification
+        :return: Running listener
+        """
+        try:
+            return NotificationListener(channel, callback, **get_connection_params())
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error listening for notifications") from error
+
+    def change_feed(self, after: int | None = None) -> ChangeFeed:
+        """
+        Opens a feed of task changes on a dedicated connection, making sure the change log exists first.
+        Failing to connect raises StorageError.
+        :param after: Sequence number of the last change already handled, 0 for the whole log,
+                      None for changes committed from now on
+        :return: Change feed
+        """
+        self._ensure_connected()
+        try:
+            return ChangeFeed(after, **get_connection_params())
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error opening change feed") from error
+
+    def fetch_row(self, query: str | PreparedQuery, params=None, route: str | None = None) -> tuple | None:
+        """
+        Fetches a single raw row from the database.
         :param query: SQL query to execute
         :param params: Arguments to pass to the SQL query
-        :return: True if the task was successfully updated else False
+        :param route: PRIMARY or REPLICA to override where the query runs
+        :return: First row of the result or None if there is no row
         """
+        def read(cur: psycopg2.extensions.cursor) -> tuple | None:
+            self._execute(cur, query, params)
+            return cur.fetchone()
+
         try:
-            self.cur.execute(query, params)
-            return True
+            return self._read(read, route)
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error updating task", error)
-            return False
+            raise StorageError("Error fetching row") from error
+
+    def _execute_returning(self, cur: psycopg2.extensions.cursor, query: str | PreparedQuery,
+                           params=None) -> tuple | None:
+        """
+        Runs a write statement and reads the row produced by its RETURNING clause.
+        :param cur: Cursor to execute with
+        :param query: SQL query to execute
+        :param params: Arguments to pass to the SQL query
+        :return: Returned row or None if no row was affected
+        """
+        self._execute(cur, query, params)
+        if cur.description is None:
+            return None
+        return cur.fetchone()
+
+    def insert_task(self, query: str | PreparedQuery, params=None) -> tuple | None:
+        """
+        Inserts a single task from the database.
+        :param query: SQL query to execute, ending with a RETURNING clause
+        :param params: Arguments to pass to the SQL query
+        :return: Returned row if the task was inserted else None
+        """
+        try:
+            with self._write_cursor() as cur:
+                return self._execute_returning(cur, query, params)
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error inserting task") from error
+
+    def delete_task(self, query: str | PreparedQuery, params=None) -> tuple | None:
+        """
+        Deletes a single task from the database.
+        :param query: SQL query to execute, ending with a RETURNING clause
+        :param params: Arguments to pass to the SQL query
+        :return: Returned row if the task was deleted else None
+        """
+        try:
+            with self._write_cursor() as cur:
+                return self._execute_returning(cur, query, params)
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error deleting task") from error
+
+    def update_task(self, query: str | PreparedQuery, params=None) -> tuple | None:
+        """
+        Updates a single task from the database.
+        :param query: SQL query to execute, ending with a RETURNING clause
+        :param params: Arguments to pass to the SQL query
+        :return: Returned row if the task was updated else None
+        """
+        try:
+            with self._write_cursor() as cur:
+                return self._execute_returning(cur, query, params)
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error updating task") from error
 
-    def fetch_value(self, query: str, params=None) -> int | None:
+    def fetch_value(self, query: str | PreparedQuery, params=None, route: str | None = None) -> int | None:
         """
         Fetches a single value from the database.
         :param query: SQL query to execute
         :param params: Arguments to pass to the SQL query
-        :return: Integer value or None if not found
+        :param route: PRIMARY or REPLICA to override where the query runs
+        :return: First column of the first row or None if there is no row
         """
+        def read(cur: psycopg2.extensions.cursor) -> tuple | None:
+            self._execute(cur, query, params)
+            return cur.fetchone()
+
         try:
-            self.cur.execute(query, params)
-            row = self.cur.fetchone()
+            row: tuple | None = self._read(read, route)
             if row:
                 return row[0]
             return None
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error fetching value in db", error)
+            raise StorageError("Error fetching value") from error
 
-    def execute_query(self, query: str, params=None) -> bool:
+    def execute_query(self, query: str | PreparedQuery, params=None) -> int:
         """
-        Executes a SQL query.
+        Executes a SQL statement.
         :param query: SQL query to execute
         :param params: Arguments to pass to the SQL query
-        :return: True if the task was successfully executed else False
+        :return: Number of rows affected, -1 when the statement does not report one
         """
         try:
-            result = self.cur.execute(query, params)
-            if result:
-                return True
-            return False
+            with self._write_cursor() as cur:
+                self._execute(cur, query, params)
+                return cur.rowcount
         except (Exception, psycopg2.DatabaseError) as error:
-            print("Error executing query", error)
-            return False
+            raise StorageError("Error executing query") from error
+
+    def copy_tasks_in(self, rows: Iterable[tuple], batch_size: int = 5000, on_conflict: str = "skip",
+                      progress: Callable[[int, int], None] | None = None) -> tuple[int, int]:
+        """
+        Bulk loads task rows with COPY FROM STDIN into a staging table and merges them into tasks.
+        Rows are buffered one batch at a time, so memory use does not grow with the input size.
+        :param rows: Rows in the order task_id, title, created_at, due_date, is_complete, note
+        :param batch_size: Number of rows copied and merged per transaction
+        :param on_conflict: "skip" keeps existing tasks, "update" overwrites them with the imported row
+        :param progress: Called after every batch with the rows read and rows merged so far
+        :return: Tuple of rows read and rows inserted or updated
+        """
+        if on_conflict == "skip":
+            conflict_stmt: str = "ON CONFLICT (task_id) DO NOTHING"
+        elif on_conflict == "update":
+            conflict_stmt = ("ON CONFLICT (task_id) DO UPDATE SET title = EXCLUDED.title, "
+                             "created_at = EXCLUDED.created_at, due_date = EXCLUDED.due_date, "
+                             "is_complete = EXCLUDED.is_complete, note = EXCLUDED.note")
+        else:
+            raise ValueError(f"Unknown conflict mode {on_conflict!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        staging_stmt: str = ("CREATE TEMP TABLE IF NOT EXISTS tasks_staging "
+                             "(seq BIGSERIAL, task_id INT, title VARCHAR(255), created_at TIMESTAMP, "
+                             "due_date TIMESTAMP, is_complete BOOLEAN, note TEXT) ON COMMIT DELETE ROWS")
+        copy_stmt: str = ("COPY tasks_staging (task_id, title, created_at, due_date, is_complete, note) "
+                          "FROM STDIN WITH (FORMAT csv)")
+        # DISTINCT ON keeps the last occurrence of a task_id within a batch
+        merge_stmt: str = ("INSERT INTO tasks (task_id, title, created_at, due_date, is_complete, note) "
+                           "SELECT DISTINCT ON (task_id) task_id, title, created_at, due_date, is_complete, note "
+                           "FROM tasks_staging ORDER BY task_id, seq DESC " + conflict_stmt)
+
+        total_read: int = 0
+        total_merged: int = 0
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        batch_rows: int = 0
+
+        def flush() -> None:
+            nonlocal total_read, total_merged, batch_rows
+            buffer.seek(0)
+            with self.transaction() as cur:
+                cur.execute(staging_stmt)
+                cur.copy_expert(copy_stmt, buffer)
+                cur.execute(merge_stmt)
+                merged: int = cur.rowcount
+            total_read += batch_rows
+            total_merged += merged
+            batch_rows = 0
+            buffer.seek(0)
+            buffer.truncate()
+            if progress:
+                progress(total_read, total_merged)
+
+        for row in rows:
+            writer.writerow(row)
+            batch_rows += 1
+            if batch_rows >= batch_size:
+                flush()
+        if batch_rows:
+            flush()
+        return total_read, total_merged
+
+    def copy_tasks_out(self, stream: TextIO, fmt: str = "csv", route: str | None = None) -> int:
+        """
+        Streams every task to a file-like object with COPY TO STDOUT.
+        :param stream: Text stream to write to
+        :param fmt: "csv" for CSV with a header row or "jsonl" for one JSON object per line
+        :param route: PRIMARY or REPLICA to override where the export runs
+        :return: Number of rows written
+        """
+        select_stmt: str = ("SELECT task_id, title, created_at, due_date, is_complete, note "
+                            "FROM tasks ORDER BY task_id")
+        if fmt == "csv":
+            copy_stmt: str = f"COPY ({select_stmt}) TO STDOUT WITH (FORMAT csv, HEADER)"
+        elif fmt == "jsonl":
+            # Quote and delimiter characters never appear in JSON text, so lines are written unescaped
+            copy_stmt = (f"COPY (SELECT row_to_json(t) FROM ({select_stmt}) t) TO STDOUT "
+                         f"WITH (FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')")
+        else:
+            raise ValueError(f"Unknown export format {fmt!r}")
+        try:
+            with self.cursor(route) as cur:
+                cur.copy_expert(copy_stmt, stream)
+                return cur.rowcount
+        except psycopg2.Error as error:
+            raise StorageError("Error exporting tasks") from error
 
     def close(self) -> None:
         """
         Closes the database connection
         :return: None
         """
+        # A closed configuration never reconnects
+        self.lazy = False
+        if self.pool:
+            self.pool.close()
+            logger.info("Database connection pool closed")
+        if self.replicas:
+            self.replicas.close()
+            logger.info("Replica connections closed")
         if self.conn:
             self.conn.close()
-            print("Database connection closed")
+            logger.info("Database connection closed")
         if self.cur:
             self.cur.close()
-            print("Database cursor closed")
+            logger.info("Database cursor closed")
@@ -0,0 +1,16 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/errors.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Exceptions raised by the storage backends
+############################################################
+
+
+class StorageError(Exception):
+    """
+    A storage operation failed, for example because the database is unreachable or rejected a statement.
+    The driver error is kept as __cause__. Outcomes that are not failures, such as a missing task,
+    are results and never raise.
+    """
@@ -0,0 +1,297 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/memory_store.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Task storage in process memory with sorted indexes, for tests and throwaway sessions
+############################################################
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+import copy
+import threading
+
+from todo.pagination import ORDER_COLUMNS, TaskPage, build_page, decode_cursor
+from todo.task import Task
+from todo.task_stats import TaskStats
+from .task_store import TaskStore, WriteOp, search_terms
+
+
+def sort_key(task: Task, order_by: str) -> tuple:
+    """
+    Position of a task in an index, tasks without a value sort last ordered by task id.
+    :param task: Task to index
+    :param order_by: Indexed column
+    :return: Sort key
+    """
+    value = getattr(task, order_by)
+    return value is None, value, task.task_id
+
+
+def task_words(task: Task) -> set[str]:
+    """
+    Words of the title and note of a task, as split by search_terms.
+    :param task: Task to split
+    :return: Lowercase words
+    """
+    return set(search_terms(task.title or "")) | set(search_terms(task.note or ""))
+
+
+def match_score(task: Task, terms: list[str]) -> float:
+    """
+    Ranks a search match, a word matched in the title counts more than one matched in the note.
+    :param task: Matching task
+    :param terms: Search words
+    :return: Score, higher is better
+    """
+    title_words: list[str] = search_terms(task.title or "")
+    note_words: list[str] = search_terms(task.note or "")
+    score: float = 0.0
+    for term in terms:
+        if any(word.startswith(term) for word in title_words):
+            score += 1.0
+        if any(word.startswith(term) for word in note_words):
+            score += 0.4
+    return score
+
+
+class MemoryTaskStore(TaskStore):
+    def __init__(self, itersize: int = 2000) -> None:
+        """
+        Creates an empty store.
+        Tasks live in a dictionary keyed by task id, with one sorted index per order column and one
+        of incomplete tasks by due date, the in-memory version of the Postgres indexes.
+        :param itersize: Tasks copied per batch when streaming tasks
+        """
+        self.itersize = itersize
+        self._lock = threading.RLock()
+        self._tasks: dict[int, Task] = {}
+        self._indexes: dict[str, list] = {column: [] for column in ORDER_COLUMNS}
+        self._incomplete_due: list[tuple[datetime, int]] = []
+        self._completed: int = 0
+        self._incomplete: int = 0
+        # Inverted index of title and note words, the sorted vocabulary finds every word with a prefix
+        self._postings: dict[str, set[int]] = {}
+        self._words: list[str] = []
+
+    def _add(self, task: Task) -> None:
+        """
+        Stores a copy of a task and adds it to the indexes, the caller holds the lock.
+        :param task: Task to store
+        :return: None
+        """
+        task = copy.copy(task)
+        self._tasks[task.task_id] = task
+        for column, index in self._indexes.items():
+            insort(index, sort_key(task, column) if column != "task_id" else task.task_id)
+        if task.is_complete:
+            self._completed += 1
+        elif task.is_complete is not None:
+            self._incomplete += 1
+            if task.due_date is not None:
+                insort(self._incomplete_due, (task.due_date, task.task_id))
+        for word in task_words(task):
+            if word not in self._postings:
+                self._postings[word] = set()
+                insort(self._words, word)
+            self._postings[word].add(task.task_id)
+
+    def _remove(self, task_id: int) -> Task | None:
+        """
+        Removes a task and its index entries, the caller holds the lock.
+        :param task_id: Task id to remove
+        :return: Removed task or None if it did not exist
+        """
+        task: Task | None = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+        for column, index in self._indexes.items():
+            del index[bisect_left(index, sort_key(task, column) if column != "task_id" else task_id)]
+        if task.is_complete:
+            self._completed -= 1
+        elif task.is_complete is not None:
+            self._incomplete -= 1
+            if task.due_date is not None:
+                del self._incomplete_due[bisect_left(self._incomplete_due, (task.due_date, task_id))]
+        for word in task_words(task):
+            self._postings[word].discard(task_id)
+            if not self._postings[word]:
+                del self._postings[word]
+                del self._words[bisect_left(self._words, word)]
+        return task
+
+    def insert(self, task: Task) -> bool:
+        with self._lock:
+            if task.task_id in self._tasks:
+                return False
+            self._add(task)
+            return True
+
+    def get(self, task_id: int) -> Task | None:
+        with self._lock:
+            task: Task | None = self._tasks.get(task_id)
+            return copy.copy(task) if task is not None else None
+
+    def exists(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    def update(self, task: Task) -> bool:
+        with self._lock:
+            if self._remove(task.task_id) is None:
+                return False
+            self._add(task)
+            return True
+
+    def delete(self, task_id: int) -> Task | None:
+        with self._lock:
+            return self._remove(task_id)
+
+    def complete(self, task_id: int) -> tuple[str, bool] | None:
+        with self._lock:
+            task: Task | None = self._tasks.get(task_id)
+            if task is None:
+                return None
+            if task.is_complete:
+                return task.title, True
+            completed = copy.copy(task)
+            completed.is_complete = True
+            self._remove(task_id)
+            self._add(completed)
+            return task.title, False
+
+    def stats(self, now: datetime) -> TaskStats:
+        with self._lock:
+            # (now,) sorts before every (now, task_id), so this counts the tasks due strictly before now
+            overdue: int = bisect_left(self._incomplete_due, (now,))
+            return TaskStats(len(self._tasks), self._completed, self._incomplete, overdue)
+
+    def count(self, is_complete: bool | None = None) -> int:
+        if is_complete is None:
+            return len(self._tasks)
+        return self._completed if is_complete else self._incomplete
+
+    def iter_tasks(self, is_complete: bool | None = None) -> Iterator[Task]:
+        # Batches are copied by task id so writes made while iterating never break the iteration
+        index: list[int] = self._indexes["task_id"]
+        position: int = 0
+        last_id: int | None = None
+        while True:
+            with self._lock:
+                if last_id is not None:
+                    position = bisect_right(index, last_id)
+                batch: list[Task] = [copy.copy(self._tasks[task_id])
+                                     for task_id in index[position:position + self.itersize]]
+            for task in batch:
+                if is_complete is None or task.is_complete is is_complete:
+                    yield task
+            if len(batch) < self.itersize:
+                return
+            last_id = batch[-1].task_id
+
+    def list_page(self, is_complete: bool | None, due_after: datetime | None, due_before: datetime | None,
+                  order_by: str, page_size: int, cursor: str | None) -> TaskPage:
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"Cannot order tasks by {order_by!r}")
+        last_value, last_id = decode_cursor(cursor, order_by) if cursor else (None, None)
+        # One extra task tells whether another page follows
+        limit: int = page_size + 1
+        tasks: list[Task] = []
+        with self._lock:
+            index: list = self._indexes[order_by]
+            if order_by == "task_id":
+                start: int = bisect_right(index, last_id) if last_id is not None else 0
+            else:
+                start = bisect_right(index, (last_value is None, last_value, last_id)) if last_id is not None else 0
+                if order_by == "due_date" and due_after is not None:
+                    start = max(start, bisect_left(index, (False, due_after)))
+            for position in range(start, len(index)):
+                key = index[position]
+                task: Task = self._tasks[key if order_by == "task_id" else key[2]]
+                if order_by == "due_date" and due_before is not None and (key[0] or key[1] >= due_before):
+                    break
+                if is_complete is not None and task.is_complete is not is_complete:
+                    continue
+                if due_after is not None and (task.due_date is None or task.due_date < due_after):
+                    continue
+                if due_before is not None and (task.due_date is None or task.due_date >= due_before):
+                    continue
+                tasks.append(copy.copy(task))
+                if len(tasks) >= limit:
+                    break
+        return build_page(tasks, page_size, order_by)
+
+    def search(self, query: str, limit: int) -> list[Task]:
+        terms: list[str] = search_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            matches: set[int] | None = None
+            for term in terms:
+                # Words starting with term sit between term and the first string that sorts after them
+                found: set[int] = set()
+                for position in range(bisect_left(self._words, term), len(self._words)):
+                    if not self._words[position].startswith(term):
+                        break
+                    found |= self._postings[self._words[position]]
+                matches = found if matches is None else matches & found
+                if not matches:
+                    return []
+            scored: list[tuple[float, int]] = [(-match_score(self._tasks[task_id], terms), task_id)
+                                               for task_id in matches]
+            scored.sort()
+            return [copy.copy(self._tasks[task_id]) for _, task_id in scored[:limit]]
+
+    def bulk_insert(self, tasks: Iterable[Task], batch_size: int = 5000, on_conflict: str = "skip",
+                    progress: Callable[[int, int], None] | None = None) -> tuple[int, int]:
+        if on_conflict not in ("skip", "update"):
+            raise ValueError(f"Unknown conflict mode {on_conflict!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        total_read: int = 0
+        total_written: int = 0
+        # Keyed by task id so the last occurrence within a batch wins, as with the Postgres import
+        batch: dict[int, Task] = {}
+        batch_rows: int = 0
+
+        def flush() -> None:
+            nonlocal total_read, total_written, batch_rows
+            with self._lock:
+                for task in batch.values():
+                    if task.task_id in self._tasks:
+                        if on_conflict == "skip":
+                            continue
+                        self._remove(task.task_id)
+                    self._add(task)
+                    total_written += 1
+            total_read += batch_rows
+            batch.clear()
+            batch_rows = 0
+            if progress:
+                progress(total_read, total_written)
+
+        for task in tasks:
+            batch[task.task_id] = task
+            batch_rows += 1
+            if batch_rows >= batch_size:
+                flush()
+        if batch_rows:
+            flush()
+        return total_read, total_written
+
+    def apply_writes(self, ops: list[WriteOp]) -> list:
+        # Holding the lock for the whole batch makes it atomic for every other caller
+        with self._lock:
+            return [self.apply_write(op) for op in ops]
+
+    def close(self) -> None:
+        with self._lock:
+            self._tasks.clear()
+            for index in self._indexes.values():
+                index.clear()
+            self._incomplete_due.clear()
+            self._completed = 0
+            self._incomplete = 0
+            self._postings.clear()
+            self._words.clear()
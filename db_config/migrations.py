@@ -0,0 +1,345 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/migrations.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Versioned schema migrations applied on startup
+############################################################
+
+from typing import NamedTuple
+
+import psycopg2.extensions
+
+# Key of the advisory lock that serializes migration runs between processes
+MIGRATION_LOCK_ID: int = 727_001
+
+
+class Migration(NamedTuple):
+    """
+    One schema change. Migrations are applied in version order and each runs in its own transaction.
+    """
+    version: int
+    description: str
+    statements: tuple[str, ...]
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "Create tasks table", (
+        "CREATE TABLE IF NOT EXISTS tasks "
+        "(task_id INT PRIMARY KEY, "
+        "title VARCHAR(255), "
+        "created_at TIMESTAMP, "
+        "due_date TIMESTAMP, "
+        "is_complete BOOLEAN, "
+        "note TEXT)",
+    )),
+    Migration(2, "Partial index on incomplete tasks by due date", (
+        "CREATE INDEX IF NOT EXISTS tasks_incomplete_due_idx ON tasks (due_date, task_id) WHERE NOT is_complete",
+    )),
+    Migration(3, "Index on completion status and due date", (
+        "CREATE INDEX IF NOT EXISTS tasks_status_due_idx ON tasks (is_complete, due_date, task_id)",
+    )),
+    Migration(4, "Task counter summary table", (
+        "CREATE TABLE IF NOT EXISTS task_counters "
+        "(slot INT PRIMARY KEY, "
+        "total BIGINT NOT NULL DEFAULT 0, "
+        "completed BIGINT NOT NULL DEFAULT 0, "
+        "incomplete BIGINT NOT NULL DEFAULT 0)",
+        # Each statement adds its net change to one of a few slots, so concurrent writers rarely share a row
+        "CREATE OR REPLACE FUNCTION task_counters_apply() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        "DECLARE "
+        "d_total BIGINT := 0; d_completed BIGINT := 0; d_incomplete BIGINT := 0; "
+        "BEGIN "
+        "IF TG_OP = 'TRUNCATE' THEN DELETE FROM task_counters; RETURN NULL; END IF; "
+        "IF TG_OP IN ('INSERT', 'UPDATE') THEN "
+        "SELECT COUNT(*), COUNT(*) FILTER (WHERE is_complete), COUNT(*) FILTER (WHERE NOT is_complete) "
+        "INTO d_total, d_completed, d_incomplete FROM new_rows; "
+        "END IF; "
+        "IF TG_OP IN ('DELETE', 'UPDATE') THEN "
+        "SELECT d_total - COUNT(*), d_completed - COUNT(*) FILTER (WHERE is_complete), "
+        "d_incomplete - COUNT(*) FILTER (WHERE NOT is_complete) "
+        "INTO d_total, d_completed, d_incomplete FROM old_rows; "
+        "END IF; "
+        "IF d_total <> 0 OR d_completed <> 0 OR d_incomplete <> 0 THEN "
+        "INSERT INTO task_counters AS c (slot, total, completed, incomplete) "
+        "VALUES (pg_backend_pid() % 16, d_total, d_completed, d_incomplete) "
+        "ON CONFLICT (slot) DO UPDATE SET total = c.total + EXCLUDED.total, "
+        "completed = c.completed + EXCLUDED.completed, incomplete = c.incomplete + EXCLUDED.incomplete; "
+        "END IF; "
+        "RETURN NULL; "
+        "END $$",
+    )),
+    Migration(5, "Full-text search vector on title and note", (
+        # Title words rank above note words
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(note, '')), 'B')) STORED",
+        "CREATE INDEX IF NOT EXISTS tasks_search_idx ON tasks USING GIN (search_vector)",
+    )),
+    Migration(6, "Trigram index on title for fuzzy matches", (
+        # pg_trgm ships with contrib, servers without it, or where the migrating role may not create it,
+        # keep searching with the full-text index only
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN "
+        "BEGIN "
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm; "
+        "EXCEPTION WHEN insufficient_privilege OR duplicate_object THEN "
+        "RAISE NOTICE 'pg_trgm not created, skipping the trigram index: %', SQLERRM; "
+        "END; "
+        "END IF; "
+        "IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN "
+        "CREATE INDEX IF NOT EXISTS tasks_title_trgm_idx ON tasks USING GIN (title gin_trgm_ops); "
+        "END IF; "
+        "END $$",
+    )),
+    Migration(7, "Change tracking and deletion tombstones for sync", (
+        # Existing rows get version 0, so a first sync reads every task
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now()",
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 0",
+        # The version is the id of the writing transaction, so a reader can tell from its snapshot which
+        # transactions may still commit changes with a lower version
+        "ALTER TABLE tasks ALTER COLUMN version SET DEFAULT pg_current_xact_id()::text::bigint",
+        "CREATE INDEX IF NOT EXISTS tasks_version_idx ON tasks (version)",
+        # Updates stamp the row unless the statement sets updated_at itself, as sync does with the time of
+        # the offline change
+        "CREATE OR REPLACE FUNCTION tasks_touch() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        "BEGIN "
+        "NEW.version := pg_current_xact_id()::text::bigint; "
+        "IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN NEW.updated_at := clock_timestamp(); END IF; "
+        "RETURN NEW; "
+        "END $$",
+        "CREATE OR REPLACE TRIGGER tasks_touch BEFORE UPDATE ON tasks FOR EACH ROW EXECUTE FUNCTION tasks_touch()",
+        "CREATE TABLE IF NOT EXISTS task_deletions "
+        "(task_id INT PRIMARY KEY, "
+        "deleted_at TIMESTAMPTZ NOT NULL, "
+        "version BIGINT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS task_deletions_version_idx ON task_deletions (version)",
+        "CREATE OR REPLACE FUNCTION task_deletions_record() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        "BEGIN "
+        "IF TG_OP = 'DELETE' THEN "
+        "INSERT INTO task_deletions (task_id, deleted_at, version) "
+        "SELECT task_id, clock_timestamp(), pg_current_xact_id()::text::bigint FROM old_rows "
+        "ON CONFLICT (task_id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at, version = EXCLUDED.version; "
+        "ELSE "
+        # A task inserted again is no longer deleted
+        "DELETE FROM task_deletions d USING new_rows n WHERE d.task_id = n.task_id; "
+        "END IF; "
+        "RETURN NULL; "
+        "END $$",
+        "CREATE OR REPLACE TRIGGER task_deletions_delete AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION task_deletions_record()",
+        "CREATE OR REPLACE TRIGGER task_deletions_insert AFTER INSERT ON tasks "
+        "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION task_deletions_record()",
+    )),
+    Migration(8, "Append-only change log of task mutations", (
+        "CREATE TABLE IF NOT EXISTS task_changes "
+        "(seq BIGSERIAL PRIMARY KEY, "
+        "task_id INT, "
+        "op TEXT NOT NULL, "
+        "is_complete BOOLEAN, "
+        "changed_at TIMESTAMPTZ NOT NULL DEFAULT clock_timestamp())",
+        # One log row per changed task and one notification per transaction, the payload is empty so
+        # Postgres folds the notifications of a transaction into one
+        "CREATE OR REPLACE FUNCTION task_changes_record() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        "DECLARE "
+        "changed BIGINT; "
+        "BEGIN "
+        "IF TG_OP = 'INSERT' THEN "
+        "INSERT INTO task_changes (task_id, op, is_complete) "
+        "SELECT task_id, 'insert', is_complete FROM new_rows ORDER BY task_id; "
+        "ELSIF TG_OP = 'UPDATE' THEN "
+        "INSERT INTO task_changes (task_id, op, is_complete) "
+        "SELECT n.task_id, CASE WHEN n.is_complete AND NOT coalesce(o.is_complete, false) "
+        "THEN 'complete' ELSE 'update' END, n.is_complete "
+        "FROM new_rows n LEFT JOIN old_rows o ON o.task_id = n.task_id ORDER BY n.task_id; "
+        "ELSIF TG_OP = 'DELETE' THEN "
+        "INSERT INTO task_changes (task_id, op) SELECT task_id, 'delete' FROM old_rows ORDER BY task_id; "
+        "ELSE "
+        "INSERT INTO task_changes (task_id, op) VALUES (NULL, 'truncate'); "
+        "END IF; "
+        "GET DIAGNOSTICS changed = ROW_COUNT; "
+        "IF changed > 0 THEN PERFORM pg_notify('todo_task_changes', ''); END IF; "
+        "RETURN NULL; "
+        "END $$",
+        "CREATE OR REPLACE TRIGGER task_changes_insert AFTER INSERT ON tasks "
+        "REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION task_changes_record()",
+        "CREATE OR REPLACE TRIGGER task_changes_update AFTER UPDATE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT "
+        "EXECUTE FUNCTION task_changes_record()",
+        "CREATE OR REPLACE TRIGGER task_changes_delete AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT EXECUTE FUNCTION task_changes_record()",
+        "CREATE OR REPLACE TRIGGER task_changes_truncate AFTER TRUNCATE ON tasks "
+        "FOR EACH STATEMENT EXECUTE FUNCTION task_changes_record()",
+    )),
+    Migration(9, "Completion time and monthly archive of completed tasks", (
+        # Tasks completed before this migration have no completion time, archival uses updated_at for them
+        "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS completed_at TIMESTAMPTZ",
+        "CREATE OR REPLACE FUNCTION tasks_completed_at() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        "BEGIN "
+        "NEW.completed_at := CASE WHEN NEW.is_complete THEN coalesce(NEW.completed_at, clock_timestamp()) END; "
+        "RETURN NEW; "
+        "END $$",
+        "CREATE OR REPLACE TRIGGER tasks_completed_insert BEFORE INSERT ON tasks FOR EACH ROW "
+        "WHEN (NEW.is_complete) EXECUTE FUNCTION tasks_completed_at()",
+        "CREATE OR REPLACE TRIGGER tasks_completed_update BEFORE UPDATE OF is_complete ON tasks FOR EACH ROW "
+        "WHEN (NEW.is_complete IS DISTINCT FROM OLD.is_complete) EXECUTE FUNCTION tasks_completed_at()",
+        "CREATE INDEX IF NOT EXISTS tasks_completed_idx ON tasks (COALESCE(completed_at, updated_at)) "
+        "WHERE is_complete",
+        # One partition per completion month (UTC) is created on demand, so old months are dropped whole
+        "CREATE TABLE IF NOT EXISTS task_archive "
+        "(task_id INT NOT NULL, "
+        "title VARCHAR(255), "
+        "created_at TIMESTAMP, "
+        "due_date TIMESTAMP, "
+        "note TEXT, "
+        "completed_at TIMESTAMPTZ NOT NULL, "
+        "archived_at TIMESTAMPTZ NOT NULL DEFAULT now(), "
+        "PRIMARY KEY (task_id, completed_at)) "
+        "PARTITION BY RANGE (completed_at)",
+        # Deletions made by the archiver are logged as archive events
+        "CREATE OR REPLACE FUNCTION task_changes_record() RETURNS trigger LANGUAGE plpgsql AS $$ "
+        "DECLARE "
+        "changed BIGINT; "
+        "BEGIN "
+        "IF TG_OP = 'INSERT' THEN "
+        "INSERT INTO task_changes (task_id, op, is_complete) "
+        "SELECT task_id, 'insert', is_complete FROM new_rows ORDER BY task_id; "
+        "ELSIF TG_OP = 'UPDATE' THEN "
+        "INSERT INTO task_changes (task_id, op, is_complete) "
+        "SELECT n.task_id, CASE WHEN n.is_complete AND NOT coalesce(o.is_complete, false) "
+        "THEN 'complete' ELSE 'update' END, n.is_complete "
+        "FROM new_rows n LEFT JOIN old_rows o ON o.task_id = n.task_id ORDER BY n.task_id; "
+        "ELSIF TG_OP = 'DELETE' THEN "
+        "INSERT INTO task_changes (task_id, op) "
+        "SELECT task_id, CASE WHEN current_setting('todo.archiving', true) = 'on' THEN 'archive' "
+        "ELSE 'delete' END FROM old_rows ORDER BY task_id; "
+        "ELSE "
+        "INSERT INTO task_changes (task_id, op) VALUES (NULL, 'truncate'); "
+        "END IF; "
+        "GET DIAGNOSTICS changed = ROW_COUNT; "
+        "IF changed > 0 THEN PERFORM pg_notify('todo_task_changes', ''); END IF; "
+        "RETURN NULL; "
+        "END $$",
+    )),
+)
+
+LATEST_VERSION: int = MIGRATIONS[-1].version
+
+
+def schema_is_current(conn: psycopg2.extensions.connection) -> bool:
+    """
+    Checks the schema version without taking the migration lock or running any DDL.
+    :param conn: Autocommit database connection
+    :return: True if every migration is already applied, False if apply_migrations has work to do
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not cur.fetchone()[0]:
+            return False
+        cur.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+        return cur.fetchone()[0] >= LATEST_VERSION
+
+
+def apply_migrations(conn: psycopg2.extensions.connection) -> list[Migration]:
+    """
+    Applies every migration not yet recorded in schema_migrations.
+    Safe to run on every startup and from several processes at once.
+    :param conn: Autocommit database connection
+    :return: Migrations applied by this call
+    """
+    applied: list[Migration] = []
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+        try:
+            cur.execute("CREATE TABLE IF NOT EXISTS schema_migrations "
+                        "(version INT PRIMARY KEY, "
+                        "description TEXT NOT NULL, "
+                        "applied_at TIMESTAMP NOT NULL DEFAULT now())")
+            cur.execute("SELECT version FROM schema_migrations")
+            done: set[int] = {row[0] for row in cur.fetchall()}
+            for migration in MIGRATIONS:
+                if migration.version in done:
+                    continue
+                conn.autocommit = False
+                try:
+                    with conn:
+                        for statement in migration.statements:
+                            cur.execute(statement)
+                        cur.execute("INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                                    (migration.version, migration.description))
+                finally:
+                    conn.autocommit = True
+                applied.append(migration)
+        finally:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+    return applied
+
+
+
+def migrate_schema(conn: psycopg2.extensions.connection) -> list[Migration]:
+    """
+    Brings the schema up to date. The version check is one query, the locked migration run only
+    happens when it fails.
+    :param conn: Autocommit database connection
+    :return: Migrations applied by this call
+    """
+    if schema_is_current(conn):
+        return []
+    return apply_migrations(conn)
+
+# Statement-level triggers keeping task_counters in sync, installed only when cached stats are enabled
+TASK_COUNTER_TRIGGERS: tuple[str, ...] = (
+    "CREATE TRIGGER task_counters_insert AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+    "CREATE TRIGGER task_counters_update AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows "
+    "NEW TABLE AS new_rows FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+    "CREATE TRIGGER task_counters_delete AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows "
+    "FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+    "CREATE TRIGGER task_counters_truncate AFTER TRUNCATE ON tasks "
+    "FOR EACH STATEMENT EXECUTE FUNCTION task_counters_apply()",
+)
+COUNTER_TRIGGER_EXISTS: str = ("SELECT EXISTS (SELECT 1 FROM pg_trigger "
+                               "WHERE tgrelid = 'tasks'::regclass AND tgname = 'task_counters_insert')")
+
+
+def install_task_counters(conn: psycopg2.extensions.connection) -> bool:
+    """
+    Installs the task_counters triggers and seeds the counters from the current table contents.
+    Does nothing when the triggers already exist.
+    :param conn: Autocommit database connection
+    :return: True if the triggers were installed by this call else False
+    """
+    with conn.cursor() as cur:
+        cur.execute(COUNTER_TRIGGER_EXISTS)
+        if cur.fetchone()[0]:
+            return False
+        conn.autocommit = False
+        try:
+            with conn:
+                # Writers are blocked until the counters are seeded, so no change is missed or counted twice
+                cur.execute("LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE")
+                cur.execute(COUNTER_TRIGGER_EXISTS)
+                if cur.fetchone()[0]:
+                    return False
+                for statement in TASK_COUNTER_TRIGGERS:
+                    cur.execute(statement)
+                cur.execute("DELETE FROM task_counters")
+                cur.execute("INSERT INTO task_counters (slot, total, completed, incomplete) "
+                            "SELECT 0, COUNT(*), COUNT(*) FILTER (WHERE is_complete), "
+                            "COUNT(*) FILTER (WHERE NOT is_complete) FROM tasks")
+        finally:
+            conn.autocommit = True
+    return True
+
+
+def remove_task_counters(conn: psycopg2.extensions.connection) -> None:
+    """
+    Drops the task_counters triggers so writes no longer maintain the counters.
+    :param conn: Autocommit database connection
+    :return: None
+    """
+    with conn.cursor() as cur:
+        for name in ("task_counters_insert", "task_counters_update", "task_counters_delete",
+                     "task_counters_truncate"):
+            cur.execute(f"DROP TRIGGER IF EXISTS {name} ON tasks")
@@ -0,0 +1,109 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/notification_listener.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Background thread receiving Postgres LISTEN/NOTIFY messages
+############################################################
+
+from typing import Callable
+import logging
+import select
+import threading
+
+import psycopg2
+import psycopg2.extensions
+from psycopg2 import sql
+
+# Payload passed to the callback after a reconnect, messages sent while disconnected are lost
+RECONNECTED: str = "*"
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    def __init__(self, channel: str, callback: Callable[[str], None], poll_interval: float = 1.0,
+                 **connect_params) -> None:
+        """
+        Opens a dedicated connection listening on a channel and starts the receiving thread.
+        :param channel: Notification channel to listen on
+        :param callback: Called from the listener thread with the payload of every notification
+        :param poll_interval: Seconds between checks of the stop flag while no message arrives
+        :param connect_params: Keyword arguments passed to psycopg2.connect
+        """
+        self.channel = channel
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self._connect_params = connect_params
+        self._stop = threading.Event()
+        self._conn: psycopg2.extensions.connection = self._connect()
+        self._thread = threading.Thread(target=self._run, name=f"listen-{channel}", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        """
+        Opens the connection and subscribes to the channel.
+        :return: Listening connection
+        """
+        conn = psycopg2.connect(**self._connect_params)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+        return conn
+
+    def _run(self) -> None:
+        """
+        Waits for notifications until stopped, reconnecting after connection failures.
+        :return: None
+        """
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([self._conn], [], [], self.poll_interval)
+                if not ready:
+                    continue
+                self._conn.poll()
+                while self._conn.notifies:
+                    self._dispatch(self._conn.notifies.pop(0).payload)
+            except (OSError, ValueError, psycopg2.Error) as error:
+                if self._stop.is_set():
+                    return
+                logger.warning("Notification listener lost its connection: %s", error)
+                self._reconnect()
+
+    def _reconnect(self) -> None:
+        """
+        Reopens the listening connection, retrying until it succeeds or the listener is stopped.
+        :return: None
+        """
+        try:
+            self._conn.close()
+        except psycopg2.Error:
+            pass
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self._conn = self._connect()
+            except psycopg2.Error:
+                continue
+            self._dispatch(RECONNECTED)
+            return
+
+    def _dispatch(self, payload: str) -> None:
+        """
+        Passes a payload to the callback, errors are reported without stopping the listener.
+        :param payload: Notification payload
+        :return: None
+        """
+        try:
+            self.callback(payload)
+        except Exception:
+            logger.exception("Error handling notification")
+
+    def stop(self) -> None:
+        """
+        Stops the listener thread and closes its connection.
+        :return: None
+        """
+        self._stop.set()
+        self._thread.join()
+        self._conn.close()
@@ -0,0 +1,414 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/offline_store.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Local SQLite replica of the tasks with a change journal, synced with Postgres in the background
+############################################################
+
+from datetime import datetime, timezone
+from typing import Iterable
+import logging
+import os
+import threading
+
+import psycopg2
+import psycopg2.extensions
+
+from todo.task import Task
+from .database_config import get_connection_params, load_env
+from .migrations import migrate_schema
+from .sqlite_store import TASK_COLUMNS, SQLiteTaskStore, task_from_sqlite, to_sqlite
+
+# Every local write is journaled by the triggers, except the changes sync applies while applying is 1
+JOURNAL_SCHEMA: tuple[str, ...] = (
+    "CREATE TABLE IF NOT EXISTS task_journal ("
+    "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "task_id INTEGER NOT NULL, "
+    "changed_at TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS task_journal_task_idx ON task_journal (task_id)",
+    "CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value)",
+    "INSERT OR IGNORE INTO sync_state (key, value) VALUES ('applying', 0), ('pull_cursor', 0)",
+    "CREATE TRIGGER IF NOT EXISTS task_journal_insert AFTER INSERT ON tasks "
+    "WHEN (SELECT value FROM sync_state WHERE key = 'applying') = 0 BEGIN "
+    "INSERT INTO task_journal (task_id, changed_at) VALUES (new.task_id, strftime('%Y-%m-%d %H:%M:%f', 'now')); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS task_journal_update AFTER UPDATE ON tasks "
+    "WHEN (SELECT value FROM sync_state WHERE key = 'applying') = 0 BEGIN "
+    "INSERT INTO task_journal (task_id, changed_at) VALUES (new.task_id, strftime('%Y-%m-%d %H:%M:%f', 'now')); "
+    "END",
+    "CREATE TRIGGER IF NOT EXISTS task_journal_delete AFTER DELETE ON tasks "
+    "WHEN (SELECT value FROM sync_state WHERE key = 'applying') = 0 BEGIN "
+    "INSERT INTO task_journal (task_id, changed_at) VALUES (old.task_id, strftime('%Y-%m-%d %H:%M:%f', 'now')); "
+    "END",
+)
+
+TASK_SYNC_ARRAYS: str = ("unnest(%s::int[], %s::varchar[], %s::timestamp[], %s::timestamp[], %s::boolean[], "
+                         "%s::text[], %s::timestamptz[])")
+
+# Local changes win over the server row only when they are newer, and a task deleted on the server
+# after the local change stays deleted
+PUSH_UPSERT_STMT: str = (f"INSERT INTO tasks ({TASK_COLUMNS}, updated_at) "
+                         f"SELECT v.* FROM {TASK_SYNC_ARRAYS} AS v ({TASK_COLUMNS}, updated_at) "
+                         "WHERE NOT EXISTS (SELECT 1 FROM task_deletions d "
+                         "WHERE d.task_id = v.task_id AND d.deleted_at >= v.updated_at) "
+                         "ON CONFLICT (task_id) DO UPDATE SET title = EXCLUDED.title, "
+                         "created_at = EXCLUDED.created_at, due_date = EXCLUDED.due_date, "
+                         "is_complete = EXCLUDED.is_complete, note = EXCLUDED.note, updated_at = EXCLUDED.updated_at "
+                         "WHERE tasks.updated_at < EXCLUDED.updated_at")
+PUSH_DELETE_STMT: str = ("DELETE FROM tasks t USING unnest(%s::int[], %s::timestamptz[]) AS v (task_id, deleted_at) "
+                         "WHERE t.task_id = v.task_id AND t.updated_at <= v.deleted_at")
+# The tombstones written by the delete trigger get the time of the local delete
+PUSH_TOMBSTONE_STMT: str = ("UPDATE task_deletions d SET deleted_at = v.deleted_at "
+                            "FROM unnest(%s::int[], %s::timestamptz[]) AS v (task_id, deleted_at) "
+                            "WHERE d.task_id = v.task_id AND d.version = pg_current_xact_id()::text::bigint")
+PULL_STMT: str = (f"SELECT {TASK_COLUMNS}, updated_at, FALSE FROM tasks WHERE version >= %s "
+                  "UNION ALL "
+                  "SELECT task_id, NULL, NULL, NULL, NULL, NULL, deleted_at, TRUE FROM task_deletions "
+                  "WHERE version >= %s")
+
+logger = logging.getLogger(__name__)
+
+
+def journal_time(value: str) -> datetime:
+    """
+    Parses a journal timestamp, written by SQLite in UTC.
+    :param value: Text like 2026-10-18 07:33:59.135
+    :return: Time zone aware datetime
+    """
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+class OfflineTaskStore(SQLiteTaskStore):
+    def __init__(self, path: str = "todo_local.db", sync: bool = True, interval: float | None = None,
+                 itersize: int = 2000) -> None:
+        """
+        Opens the local replica; every read and write is served by it, so the app works without the server.
+        Writes are recorded in a change journal and a background thread pushes them to Postgres and pulls
+        the changes made by other clients.
+        :param path: Database file of the local replica
+        :param sync: Start the sync thread
+        :param interval: Seconds between syncs, defaults to the TODO_SYNC_INTERVAL environment variable
+        :param itersize: Rows read per batch when streaming tasks
+        """
+        super().__init__(path, itersize)
+        self.sync: TaskSync | None = None
+        if sync and self.conn is not None:
+            if interval is None:
+                interval = float(os.getenv("TODO_SYNC_INTERVAL", "5"))
+            self.sync = TaskSync(self, interval=interval)
+            self.sync.start()
+
+    def migrate(self) -> int:
+        applied: int = super().migrate()
+        with self.transaction() as cur:
+            for statement in JOURNAL_SCHEMA:
+                cur.execute(statement)
+        return applied
+
+    def pending_changes(self) -> int:
+        """
+        Number of tasks changed locally and not pushed yet.
+        :return: Count of distinct task ids in the journal
+        """
+        rows = self._fetch("SELECT COUNT(DISTINCT task_id) FROM task_journal", (), "Error reading change journal")
+        return rows[0][0]
+
+    def changes(self, limit: int) -> tuple[int, list[tuple[Task, datetime]], list[tuple[int, datetime]]]:
+        """
+        Reads the oldest journal entries, one change per task with its current local state.
+        :param limit: Journal entries to read
+        :return: Sequence number of the last entry read (0 when the journal is empty), tasks to upsert with
+                 the time of their last change and ids of deleted tasks with the time of the delete
+        """
+        with self._lock:
+            entries = self.conn.execute("SELECT seq, task_id, changed_at FROM task_journal ORDER BY seq LIMIT ?",
+                                        (limit,)).fetchall()
+            if not entries:
+                return 0, [], []
+            changed: dict[int, str] = {}
+            for _, task_id, changed_at in entries:
+                changed[task_id] = max(changed.get(task_id, changed_at), changed_at)
+            placeholders: str = ", ".join("?" * len(changed))
+            tasks: dict[int, Task] = {row[0]: task_from_sqlite(row) for row in self.conn.execute(
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id IN ({placeholders})", list(changed))}
+        upserts: list[tuple[Task, datetime]] = []
+        deletes: list[tuple[int, datetime]] = []
+        for task_id, changed_at in changed.items():
+            if task_id in tasks:
+                upserts.append((tasks[task_id], journal_time(changed_at)))
+            else:
+                deletes.append((task_id, journal_time(changed_at)))
+        return entries[-1][0], upserts, deletes
+
+    def acknowledge(self, seq: int) -> None:
+        """
+        Drops the journal entries up to a sequence number once the server has them.
+        :param seq: Last pushed sequence number
+        :return: None
+        """
+        with self.transaction() as cur:
+            cur.execute("DELETE FROM task_journal WHERE seq <= ?", (seq,))
+
+    def apply_remote(self, rows: Iterable[tuple]) -> int:
+        """
+        Applies changes pulled from the server in one transaction, without journaling them.
+        A task changed locally after the server change keeps the local version, which is pushed later.
+        :param rows: Rows of task_id, title, created_at, due_date, is_complete, note, updated_at and deleted
+        :return: Number of tasks changed locally
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        applied: int = 0
+        with self.transaction() as cur:
+            cur.execute("UPDATE sync_state SET value = 1 WHERE key = 'applying'")
+            placeholders: str = ", ".join("?" * len(rows))
+            task_ids: list[int] = [row[0] for row in rows]
+            pending: dict[int, str] = dict(cur.execute(
+                f"SELECT task_id, MAX(changed_at) FROM task_journal WHERE task_id IN ({placeholders}) "
+                "GROUP BY task_id", task_ids).fetchall())
+            local: dict[int, tuple] = {row[0]: row for row in cur.execute(
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id IN ({placeholders})", task_ids).fetchall()}
+            for row in rows:
+                task_id, updated_at, deleted = row[0], row[6], row[7]
+                if task_id in pending:
+                    # Last writer wins
+                    if journal_time(pending[task_id]) > updated_at:
+                        continue
+                    cur.execute("DELETE FROM task_journal WHERE task_id = ?", (task_id,))
+                if deleted:
+                    cur.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+                    applied += cur.rowcount
+                    continue
+                values: tuple = tuple(to_sqlite(value) for value in row[:6])
+                if local.get(task_id) == values:
+                    # Usually a change this client pushed itself
+                    continue
+                cur.execute(f"INSERT INTO tasks ({TASK_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?) "
+                            "ON CONFLICT (task_id) DO UPDATE SET title = excluded.title, "
+                            "created_at = excluded.created_at, due_date = excluded.due_date, "
+                            "is_complete = excluded.is_complete, note = excluded.note", values)
+                applied += 1
+            cur.execute("UPDATE sync_state SET value = 0 WHERE key = 'applying'")
+        return applied
+
+    def sync_cursor(self) -> int:
+        """
+        Position in the server's change history up to which changes have been pulled.
+        :return: Lowest server transaction id whose changes may not have been pulled yet
+        """
+        with self._lock:
+            return int(self.conn.execute("SELECT value FROM sync_state WHERE key = 'pull_cursor'").fetchone()[0])
+
+    def set_sync_cursor(self, cursor: int) -> None:
+        """
+        Stores the pull position after a complete pull.
+        :param cursor: New position, see sync_cursor
+        :return: None
+        """
+        with self.transaction() as cur:
+            cur.execute("UPDATE sync_state SET value = ? WHERE key = 'pull_cursor'", (cursor,))
+
+    def close(self) -> None:
+        if self.sync is not None:
+            self.sync.stop()
+            self.sync = None
+        super().close()
+
+
+class TaskSync:
+    def __init__(self, store: OfflineTaskStore, interval: float = 5.0, batch_size: int = 500,
+                 **connect_params) -> None:
+        """
+        Synchronizes a local replica with Postgres: local changes are pushed, then the server changes since
+        the last pull are pulled. Conflicts go to the most recent change (last writer wins), so the clocks
+        of the clients should be in sync.
+        :param store: Local replica
+        :param interval: Seconds between syncs, and between connection attempts while offline
+        :param batch_size: Changes pushed per transaction and pulled rows applied per local transaction
+        :param connect_params: Keyword arguments for psycopg2.connect, the DB_* settings by default
+        """
+        self.store = store
+        self.interval = interval
+        self.batch_size = batch_size
+        if not connect_params:
+            load_env()
+            connect_params = get_connection_params()
+        # Offline the attempt to connect must not hold up the sync thread for long
+        self._connect_params: dict = {"connect_timeout": 5, **connect_params}
+        self._conn: psycopg2.extensions.connection | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.online: bool = False
+        self.last_sync: datetime | None = None
+        self.last_error: str | None = None
+        self.pushed: int = 0
+        self.pulled: int = 0
+
+    def start(self) -> None:
+        """
+        Starts the background thread, the first sync runs right away.
+        :return: None
+        """
+        self._thread = threading.Thread(target=self._run, name="todo-sync", daemon=True)
+        self._thread.start()
+
+    def request(self) -> None:
+        """
+        Makes the background thread sync now instead of at the end of the interval.
+        :return: None
+        """
+        self._wake.set()
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        """
+        Opens the server connection and brings the server schema up to date.
+        :return: Connection with autocommit off
+        """
+        conn = psycopg2.connect(**self._connect_params)
+        try:
+            conn.autocommit = True
+            migrate_schema(conn)
+            conn.autocommit = False
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    def sync_now(self) -> tuple[int, int]:
+        """
+        Pushes the local changes and pulls the server changes.
+        Connection errors are raised, the local replica keeps every change that was not pushed.
+        :return: Tuple of changes pushed and local tasks changed by the pull
+        """
+        with self._lock:
+            try:
+                if self._conn is None or self._conn.closed:
+                    self._conn = self._connect()
+                pushed: int = self._push(self._conn)
+                pulled: int = self._pull(self._conn)
+            except BaseException as error:
+                self.online = False
+                self.last_error = str(error).strip()
+                if self._conn is not None:
+                    try:
+                        self._conn.close()
+                    except psycopg2.Error:
+                        pass
+                self._conn = None
+                raise
+            self.online = True
+            self.last_error = None
+            self.pushed += pushed
+            self.pulled += pulled
+            self.last_sync = datetime.now()
+            return pushed, pulled
+
+    def _push(self, conn: psycopg2.extensions.connection) -> int:
+        """
+        Sends the journaled changes, batch_size journal entries per transaction.
+        :param conn: Server connection
+        :return: Number of tasks pushed
+        """
+        pushed: int = 0
+        while True:
+            seq, upserts, deletes = self.store.changes(self.batch_size)
+            if not seq:
+                return pushed
+            with conn:
+                with conn.cursor() as cur:
+                    if upserts:
+                        columns = [list(column) for column in zip(*(
+                            (task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note,
+                             changed_at) for task, changed_at in upserts))]
+                        cur.execute(PUSH_UPSERT_STMT, columns)
+                    if deletes:
+                        columns = [[task_id for task_id, _ in deletes], [deleted_at for _, deleted_at in deletes]]
+                        cur.execute(PUSH_DELETE_STMT, columns)
+                        cur.execute(PUSH_TOMBSTONE_STMT, columns)
+            self.store.acknowledge(seq)
+            pushed += len(upserts) + len(deletes)
+
+    def _pull(self, conn: psycopg2.extensions.connection) -> int:
+        """
+        Reads every task and deletion the server recorded since the last pull from one snapshot.
+        The next pull starts at the oldest transaction still running when the snapshot was taken, so
+        changes committed later with a lower version are not missed; changes read twice are skipped.
+        :param conn: Server connection
+        :return: Number of local tasks changed
+        """
+        cursor: int = self.store.sync_cursor()
+        applied: int = 0
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+                cur.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+                next_cursor: int = cur.fetchone()[0]
+            with conn.cursor(name="todo_sync_pull") as cur:
+                cur.itersize = self.batch_size
+                cur.execute(PULL_STMT, (cursor, cursor))
+                while True:
+                    rows: list[tuple] = cur.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    applied += self.store.apply_remote(rows)
+        self.store.set_sync_cursor(next_cursor)
+        return applied
+
+    def _run(self) -> None:
+        """
+        Syncs every interval until stopped, working offline while the server cannot be reached.
+        :return: None
+        """
+        was_online: bool | None = None
+        while not self._stop.is_set():
+            try:
+                self.sync_now()
+                if was_online is False:
+                    logger.info("Sync reconnected to the database")
+            except (psycopg2.Error, OSError) as error:
+                if was_online is not False:
+                    logger.warning("Working offline, changes are kept locally: %s", str(error).strip())
+            except Exception:
+                logger.exception("Error syncing tasks")
+            was_online = self.online
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def status(self) -> dict:
+        """
+        State of the sync.
+        :return: Dictionary with online, pending (local changes not pushed), last_sync, last_error,
+                 pushed and pulled
+        """
+        return {
+            "online": self.online,
+            "pending": self.store.pending_changes(),
+            "last_sync": self.last_sync,
+            "last_error": self.last_error,
+            "pushed": self.pushed,
+            "pulled": self.pulled,
+        }
+
+    def stop(self) -> None:
+        """
+        Stops the background thread; when online the remaining local changes are pushed first.
+        :return: None
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.online:
+            try:
+                self.sync_now()
+            except (psycopg2.Error, OSError) as error:
+                logger.warning("Could not push the last changes, they are kept locally: %s", str(error).strip())
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,264 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/postgres_store.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Task storage in PostgreSQL through DatabaseConfig
+############################################################
+
+from datetime import date, datetime
+from typing import Callable, Iterable, Iterator, TextIO
+
+from todo.pagination import TaskPage, build_page, page_queries
+from todo.task import Task
+from todo.task_stats import TaskStats
+from .archive import ARCHIVED_TASKS, RESTORE_TASK
+from .change_feed import ChangeFeed
+from .database_config import DatabaseConfig
+from .notification_listener import NotificationListener
+from .prepared_statements import PreparedQuery, register_query
+from .task_store import COMPLETE, DELETE, INSERT, UPDATE, TaskStore, WriteOp, group_writes, search_terms
+
+# Explicit column list in the order Task expects them
+TASK_COLUMNS: str = "task_id, title, created_at, due_date, is_complete, note"
+
+# Rows of a batched write passed as one typed array per column, so the statement text never changes
+# with the batch size and never contains values
+TASK_ARRAYS: str = "unnest(%s::int[], %s::varchar[], %s::timestamp[], %s::timestamp[], %s::boolean[], %s::text[])"
+
+# Single task statements run on every get, exists, write and count, so they are prepared once per connection
+GET_TASK: PreparedQuery = register_query("get_task", f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id = %s")
+TASK_EXISTS: PreparedQuery = register_query("task_exists", "SELECT EXISTS (SELECT 1 FROM tasks WHERE task_id = %s)")
+INSERT_TASK: PreparedQuery = register_query("insert_task", f"INSERT INTO tasks ({TASK_COLUMNS}) "
+                                            "VALUES (%s, %s, %s, %s, %s, %s) "
+                                            "ON CONFLICT (task_id) DO NOTHING RETURNING task_id")
+UPDATE_TASK: PreparedQuery = register_query("update_task", "UPDATE tasks SET title = %s, created_at = %s, "
+                                            "due_date = %s, is_complete = %s, note = %s "
+                                            "WHERE task_id = %s RETURNING task_id")
+DELETE_TASK: PreparedQuery = register_query("delete_task",
+                                            f"DELETE FROM tasks WHERE task_id = %s RETURNING {TASK_COLUMNS}")
+# The row lock taken by the lookup makes concurrent callers see the completed state
+COMPLETE_TASK: PreparedQuery = register_query("complete_task", "WITH target AS ("
+                                              "SELECT task_id, title, is_complete FROM tasks "
+                                              "WHERE task_id = %s FOR UPDATE), "
+                                              "updated AS ("
+                                              "UPDATE tasks SET is_complete = TRUE FROM target "
+                                              "WHERE tasks.task_id = target.task_id "
+                                              "AND target.is_complete IS NOT TRUE "
+                                              "RETURNING tasks.task_id) "
+                                              "SELECT title, is_complete IS TRUE FROM target")
+COUNT_TASKS: PreparedQuery = register_query("count_tasks", "SELECT COUNT(*) FROM tasks")
+# Batches of iter_tasks, read by task id on the primary key index
+ITER_TASKS: PreparedQuery = register_query("iter_tasks", f"SELECT {TASK_COLUMNS} FROM tasks "
+                                           "WHERE task_id > %s::bigint ORDER BY task_id LIMIT %s")
+ITER_TASKS_BY_STATUS: PreparedQuery = register_query("iter_tasks_by_status",
+                                                     f"SELECT {TASK_COLUMNS} FROM tasks "
+                                                     "WHERE task_id > %s::bigint AND is_complete = %s "
+                                                     "ORDER BY task_id LIMIT %s")
+COUNT_TASKS_BY_STATUS: PreparedQuery = register_query("count_tasks_by_status",
+                                                      "SELECT COUNT(*) FROM tasks WHERE is_complete = %s")
+TASK_STATS: PreparedQuery = register_query("task_stats", "SELECT COUNT(*), "
+                                           "COUNT(*) FILTER (WHERE is_complete), "
+                                           "COUNT(*) FILTER (WHERE NOT is_complete), "
+                                           "COUNT(*) FILTER (WHERE NOT is_complete AND due_date < %s) "
+                                           "FROM tasks")
+# Totals come from the counters, overdue tasks use the partial index on incomplete tasks
+CACHED_TASK_STATS: PreparedQuery = register_query("cached_task_stats",
+                                                  "SELECT COALESCE(SUM(total), 0), COALESCE(SUM(completed), 0), "
+                                                  "COALESCE(SUM(incomplete), 0), "
+                                                  "(SELECT COUNT(*) FROM tasks "
+                                                  "WHERE NOT is_complete AND due_date < %s) "
+                                                  "FROM task_counters")
+
+
+def task_arrays(ops: list[WriteOp]) -> list[list]:
+    """
+    Turns the tasks of a run of writes into one list per column.
+    :param ops: Inserts or updates
+    :return: Column lists in TASK_COLUMNS order
+    """
+    return [list(column) for column in zip(*((op.task.task_id, op.task.title, op.task.created_at,
+                                              op.task.due_date, op.task.is_complete, op.task.note)
+                                             for op in ops))]
+
+
+class PostgresTaskStore(TaskStore):
+    def __init__(self, pooled: bool | None = None, db: DatabaseConfig | None = None,
+                 lazy: bool | None = None) -> None:
+        """
+        Connects to PostgreSQL and brings the schema up to date.
+        :param pooled: Use a connection pool, defaults to the DB_POOL_ENABLED environment variable
+        :param db: Existing database connection to use instead of opening one
+        :param lazy: Connect on first use, defaults to the DB_LAZY_CONNECT environment variable
+        """
+        self.db = db or DatabaseConfig(pooled=pooled, lazy=lazy)
+        self.cached_stats: bool = False
+        # Whether pg_trgm is installed, looked up on the first search
+        self.trigram: bool | None = None
+
+    def insert(self, task: Task) -> bool:
+        inserted: tuple | None = self.db.insert_task(INSERT_TASK, (task.task_id, task.title, task.created_at,
+                                                                   task.due_date, task.is_complete, task.note))
+        return inserted is not None
+
+    def get(self, task_id: int) -> Task | None:
+        return self.db.fetch_task(GET_TASK, (task_id,))
+
+    def exists(self, task_id: int) -> bool:
+        return bool(self.db.fetch_value(TASK_EXISTS, (task_id,)))
+
+    def update(self, task: Task) -> bool:
+        updated: tuple | None = self.db.update_task(UPDATE_TASK, (task.title, task.created_at, task.due_date,
+                                                                  task.is_complete, task.note, task.task_id))
+        return updated is not None
+
+    def delete(self, task_id: int) -> Task | None:
+        deleted: tuple | None = self.db.delete_task(DELETE_TASK, (task_id,))
+        return Task.from_row(deleted) if deleted else None
+
+    def complete(self, task_id: int) -> tuple[str, bool] | None:
+        # Sent as a write so it runs on the primary and the next reads see it
+        return self.db.update_task(COMPLETE_TASK, (task_id,))
+
+    def stats(self, now: datetime) -> TaskStats | None:
+        result: tuple | None = self.db.fetch_row(CACHED_TASK_STATS if self.cached_stats else TASK_STATS, (now,))
+        if result is None:
+            return None
+        return TaskStats(*(int(value) for value in result))
+
+    def count(self, is_complete: bool | None = None) -> int:
+        if is_complete is None:
+            result: int | None = self.db.fetch_value(COUNT_TASKS)
+        else:
+            result = self.db.fetch_value(COUNT_TASKS_BY_STATUS, (is_complete,))
+        return result if result is not None else -1
+
+    def iter_tasks(self, is_complete: bool | None = None) -> Iterator[Task]:
+        # Each batch is its own short read, so no connection, transaction or lock is held while the caller
+        # works on a task or stops iterating early
+        itersize: int = self.db.itersize
+        # Below every INT task id
+        last_id: int = -2 ** 31 - 1
+        while True:
+            if is_complete is None:
+                tasks: list[Task] = self.db.fetch_all_tasks(ITER_TASKS, (last_id, itersize))
+            else:
+                tasks = self.db.fetch_all_tasks(ITER_TASKS_BY_STATUS, (last_id, is_complete, itersize))
+            yield from tasks
+            if len(tasks) < itersize:
+                return
+            last_id = tasks[-1].task_id
+
+    def list_page(self, is_complete: bool | None, due_after: datetime | None, due_before: datetime | None,
+                  order_by: str, page_size: int, cursor: str | None) -> TaskPage:
+        # One extra row tells whether another page follows
+        limit: int = page_size + 1
+        tasks: list[Task] = []
+        for query_stmt, params in page_queries(f"SELECT {TASK_COLUMNS} FROM tasks", order_by, cursor,
+                                               is_complete, due_after, due_before):
+            tasks += self.db.fetch_all_tasks(query_stmt, tuple(params + [limit - len(tasks)]))
+            if len(tasks) >= limit:
+                break
+        return build_page(tasks, page_size, order_by)
+
+    def search(self, query: str, limit: int) -> list[Task]:
+        terms: list[str] = search_terms(query)
+        if not terms:
+            return []
+        # Every word must match the start of a word in the title or note, e.g. "groc list" matches
+        # "Grocery list"
+        ts_query: str = " & ".join(f"{term}:*" for term in terms)
+        if self.trigram is None:
+            self.trigram = bool(self.db.fetch_value(
+                "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"))
+        if not self.trigram:
+            query_stmt: str = (f"SELECT {TASK_COLUMNS} FROM tasks, to_tsquery('english', %s) AS q "
+                               "WHERE search_vector @@ q "
+                               "ORDER BY ts_rank(search_vector, q) DESC, task_id LIMIT %s")
+            return self.db.fetch_all_tasks(query_stmt, (ts_query, limit))
+        # The trigram match also finds titles with misspelled words, both conditions use a GIN index
+        text: str = " ".join(terms)
+        query_stmt = (f"SELECT {TASK_COLUMNS} FROM tasks, to_tsquery('english', %s) AS q "
+                      "WHERE search_vector @@ q OR %s <%% title "
+                      "ORDER BY ts_rank(search_vector, q) + word_similarity(%s, title) DESC, task_id LIMIT %s")
+        return self.db.fetch_all_tasks(query_stmt, (ts_query, text, text, limit))
+
+    def bulk_insert(self, tasks: Iterable[Task], batch_size: int = 5000, on_conflict: str = "skip",
+                    progress: Callable[[int, int], None] | None = None) -> tuple[int, int]:
+        rows = ((task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note)
+                for task in tasks)
+        return self.db.copy_tasks_in(rows, batch_size=batch_size, on_conflict=on_conflict, progress=progress)
+
+    def apply_writes(self, ops: list[WriteOp]) -> list:
+        results: list = []
+        with self.db.transaction() as cur:
+            for run in group_writes(ops):
+                kind: str = run[0].kind
+                if kind == INSERT:
+                    cur.execute(f"INSERT INTO tasks ({TASK_COLUMNS}) SELECT * FROM {TASK_ARRAYS} "
+                                "ON CONFLICT (task_id) DO NOTHING RETURNING task_id", task_arrays(run))
+                    inserted: set[int] = {row[0] for row in cur.fetchall()}
+                    results += [op.task_id in inserted for op in run]
+                elif kind == UPDATE:
+                    cur.execute("UPDATE tasks SET title = v.title, created_at = v.created_at, "
+                                "due_date = v.due_date, is_complete = v.is_complete, note = v.note "
+                                f"FROM {TASK_ARRAYS} AS v ({TASK_COLUMNS}) "
+                                "WHERE tasks.task_id = v.task_id RETURNING tasks.task_id",
+                                task_arrays(run))
+                    updated: set[int] = {row[0] for row in cur.fetchall()}
+                    results += [op.task_id in updated for op in run]
+                elif kind == DELETE:
+                    cur.execute(f"DELETE FROM tasks WHERE task_id = ANY(%s) RETURNING {TASK_COLUMNS}",
+                                ([op.task_id for op in run],))
+                    deleted: dict[int, Task] = {task.task_id: task for task in Task.from_rows(cur.fetchall())}
+                    results += [deleted.get(op.task_id) for op in run]
+                elif kind == COMPLETE:
+                    cur.execute("WITH target AS ("
+                                "SELECT task_id, title, is_complete FROM tasks WHERE task_id = ANY(%s) FOR UPDATE), "
+                                "updated AS ("
+                                "UPDATE tasks SET is_complete = TRUE FROM target "
+                                "WHERE tasks.task_id = target.task_id AND target.is_complete IS NOT TRUE "
+                                "RETURNING tasks.task_id) "
+                                "SELECT task_id, title, is_complete IS TRUE FROM target",
+                                ([op.task_id for op in run],))
+                    completed: dict[int, tuple] = {row[0]: (row[1], row[2]) for row in cur.fetchall()}
+                    results += [completed.get(op.task_id) for op in run]
+                else:
+                    raise ValueError(f"Unknown write {kind!r}")
+        return results
+
+    def export(self, stream: TextIO, fmt: str = "csv") -> int:
+        return self.db.copy_tasks_out(stream, fmt)
+
+    def max_connections(self) -> int:
+        return self.db.max_connections
+
+    def enable_cached_stats(self) -> bool:
+        self.cached_stats = self.db.enable_task_counters()
+        return self.cached_stats
+
+    def notify(self, channel: str, payload: str) -> bool:
+        return self.db.notify(channel, payload)
+
+    def listen(self, channel: str, callback: Callable[[str], None]) -> NotificationListener | None:
+        return self.db.listen(channel, callback)
+
+    def archive_completed(self, before: datetime, batch_size: int = 1000, pause: float = 0.0) -> int | None:
+        return self.db.archive_completed(before, batch_size, pause)
+
+    def archived(self, completed_after: datetime | None, completed_before: datetime | None,
+                 limit: int) -> list[Task]:
+        return self.db.fetch_all_tasks(ARCHIVED_TASKS, (completed_after, completed_before, limit))
+
+    def restore(self, task_id: int) -> bool:
+        return self.db.insert_task(RESTORE_TASK, (task_id, task_id)) is not None
+
+    def drop_archive(self, before: date) -> list[str] | None:
+        return self.db.drop_archive_partitions(before)
+
+    def change_feed(self, after: int | None = None) -> ChangeFeed | None:
+        return self.db.change_feed(after)
+
+    def close(self) -> None:
+        self.db.close()
@@ -0,0 +1,153 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/prepared_statements.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Registry of named queries prepared once per connection with PREPARE/EXECUTE
+############################################################
+
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
+import re
+import threading
+
+import psycopg2
+import psycopg2.errors
+import psycopg2.extensions
+
+# Server-side names get a prefix so they never clash with statements prepared by other code
+NAME_PREFIX: str = "todo_"
+
+
+class PreparedQuery(NamedTuple):
+    """
+    Named query, written with %s placeholders like any other statement.
+    """
+    name: str
+    statement: str
+    param_count: int
+
+    @property
+    def prepare_statement(self) -> str:
+        """
+        PREPARE statement with the placeholders numbered $1, $2, ... in order.
+        """
+        numbers = iter(range(1, self.param_count + 1))
+        body: str = re.sub(r"%[s%]", lambda match: f"${next(numbers)}" if match.group() == "%s" else "%",
+                           self.statement)
+        return f"PREPARE {NAME_PREFIX}{self.name} AS {body}"
+
+    @property
+    def execute_statement(self) -> str:
+        """
+        EXECUTE statement taking the same parameters as the query.
+        """
+        if not self.param_count:
+            return f"EXECUTE {NAME_PREFIX}{self.name}"
+        return f"EXECUTE {NAME_PREFIX}{self.name} ({', '.join(['%s'] * self.param_count)})"
+
+
+# Every named query, by name
+QUERIES: dict[str, PreparedQuery] = {}
+
+
+def register_query(name: str, statement: str) -> PreparedQuery:
+    """
+    Adds a named query to the registry.
+    Parameter types are inferred by the server from where the placeholders are used.
+    :param name: Query name, letters, digits and underscores
+    :param statement: SQL with %s placeholders, %% for a literal %
+    :return: Registered query
+    """
+    if not re.fullmatch(r"[a-z_][a-z0-9_]*", name):
+        raise ValueError(f"Invalid query name {name!r}")
+    query = PreparedQuery(name, statement, len(re.findall(r"%s", statement.replace("%%", ""))))
+    registered: PreparedQuery | None = QUERIES.get(name)
+    if registered is not None and registered != query:
+        raise ValueError(f"Query {name!r} is already registered with a different statement")
+    QUERIES[name] = query
+    return query
+
+
+class PreparedStatements:
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Runs named queries through statements prepared once per connection.
+        The server parses and plans a prepared statement once; later executions on the same
+        connection reuse it, so only the parameters are sent.
+        :param enabled: Prepare the queries, when False they run as plain statements
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # Names prepared on each connection, a new or reopened connection starts empty
+        self._prepared: WeakKeyDictionary = WeakKeyDictionary()
+        # Query name to [prepares, executions]
+        self._counters: dict[str, list[int]] = {}
+
+    def execute(self, cur: psycopg2.extensions.cursor, query: PreparedQuery, params=None) -> None:
+        """
+        Executes a named query, preparing it first if this connection has not prepared it yet.
+        :param cur: Cursor to execute with
+        :param query: Registered query
+        :param params: Arguments for the placeholders
+        :return: None
+        """
+        if not self.enabled:
+            cur.execute(query.statement, params)
+            return
+        conn = cur.connection
+        with self._lock:
+            names: set[str] | None = self._prepared.get(conn)
+            if names is None:
+                names = self._prepared[conn] = set()
+            counters: list[int] = self._counters.setdefault(query.name, [0, 0])
+        if query.name not in names:
+            self._prepare(cur, names, counters, query)
+        try:
+            cur.execute(query.execute_statement, params)
+        except psycopg2.errors.InvalidSqlStatementName:
+            # Dropped on the server, e.g. by DISCARD ALL; prepared again when nothing else is in the transaction
+            names.discard(query.name)
+            if not conn.autocommit:
+                raise
+            self._prepare(cur, names, counters, query)
+            cur.execute(query.execute_statement, params)
+        with self._lock:
+            counters[1] += 1
+
+    def _prepare(self, cur: psycopg2.extensions.cursor, names: set[str], counters: list[int],
+                 query: PreparedQuery) -> None:
+        """
+        Prepares a query on the cursor's connection.
+        :param cur: Cursor to execute with
+        :param names: Names already prepared on the connection
+        :param counters: Counters of the query
+        :param query: Query to prepare
+        :return: None
+        """
+        cur.execute(query.prepare_statement)
+        names.add(query.name)
+        with self._lock:
+            counters[0] += 1
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Plan cache counters of every named query run so far.
+        :return: Dictionary keyed by query name with prepares, executions, hits (executions that reused a
+                 prepared plan) and hit_rate
+        """
+        with self._lock:
+            return {name: {"prepares": prepares,
+                           "executions": executions,
+                           "hits": max(0, executions - prepares),
+                           "hit_rate": round(max(0, executions - prepares) / executions, 4) if executions else 0.0}
+                    for name, (prepares, executions) in self._counters.items()}
+
+    def reset(self) -> None:
+        """
+        Drops the counters; statements stay prepared on their connections.
+        :return: None
+        """
+        with self._lock:
+            self._counters.clear()
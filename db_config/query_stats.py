@@ -0,0 +1,231 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/query_stats.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Per-statement latency histograms, row and error counts and a slow query log
+############################################################
+
+from bisect import bisect_left
+from collections import deque
+from datetime import datetime
+import logging
+import threading
+import time
+
+import psycopg2.extensions
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is unbounded
+LATENCY_BUCKETS: tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_statement(query) -> str:
+    """
+    Collapses whitespace so the same statement always gets the same key.
+    :param query: SQL text, str or bytes
+    :return: Single line statement
+    """
+    if isinstance(query, bytes):
+        query = query.decode(errors="replace")
+    elif not isinstance(query, str):
+        query = str(query)
+    return " ".join(query.split())
+
+
+def redact_params(params) -> list | dict | None:
+    """
+    Replaces parameter values by their type so logged statements never contain user data.
+    :param params: Sequence or mapping passed with the statement
+    :return: Same shape with "<type>" placeholders, None stays None
+    """
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {key: f"<{type(value).__name__}>" if value is not None else None for key, value in params.items()}
+    return [f"<{type(value).__name__}>" if value is not None else None for value in params]
+
+
+class StatementStats:
+    """
+    Counters of one statement, updated under the QueryStats lock.
+    """
+    __slots__ = ("calls", "errors", "rows", "total_time", "max_time", "buckets")
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.errors: int = 0
+        self.rows: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+        self.buckets: list[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+class QueryStats:
+    def __init__(self, slow_threshold: float | None = 0.2, slow_log_size: int = 100, echo: bool = True) -> None:
+        """
+        Creates empty statistics.
+        :param slow_threshold: Statements taking at least this many seconds go to the slow query log,
+                               None disables the log
+        :param slow_log_size: Number of slow statements kept, older ones are dropped
+        :param echo: Also log slow statements as warnings
+        """
+        self.slow_threshold = slow_threshold
+        self.echo = echo
+        self._lock = threading.Lock()
+        self._statements: dict[str, StatementStats] = {}
+        self._slow: deque[dict] = deque(maxlen=slow_log_size)
+
+    def record(self, query, params, duration: float, rows: int, error: BaseException | None = None) -> None:
+        """
+        Adds one execution of a statement.
+        :param query: SQL text that was executed
+        :param params: Parameters passed with it, only their types are kept
+        :param duration: Execution time in seconds
+        :param rows: Rows returned or affected, negative when unknown
+        :param error: Exception raised by the statement, None if it succeeded
+        :return: None
+        """
+        statement: str = normalize_statement(query)
+        with self._lock:
+            stats: StatementStats | None = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = StatementStats()
+            stats.calls += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+            stats.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+            if rows > 0:
+                stats.rows += rows
+            if error is not None:
+                stats.errors += 1
+            slow: bool = self.slow_threshold is not None and duration >= self.slow_threshold
+            if slow:
+                entry: dict = {
+                    "time": datetime.now().isoformat(timespec="milliseconds"),
+                    "statement": statement,
+                    "params": redact_params(params),
+                    "duration_ms": round(duration * 1000, 3),
+                    "rows": rows,
+                    "error": type(error).__name__ if error is not None else None,
+                }
+                self._slow.append(entry)
+        if slow and self.echo:
+            logger.warning("Slow query (%s ms, %s rows): %s params=%s", entry["duration_ms"], rows, statement,
+                           entry["params"])
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Aggregates per statement.
+        :return: Dictionary keyed by statement with calls, errors, rows, total_ms, mean_ms, max_ms and
+                 the cumulative histogram as {upper bound in seconds: calls}
+        """
+        with self._lock:
+            result: dict[str, dict] = {}
+            for statement, stats in self._statements.items():
+                cumulative: int = 0
+                histogram: dict[str, int] = {}
+                for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), stats.buckets):
+                    cumulative += count
+                    histogram[f"{bound:g}" if bound != float("inf") else "+Inf"] = cumulative
+                result[statement] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "rows": stats.rows,
+                    "total_ms": round(stats.total_time * 1000, 3),
+                    "mean_ms": round(stats.total_time * 1000 / stats.calls, 3),
+                    "max_ms": round(stats.max_time * 1000, 3),
+                    "histogram": histogram,
+                }
+            return result
+
+    def slow_queries(self) -> list[dict]:
+        """
+        Statements recorded in the slow query log, oldest first.
+        :return: List of entries with time, statement, redacted params, duration_ms, rows and error
+        """
+        with self._lock:
+            return list(self._slow)
+
+    def reset(self) -> None:
+        """
+        Drops every counter and the slow query log.
+        :return: None
+        """
+        with self._lock:
+            self._statements.clear()
+            self._slow.clear()
+
+    def prometheus(self, prefix: str = "todo_db") -> str:
+        """
+        Renders the counters in the Prometheus text exposition format.
+        :param prefix: Metric name prefix
+        :return: Text with one sample per line
+        """
+
+        def label(statement: str) -> str:
+            escaped: str = statement.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            return f'statement="{escaped}"'
+
+        snapshot: dict[str, dict] = self.snapshot()
+        lines: list[str] = [f"# HELP {prefix}_query_duration_seconds Statement execution time",
+                            f"# TYPE {prefix}_query_duration_seconds histogram"]
+        for statement, stats in snapshot.items():
+            for bound, count in stats["histogram"].items():
+                lines.append(f'{prefix}_query_duration_seconds_bucket{{{label(statement)},le="{bound}"}} {count}')
+            lines.append(f"{prefix}_query_duration_seconds_sum{{{label(statement)}}} {stats['total_ms'] / 1000:g}")
+            lines.append(f"{prefix}_query_duration_seconds_count{{{label(statement)}}} {stats['calls']}")
+        for name, key, description in (("query_rows_total", "rows", "Rows returned or affected"),
+                                       ("query_errors_total", "errors", "Statements that raised an error")):
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for statement, stats in snapshot.items():
+                lines.append(f"{prefix}_{name}{{{label(statement)}}} {stats[key]}")
+        return "\n".join(lines) + "\n"
+
+
+def instrumented_cursor(stats: QueryStats) -> type:
+    """
+    Builds a cursor class that records every statement it runs, passed to psycopg2.connect as cursor_factory.
+    :param stats: Statistics the cursor records into
+    :return: Cursor class
+    """
+
+    class InstrumentedCursor(psycopg2.extensions.cursor):
+        def _statement(self, query):
+            # psycopg2.sql objects are rendered here, never from self.query which has the values inlined
+            return query.as_string(self) if hasattr(query, "as_string") else query
+
+        def execute(self, query, vars=None):
+            start: float = time.perf_counter()
+            try:
+                result = super().execute(query, vars)
+            except BaseException as error:
+                stats.record(self._statement(query), vars, time.perf_counter() - start, -1, error)
+                raise
+            stats.record(self._statement(query), vars, time.perf_counter() - start, self.rowcount)
+            return result
+
+        def executemany(self, query, vars_list):
+            start: float = time.perf_counter()
+            try:
+                result = super().executemany(query, vars_list)
+            except BaseException as error:
+                stats.record(self._statement(query), None, time.perf_counter() - start, -1, error)
+                raise
+            stats.record(self._statement(query), None, time.perf_counter() - start, self.rowcount)
+            return result
+
+        def copy_expert(self, sql, file, size=8192):
+            start: float = time.perf_counter()
+            try:
+                result = super().copy_expert(sql, file, size)
+            except BaseException as error:
+                stats.record(sql, None, time.perf_counter() - start, -1, error)
+                raise
+            stats.record(sql, None, time.perf_counter() - start, self.rowcount)
+            return result
+
+    return InstrumentedCursor
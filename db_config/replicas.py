@@ -0,0 +1,157 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/replicas.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Read replicas picked round-robin, skipping replicas that failed recently
+############################################################
+
+from contextlib import contextmanager
+from typing import Iterator
+import threading
+import time
+
+import psycopg2
+import psycopg2.extensions
+
+from .connection_pool import ConnectionPool, PoolError
+
+# Where a statement runs, None lets the configuration decide
+PRIMARY: str = "primary"
+REPLICA: str = "replica"
+ROUTES: tuple[str, ...] = (PRIMARY, REPLICA)
+
+
+def replica_params(dsn: str, primary_params: dict) -> dict:
+    """
+    Builds the connection settings of a replica.
+    Settings missing from the DSN, such as the user and password, are taken from the primary.
+    :param dsn: libpq connection string or URI, e.g. "host=replica1 port=5433"
+    :param primary_params: Keyword arguments used to connect to the primary
+    :return: Keyword arguments for psycopg2.connect
+    """
+    params: dict = {key: value for key, value in primary_params.items() if value is not None}
+    for key, value in psycopg2.extensions.parse_dsn(dsn).items():
+        params["database" if key == "dbname" else key] = value
+    return params
+
+
+class ReplicaFailure(psycopg2.OperationalError):
+    """
+    A replica connection failed during the with block. The replica is already marked down, so the
+    read can be retried on the next replica or the primary. The driver error is kept as __cause__.
+    """
+
+
+class Replica:
+    """
+    One read replica with its connections and counters, updated under the ReplicaSet lock.
+    """
+
+    def __init__(self, name: str, pool: ConnectionPool) -> None:
+        self.name = name
+        self.pool = pool
+        # Monotonic time until which the replica is skipped after a failure
+        self.down_until: float = 0.0
+        self.reads: int = 0
+        self.failures: int = 0
+
+
+class ReplicaSet:
+    def __init__(self, dsns: list[str], primary_params: dict, max_size: int = 1, timeout: float | None = 30.0,
+                 retry_interval: float = 30.0, check_interval: float = 30.0) -> None:
+        """
+        Creates the replicas; connections are opened on first use, so a replica that is down does not
+        stop the application from starting.
+        :param dsns: Connection strings of the replicas
+        :param primary_params: Keyword arguments used to connect to the primary, including the cursor factory
+        :param max_size: Connections per replica
+        :param timeout: Seconds to wait for a free connection of a replica
+        :param retry_interval: Seconds a replica that failed is skipped before it is tried again
+        :param check_interval: Connections idle longer than this many seconds are pinged on checkout
+        """
+        if not dsns:
+            raise ValueError("At least one replica is required")
+        self.retry_interval = retry_interval
+        self.replicas: list[Replica] = []
+        for dsn in dsns:
+            params: dict = replica_params(dsn, primary_params)
+            name: str = f"{params.get('host') or 'localhost'}:{params.get('port') or 5432}"
+            self.replicas.append(Replica(name, ConnectionPool(min_size=0, max_size=max_size, timeout=timeout,
+                                                              check_interval=check_interval, **params)))
+        self._lock = threading.Lock()
+        self._next: int = 0
+
+    def _candidates(self) -> list[Replica]:
+        """
+        Replicas in the order to try them: round-robin from the next one, skipping those that failed recently.
+        :return: Healthy replicas, possibly none
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            start: int = self._next
+            self._next = (self._next + 1) % len(self.replicas)
+            ordered: list[Replica] = self.replicas[start:] + self.replicas[:start]
+            return [replica for replica in ordered if replica.down_until <= now]
+
+    def mark_down(self, replica: Replica) -> None:
+        """
+        Skips a replica for the retry interval.
+        :param replica: Replica that failed
+        :return: None
+        """
+        with self._lock:
+            replica.failures += 1
+            replica.down_until = time.monotonic() + self.retry_interval
+
+    @contextmanager
+    def connection(self) -> Iterator[psycopg2.extensions.connection | None]:
+        """
+        Checks out a connection of the next healthy replica for the with block.
+        A replica that cannot be reached is marked down and the next one is tried; a replica whose
+        connection fails during the with block is marked down and ReplicaFailure is raised.
+        :return: Replica connection or None when no replica is available
+        """
+        for replica in self._candidates():
+            try:
+                conn = replica.pool.getconn()
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                self.mark_down(replica)
+                continue
+            except PoolError:
+                # Every connection of this replica is busy
+                continue
+            with self._lock:
+                replica.reads += 1
+            broken: bool = False
+            try:
+                yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as error:
+                broken = True
+                self.mark_down(replica)
+                if isinstance(error, ReplicaFailure):
+                    raise
+                raise ReplicaFailure(f"Replica {replica.name} failed: {error}") from error
+            finally:
+                replica.pool.putconn(conn, close=broken)
+            return
+        yield None
+
+    def stats(self) -> list[dict]:
+        """
+        Counters of every replica.
+        :return: One dictionary per replica with name, healthy, reads and failures
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            return [{"name": replica.name, "healthy": replica.down_until <= now, "reads": replica.reads,
+                     "failures": replica.failures} for replica in self.replicas]
+
+    def close(self) -> None:
+        """
+        Closes the connections of every replica.
+        :return: None
+        """
+        for replica in self.replicas:
+            replica.pool.close()
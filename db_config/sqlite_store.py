@@ -0,0 +1,337 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/sqlite_store.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Task storage in an embedded SQLite database file using write-ahead logging
+############################################################
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterable, Iterator
+import logging
+import sqlite3
+import threading
+
+from todo.pagination import TaskPage, build_page, page_queries
+from todo.task import Task
+from todo.task_stats import TaskStats
+from .errors import StorageError
+from .task_store import COMPLETE, DELETE, INSERT, UPDATE, TaskStore, WriteOp, search_terms
+
+TASK_COLUMNS: str = "task_id, title, created_at, due_date, is_complete, note"
+
+logger = logging.getLogger(__name__)
+
+# Schema versions tracked in PRAGMA user_version, same layout and indexes as the Postgres migrations
+SQLITE_MIGRATIONS: list[tuple[str, ...]] = [
+    ("CREATE TABLE IF NOT EXISTS tasks ("
+     "task_id INTEGER PRIMARY KEY, "
+     "title TEXT, "
+     "created_at TEXT, "
+     "due_date TEXT, "
+     "is_complete INTEGER, "
+     "note TEXT)",),
+    ("CREATE INDEX IF NOT EXISTS tasks_incomplete_due_idx ON tasks (due_date, task_id) WHERE NOT is_complete",),
+    ("CREATE INDEX IF NOT EXISTS tasks_status_due_idx ON tasks (is_complete, due_date, task_id)",),
+    # FTS5 index over title and note that reads the text from tasks, kept in sync by triggers
+    ("CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+     "title, note, content='tasks', content_rowid='task_id')",
+     "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+     "INSERT INTO tasks_fts (rowid, title, note) VALUES (new.task_id, new.title, new.note); "
+     "END",
+     "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+     "INSERT INTO tasks_fts (tasks_fts, rowid, title, note) VALUES ('delete', old.task_id, old.title, old.note); "
+     "END",
+     # Completing a task does not change its text, so only title and note updates reindex it
+     "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF task_id, title, note ON tasks BEGIN "
+     "INSERT INTO tasks_fts (tasks_fts, rowid, title, note) VALUES ('delete', old.task_id, old.title, old.note); "
+     "INSERT INTO tasks_fts (rowid, title, note) VALUES (new.task_id, new.title, new.note); "
+     "END",
+     "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')"),
+]
+
+
+def to_sqlite(value):
+    """
+    Converts a query parameter to its stored form.
+    Timestamps are stored as fixed width ISO 8601 text so they sort like the timestamps they represent.
+    :param value: Parameter value
+    :return: Value SQLite can store
+    """
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="microseconds")
+    return value
+
+
+def task_from_sqlite(row: tuple) -> Task:
+    """
+    Builds a task from a stored row.
+    :param row: Row in TASK_COLUMNS order
+    :return: Task
+    """
+    task_id, title, created_at, due_date, is_complete, note = row
+    return Task(task_id, title,
+                datetime.fromisoformat(created_at) if created_at is not None else None,
+                datetime.fromisoformat(due_date) if due_date is not None else None,
+                bool(is_complete) if is_complete is not None else None,
+                note)
+
+
+class SQLiteTaskStore(TaskStore):
+    def __init__(self, path: str = "todo.db", itersize: int = 2000) -> None:
+        """
+        Opens the database file, creating it and its schema when missing.
+        One connection is shared by every thread, statements are serialized by a lock.
+        :param path: Database file, ":memory:" for a private in-memory database
+        :param itersize: Rows read per batch when streaming tasks
+        """
+        self.path = path
+        self.itersize = itersize
+        self._lock = threading.RLock()
+        self.conn: sqlite3.Connection | None = None
+        try:
+            # isolation_level None leaves transactions to explicit BEGIN statements
+            self.conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            if path != ":memory:":
+                self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("PRAGMA busy_timeout=5000")
+            self.migrate()
+            logger.info("Database connection established")
+        except (sqlite3.Error, StorageError) as error:
+            logger.error("Database connection failed: %s", error)
+            self.conn = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Gives a cursor whose statements run in one write transaction.
+        The transaction is committed when the with block finishes and rolled back on error,
+        database errors are raised as StorageError.
+        :return: Database cursor
+        """
+        with self._lock:
+            if self.conn is None:
+                raise StorageError("Not connected to the database")
+            try:
+                cur = self.conn.cursor()
+                cur.execute("BEGIN IMMEDIATE")
+                try:
+                    yield cur
+                except BaseException:
+                    cur.execute("ROLLBACK")
+                    raise
+                else:
+                    cur.execute("COMMIT")
+                finally:
+                    cur.close()
+            except sqlite3.Error as error:
+                raise StorageError("Error running transaction") from error
+
+    def migrate(self) -> int:
+        """
+        Applies the schema versions newer than PRAGMA user_version.
+        :return: Number of versions applied
+        """
+        with self.transaction() as cur:
+            version: int = cur.execute("PRAGMA user_version").fetchone()[0]
+            for number, statements in enumerate(SQLITE_MIGRATIONS[version:], start=version + 1):
+                for statement in statements:
+                    cur.execute(statement)
+                cur.execute(f"PRAGMA user_version = {number}")
+        return max(len(SQLITE_MIGRATIONS) - version, 0)
+
+    def _fetch(self, query: str, params=(), error_msg: str = "Error executing query") -> list[tuple]:
+        """
+        Runs a read query.
+        :param query: SQL query with ? placeholders
+        :param params: Arguments to pass to the SQL query
+        :param error_msg: Message of the StorageError raised when the query fails
+        :return: All rows
+        """
+        with self._lock:
+            if self.conn is None:
+                raise StorageError("Not connected to the database")
+            try:
+                return self.conn.execute(query, [to_sqlite(value) for value in params]).fetchall()
+            except sqlite3.Error as error:
+                raise StorageError(error_msg) from error
+
+    @staticmethod
+    def _insert(cur: sqlite3.Cursor, task: Task) -> bool:
+        cur.execute("INSERT INTO tasks (task_id, title, created_at, due_date, is_complete, note) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (task_id) DO NOTHING",
+                    [to_sqlite(value) for value in (task.task_id, task.title, task.created_at, task.due_date,
+                                                    task.is_complete, task.note)])
+        return cur.rowcount == 1
+
+    @staticmethod
+    def _update(cur: sqlite3.Cursor, task: Task) -> bool:
+        cur.execute("UPDATE tasks SET title = ?, created_at = ?, due_date = ?, is_complete = ?, note = ? "
+                    "WHERE task_id = ?",
+                    [to_sqlite(value) for value in (task.title, task.created_at, task.due_date, task.is_complete,
+                                                    task.note, task.task_id)])
+        return cur.rowcount == 1
+
+    @staticmethod
+    def _delete(cur: sqlite3.Cursor, task_id: int) -> Task | None:
+        row = cur.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        if row:
+            cur.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+        return task_from_sqlite(row) if row else None
+
+    @staticmethod
+    def _complete(cur: sqlite3.Cursor, task_id: int) -> tuple[str, bool] | None:
+        row = cur.execute("SELECT title, is_complete FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        if row and not row[1]:
+            cur.execute("UPDATE tasks SET is_complete = 1 WHERE task_id = ?", (task_id,))
+        return (row[0], bool(row[1])) if row else None
+
+    def insert(self, task: Task) -> bool:
+        with self.transaction() as cur:
+            return self._insert(cur, task)
+
+    def get(self, task_id: int) -> Task | None:
+        rows = self._fetch(f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id = ?", (task_id,),
+                           "Error executing query single")
+        return task_from_sqlite(rows[0]) if rows else None
+
+    def exists(self, task_id: int) -> bool:
+        return bool(self._fetch("SELECT 1 FROM tasks WHERE task_id = ?", (task_id,), "Error fetching value in db"))
+
+    def update(self, task: Task) -> bool:
+        with self.transaction() as cur:
+            return self._update(cur, task)
+
+    def delete(self, task_id: int) -> Task | None:
+        with self.transaction() as cur:
+            return self._delete(cur, task_id)
+
+    def complete(self, task_id: int) -> tuple[str, bool] | None:
+        # BEGIN IMMEDIATE takes the write lock before the lookup, like FOR UPDATE in Postgres
+        with self.transaction() as cur:
+            return self._complete(cur, task_id)
+
+    def apply_writes(self, ops: list[WriteOp]) -> list:
+        appliers: dict[str, Callable] = {
+            INSERT: lambda cur, op: self._insert(cur, op.task),
+            UPDATE: lambda cur, op: self._update(cur, op.task),
+            DELETE: lambda cur, op: self._delete(cur, op.task_id),
+            COMPLETE: lambda cur, op: self._complete(cur, op.task_id),
+        }
+        # One transaction means one commit and one WAL sync for the whole batch
+        with self.transaction() as cur:
+            return [appliers[op.kind](cur, op) for op in ops]
+
+    def stats(self, now: datetime) -> TaskStats | None:
+        rows = self._fetch("SELECT COUNT(*), "
+                           "COUNT(*) FILTER (WHERE is_complete), "
+                           "COUNT(*) FILTER (WHERE NOT is_complete), "
+                           "COUNT(*) FILTER (WHERE NOT is_complete AND due_date < ?) "
+                           "FROM tasks", (now,), "Error fetching row")
+        return TaskStats(*rows[0]) if rows else None
+
+    def count(self, is_complete: bool | None = None) -> int:
+        if is_complete is None:
+            rows = self._fetch("SELECT COUNT(*) FROM tasks", (), "Error fetching value in db")
+        else:
+            rows = self._fetch("SELECT COUNT(*) FROM tasks WHERE is_complete = ?", (is_complete,),
+                               "Error fetching value in db")
+        return rows[0][0] if rows else -1
+
+    def iter_tasks(self, is_complete: bool | None = None) -> Iterator[Task]:
+        # Batches are read by task id so the lock is never held while the caller works on a task
+        query_stmt: str = f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id > ? "
+        params: list = []
+        if is_complete is not None:
+            query_stmt += "AND is_complete = ? "
+            params.append(is_complete)
+        query_stmt += "ORDER BY task_id LIMIT ?"
+        # SQLite integers are 64-bit, so every task id is greater than this
+        last_id: int = -2 ** 63
+        while True:
+            rows = self._fetch(query_stmt, [last_id] + params + [self.itersize], "Error streaming tasks")
+            if not rows:
+                return
+            yield from map(task_from_sqlite, rows)
+            if len(rows) < self.itersize:
+                return
+            last_id = rows[-1][0]
+
+    def list_page(self, is_complete: bool | None, due_after: datetime | None, due_before: datetime | None,
+                  order_by: str, page_size: int, cursor: str | None) -> TaskPage:
+        # One extra row tells whether another page follows
+        limit: int = page_size + 1
+        tasks: list[Task] = []
+        for query_stmt, params in page_queries(f"SELECT {TASK_COLUMNS} FROM tasks", order_by, cursor,
+                                               is_complete, due_after, due_before):
+            rows = self._fetch(query_stmt.replace("%s", "?"), params + [limit - len(tasks)],
+                               "Error executing query all")
+            tasks += map(task_from_sqlite, rows or [])
+            if len(tasks) >= limit:
+                break
+        return build_page(tasks, page_size, order_by)
+
+    def search(self, query: str, limit: int) -> list[Task]:
+        terms: list[str] = search_terms(query)
+        if not terms:
+            return []
+        # Every quoted word is a prefix that must match, bm25 weighs title words like the
+        # Postgres weights A and B
+        match_stmt: str = " ".join(f'"{term}"*' for term in terms)
+        rows = self._fetch("SELECT tasks.task_id, tasks.title, tasks.created_at, tasks.due_date, "
+                           "tasks.is_complete, tasks.note FROM tasks_fts JOIN tasks ON tasks.task_id = tasks_fts.rowid "
+                           "WHERE tasks_fts MATCH ? ORDER BY bm25(tasks_fts, 1.0, 0.4), tasks.task_id LIMIT ?",
+                           (match_stmt, limit), "Error searching tasks")
+        return list(map(task_from_sqlite, rows or []))
+
+    def bulk_insert(self, tasks: Iterable[Task], batch_size: int = 5000, on_conflict: str = "skip",
+                    progress: Callable[[int, int], None] | None = None) -> tuple[int, int]:
+        if on_conflict == "skip":
+            conflict_stmt: str = "ON CONFLICT (task_id) DO NOTHING"
+        elif on_conflict == "update":
+            conflict_stmt = ("ON CONFLICT (task_id) DO UPDATE SET title = excluded.title, "
+                             "created_at = excluded.created_at, due_date = excluded.due_date, "
+                             "is_complete = excluded.is_complete, note = excluded.note")
+        else:
+            raise ValueError(f"Unknown conflict mode {on_conflict!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        insert_stmt: str = ("INSERT INTO tasks (task_id, title, created_at, due_date, is_complete, note) "
+                            "VALUES (?, ?, ?, ?, ?, ?) " + conflict_stmt)
+
+        total_read: int = 0
+        total_written: int = 0
+        # Keyed by task id so the last occurrence within a batch wins, as with the Postgres import
+        batch: dict[int, tuple] = {}
+        batch_rows: int = 0
+
+        def flush() -> None:
+            nonlocal total_read, total_written, batch_rows
+            with self.transaction() as cur:
+                cur.executemany(insert_stmt, batch.values())
+                written: int = cur.rowcount
+            total_read += batch_rows
+            total_written += written
+            batch.clear()
+            batch_rows = 0
+            if progress:
+                progress(total_read, total_written)
+
+        for task in tasks:
+            batch[task.task_id] = tuple(to_sqlite(value) for value in (
+                task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note))
+            batch_rows += 1
+            if batch_rows >= batch_size:
+                flush()
+        if batch_rows:
+            flush()
+        return total_read, total_written
+
+    def close(self) -> None:
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+            logger.info("Database connection closed")
@@ -0,0 +1,357 @@
+############################################################
+# Project Name : Todo App
+# File Name    : db_config/task_store.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Storage backend interface used by the task manager and the backend factory
+############################################################
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Callable, Iterable, Iterator, NamedTuple, TextIO
+import csv
+import json
+import os
+import re
+
+from todo.pagination import TaskPage
+from todo.task import Task
+from todo.task_stats import TaskStats
+
+BACKENDS: tuple[str, ...] = ("postgres", "sqlite", "memory", "offline")
+
+# Kinds of queued writes
+INSERT: str = "insert"
+UPDATE: str = "update"
+DELETE: str = "delete"
+COMPLETE: str = "complete"
+
+
+class WriteOp(NamedTuple):
+    """
+    One queued write.
+    task is the new state for inserts and updates and None for deletes and completions.
+    """
+    kind: str
+    task_id: int
+    task: Task | None = None
+
+
+class TaskStore(ABC):
+    """
+    Storage of tasks.
+    Every backend reports failures the same way, by raising StorageError; None, False and empty
+    results only ever describe the data, such as a task that does not exist.
+    """
+
+    @abstractmethod
+    def insert(self, task: Task) -> bool:
+        """
+        Inserts a task unless its id is taken.
+        :param task: Task to insert
+        :return: True if the task was inserted else False
+        """
+
+    @abstractmethod
+    def get(self, task_id: int) -> Task | None:
+        """
+        Gets a task.
+        :param task_id: Task id to get
+        :return: Task or None if it does not exist
+        """
+
+    @abstractmethod
+    def exists(self, task_id: int) -> bool:
+        """
+        Checks if a task exists.
+        :param task_id: Task id to check
+        :return: True if the task exists else False
+        """
+
+    @abstractmethod
+    def update(self, task: Task) -> bool:
+        """
+        Replaces every field of an existing task.
+        :param task: Task with the new values
+        :return: True if the task was updated, False if it does not exist
+        """
+
+    @abstractmethod
+    def delete(self, task_id: int) -> Task | None:
+        """
+        Deletes a task.
+        :param task_id: Task id to delete
+        :return: The deleted task or None if it did not exist
+        """
+
+    @abstractmethod
+    def complete(self, task_id: int) -> tuple[str, bool] | None:
+        """
+        Marks a task complete.
+        :param task_id: Task id to complete
+        :return: Tuple of the title and whether it was already complete, None if it does not exist
+        """
+
+    @abstractmethod
+    def stats(self, now: datetime) -> TaskStats | None:
+        """
+        Counts total, completed, incomplete and overdue tasks.
+        :param now: Incomplete tasks due before this time are overdue
+        :return: Task counts
+        """
+
+    @abstractmethod
+    def count(self, is_complete: bool | None = None) -> int:
+        """
+        Counts tasks.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :return: Number of tasks
+        """
+
+    @abstractmethod
+    def iter_tasks(self, is_complete: bool | None = None) -> Iterator[Task]:
+        """
+        Streams tasks without loading them all into memory.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :return: Iterator of tasks
+        """
+
+    @abstractmethod
+    def list_page(self, is_complete: bool | None, due_after: datetime | None, due_before: datetime | None,
+                  order_by: str, page_size: int, cursor: str | None) -> TaskPage:
+        """
+        Gets one page of tasks with keyset pagination, see TaskManager.list_tasks.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :param due_after: Only tasks due at or after this time
+        :param due_before: Only tasks due before this time
+        :param order_by: Column to order by, one of ORDER_COLUMNS
+        :param page_size: Maximum number of tasks in the page
+        :param cursor: Cursor from the previous page, None for the first page
+        :return: Page of tasks and the cursor of the next page
+        """
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> list[Task]:
+        """
+        Finds tasks whose title or note contain every word of the query, words may be prefixes.
+        :param query: Words to search for, punctuation is ignored
+        :param limit: Maximum number of tasks to return
+        :return: Matching tasks, best match first
+        """
+
+    @abstractmethod
+    def bulk_insert(self, tasks: Iterable[Task], batch_size: int = 5000, on_conflict: str = "skip",
+                    progress: Callable[[int, int], None] | None = None) -> tuple[int, int]:
+        """
+        Inserts many tasks, one batch per transaction.
+        :param tasks: Tasks to insert, consumed lazily
+        :param batch_size: Number of tasks per batch
+        :param on_conflict: "skip" keeps existing tasks, "update" overwrites them
+        :param progress: Called after every batch with the tasks read and tasks written so far
+        :return: Tuple of tasks read and tasks inserted or updated
+        """
+
+    @abstractmethod
+    def apply_writes(self, ops: list[WriteOp]) -> list:
+        """
+        Applies writes in order in one transaction, either all of them or none.
+        A failure raises StorageError and nothing of the batch is applied.
+        :param ops: Writes to apply
+        :return: Result of every write, as returned by insert, update, delete or complete
+        """
+
+    def apply_write(self, op: WriteOp):
+        """
+        Applies a single write with the matching method.
+        :param op: Write to apply
+        :return: Result of insert, update, delete or complete
+        """
+        if op.kind == INSERT:
+            return self.insert(op.task)
+        if op.kind == UPDATE:
+            return self.update(op.task)
+        if op.kind == DELETE:
+            return self.delete(op.task_id)
+        if op.kind == COMPLETE:
+            return self.complete(op.task_id)
+        raise ValueError(f"Unknown write {op.kind!r}")
+
+    def export(self, stream: TextIO, fmt: str = "csv") -> int:
+        """
+        Writes every task ordered by task id as CSV with a header row or as JSON Lines.
+        :param stream: Text stream to write to
+        :param fmt: "csv" or "jsonl"
+        :return: Number of tasks written
+        """
+        if fmt not in ("csv", "jsonl"):
+            raise ValueError(f"Unknown export format {fmt!r}")
+        page: TaskPage = TaskPage([], None)
+        count: int = 0
+        writer = csv.writer(stream) if fmt == "csv" else None
+        if writer:
+            writer.writerow(("task_id", "title", "created_at", "due_date", "is_complete", "note"))
+        while True:
+            page = self.list_page(None, None, None, "task_id", 1000, page.next_cursor)
+            for task in page.tasks:
+                # Same text as COPY writes: t/f booleans in CSV, ISO 8601 timestamps in JSON
+                if writer:
+                    writer.writerow((task.task_id, task.title, task.created_at, task.due_date,
+                                     None if task.is_complete is None else "tf"[not task.is_complete], task.note))
+                else:
+                    stream.write(json.dumps(task_to_record(task)) + "\n")
+                count += 1
+            if page.next_cursor is None:
+                return count
+
+    def max_connections(self) -> int:
+        """
+        Number of calls the backend can run at the same time on separate connections.
+        :return: Connection count, 1 when every call is serialized
+        """
+        return 1
+
+    def enable_cached_stats(self) -> bool:
+        """
+        Switches stats to precomputed counters when the backend supports them.
+        :return: True if counters are used else False
+        """
+        return False
+
+    def notify(self, channel: str, payload: str) -> bool:
+        """
+        Sends a message to other processes using the same storage, if the backend supports it.
+        :param channel: Notification channel
+        :param payload: Message text
+        :return: True if the message was sent, False when not supported
+        """
+        return False
+
+    def listen(self, channel: str, callback: Callable[[str], None]):
+        """
+        Starts receiving messages from other processes, if the backend supports it.
+        :param channel: Notification channel
+        :param callback: Called with the payload of every message
+        :return: Listener with a stop() method or None when not supported
+        """
+        return None
+
+    def archive_completed(self, before: datetime, batch_size: int = 1000, pause: float = 0.0) -> int | None:
+        """
+        Moves tasks completed before a time out of the live tasks into the archive, if the backend has one.
+        :param before: Tasks completed before this time are archived
+        :param batch_size: Maximum number of tasks moved per transaction
+        :param pause: Seconds to wait between batches
+        :return: Number of tasks archived or None when not supported
+        """
+        return None
+
+    def archived(self, completed_after: datetime | None, completed_before: datetime | None,
+                 limit: int) -> list[Task]:
+        """
+        Gets archived tasks, most recently completed first.
+        :param completed_after: Only tasks completed at or after this time
+        :param completed_before: Only tasks completed before this time
+        :param limit: Maximum number of tasks to return
+        :return: Archived tasks, empty when the backend has no archive
+        """
+        return []
+
+    def restore(self, task_id: int) -> bool:
+        """
+        Moves an archived task back to the live tasks.
+        :param task_id: Task id to restore
+        :return: True if restored, False if not archived, a live task has the id or not supported
+        """
+        return False
+
+    def drop_archive(self, before: date) -> list[str] | None:
+        """
+        Removes the archived tasks of every completion month before a month.
+        :param before: Months before the month of this day are dropped
+        :return: Names of the dropped archive parts or None when not supported
+        """
+        return None
+
+    def change_feed(self, after: int | None = None):
+        """
+        Opens a feed of the changes made to the tasks by every process, if the backend logs them.
+        :param after: Sequence number of the last change already handled, None for changes from now on
+        :return: Iterable feed with a close() method or None when not supported
+        """
+        return None
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Releases the connections of the backend.
+        :return: None
+        """
+
+
+def group_writes(ops: list[WriteOp]) -> Iterator[list[WriteOp]]:
+    """
+    Splits writes into runs of the same kind that touch each task at most once, so every run
+    can be sent as one statement without changing the outcome of the writes.
+    :param ops: Writes in the order they were made
+    :return: Iterator of runs, in order
+    """
+    run: list[WriteOp] = []
+    task_ids: set[int] = set()
+    for op in ops:
+        if run and (op.kind != run[0].kind or op.task_id in task_ids):
+            yield run
+            run, task_ids = [], set()
+        run.append(op)
+        task_ids.add(op.task_id)
+    if run:
+        yield run
+
+
+def search_terms(query: str) -> list[str]:
+    """
+    Splits a search query into lowercase words of letters and digits, dropping repeated words.
+    :param query: Search text typed by the user
+    :return: Words in the order they were typed
+    """
+    return list(dict.fromkeys(re.findall(r"[^\W_]+", query.lower())))
+
+
+def task_to_record(task: Task) -> dict:
+    """
+    Converts a task to a JSON friendly dictionary, the format read by todo.task_io.
+    :param task: Task to convert
+    :return: Dictionary keyed by column name
+    """
+    return {
+        "task_id": task.task_id,
+        "title": task.title,
+        "created_at": task.created_at.isoformat() if task.created_at else None,
+        "due_date": task.due_date.isoformat() if task.due_date else None,
+        "is_complete": task.is_complete,
+        "note": task.note,
+    }
+
+
+def create_store(backend: str | None = None, pooled: bool | None = None, lazy: bool | None = None) -> TaskStore:
+    """
+    Creates the configured storage backend.
+    :param backend: "postgres", "sqlite", "memory" or "offline", defaults to the TODO_BACKEND environment variable
+    :param pooled: Use a connection pool for Postgres, defaults to DB_POOL_ENABLED
+    :param lazy: Connect to Postgres on first use, defaults to DB_LAZY_CONNECT
+    :return: Storage backend
+    """
+    backend = (backend or os.getenv("TODO_BACKEND") or "postgres").lower()
+    if backend == "postgres":
+        from .postgres_store import PostgresTaskStore
+        return PostgresTaskStore(pooled=pooled, lazy=lazy)
+    if backend == "sqlite":
+        from .sqlite_store import SQLiteTaskStore
+        return SQLiteTaskStore(os.getenv("TODO_SQLITE_PATH", "todo.db"))
+    if backend == "memory":
+        from .memory_store import MemoryTaskStore
+        return MemoryTaskStore()
+    if backend == "offline":
+        from .offline_store import OfflineTaskStore
+        return OfflineTaskStore(os.getenv("TODO_OFFLINE_PATH", "todo_local.db"))
+    raise ValueError(f"Unknown storage backend {backend!r}, expected one of {', '.join(BACKENDS)}")
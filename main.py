@@ -3,31 +3,85 @@
 # File Name    : main.py
 # Author       : @nissubba1
 # Created Date : 2025-06-16
-# Updated Date : 2025-06-17
+# Updated Date : 2026-10-18
 # Description  : Entry point to the program
 ############################################################
 
+import time
+
+# Taken before the other imports so --profile-startup includes them
+STARTUP_BEGIN: float = time.perf_counter()
+
 from todo.task_manager import TaskManager
 from todo.task import Task
+from todo.task_stats import TaskStats
+from todo.task_io import FORMATS, guess_format, read_tasks
+from todo.batch import BATCH_OPS, OUTPUT_FORMATS, RESULT_FIELDS, STATS_FIELDS, TASK_FIELDS, BatchRunner, RecordWriter
+from todo.pagination import ORDER_COLUMNS
+from todo.presentation import ConsolePresenter
+from todo.log_sink import configure_logging, remove_log_sink
+from db_config.errors import StorageError
+from db_config.task_store import task_to_record
+from contextlib import redirect_stdout
 from datetime import datetime
+from typing import TextIO
+import argparse
+import json
+import sys
+import threading
+
+# Number of tasks shown per page in the interactive listings
+PAGE_SIZE: int = 10
 
+# Prints tasks, write outcomes and errors to the current stdout
+presenter: ConsolePresenter = ConsolePresenter()
 
-def welcome_msg(task_list: TaskManager, total_tasks: int, completed_tasks: int, incomplete_tasks: int) -> None:
+
+class StartupSummary:
+    def __init__(self, task_list: TaskManager) -> None:
+        """
+        Loads the stats and the first incomplete tasks in a background thread, so the menu
+        is shown without waiting for the database
+        :param task_list: Current instance of task manager object
+        """
+        self.task_list = task_list
+        self.stats: TaskStats | None = None
+        self.incomplete: list[Task] = []
+        self.error: Exception | None = None
+        self.ready = threading.Event()
+        threading.Thread(target=self._load, name="todo-startup-summary", daemon=True).start()
+
+    def _load(self) -> None:
+        """
+        Reads the summary, the first query also opens the lazy database connection
+        :return: None
+        """
+        try:
+            self.stats = self.task_list.stats()
+            self.incomplete = self.task_list.list_tasks(is_complete=False, page_size=PAGE_SIZE).tasks
+        except Exception as error:
+            self.error = error
+        finally:
+            self.ready.set()
+
+
+def welcome_msg(stats: TaskStats, incomplete: list[Task]) -> None:
     """
     Shows the welcome message and current stats
-    :param task_list: List of tasks currently in the database
-    :param total_tasks: Number of tasks currently in the database
-    :param completed_tasks: Number of completed tasks currently in the database
-    :param incomplete_tasks: Number of incomplete tasks currently in the database
+    :param stats: Task counts currently in the database
+    :param incomplete: First page of incomplete tasks
     :return: None
     """
     print("******************* Todo App ***********************")
-    print(f"Number of Tasks: {total_tasks}")
-    print(f"Completed Tasks: {completed_tasks}")
-    print(f"Incomplete Tasks: {incomplete_tasks}")
+    print(f"Number of Tasks: {stats.total}")
+    print(f"Completed Tasks: {stats.completed}")
+    print(f"Incomplete Tasks: {stats.incomplete}")
+    print(f"Overdue Tasks: {stats.overdue}")
     print("************* Incompleted Task *********************")
-    if incomplete_tasks > 0:
-        task_list.show_uncompleted_task()
+    if incomplete:
+        presenter.show_tasks(incomplete)
+        if stats.incomplete > len(incomplete):
+            print(f"... and {stats.incomplete - len(incomplete)} more, choose 3 to see all of them")
     else:
         print("No incomplete tasks found")
     print("****************************************************")
@@ -46,10 +100,45 @@ def menu() -> None:
     print("5. Remove task")
     print("6. Update task")
     print("7. Mark task as completed")
-    print("8. Exit")
+    print("8. Search tasks")
+    print("9. Exit")
     print("*" * 52)
 
 
+def menu_page_tasks(task_list: TaskManager, is_complete: bool | None = None) -> None:
+    """
+    Shows tasks ordered by due date one page at a time
+    :param task_list: Current instance of task manager object
+    :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+    :return: None
+    """
+    cursor: str | None = None
+    while True:
+        page = task_list.list_tasks(is_complete=is_complete, page_size=PAGE_SIZE, cursor=cursor)
+        if not page.tasks and cursor is None:
+            print("No tasks found")
+        presenter.show_tasks(page.tasks)
+        if page.next_cursor is None:
+            return
+        if input("Press Enter for the next page or q to go back to the menu: ").strip().lower() == "q":
+            return
+        cursor = page.next_cursor
+
+
+def menu_search_tasks(task_list: TaskManager) -> None:
+    """
+    Asks the user for search words and shows the best matching tasks
+    :param task_list: Current instance of task manager object
+    :return: None
+    """
+    query: str = input("Enter words to search for: ")
+    tasks: list[Task] = task_list.search(query, limit=PAGE_SIZE)
+    if not tasks:
+        print("No matching tasks found")
+        return
+    presenter.show_tasks(tasks)
+
+
 def get_date_time(prompt: str) -> datetime:
     """
     Helper Function
@@ -100,10 +189,10 @@ def menu_update_task(task_list: TaskManager, task_id_update: int) -> None:
     :return: None
     """
     print("*" * 52)
-    if not task_list.is_task(task_id_update):
+    task: Task | None = task_list.get_task(task_id_update)
+    if task is None:
         print("Task ID not found")
         return
-    task: Task = task_list.get_task(task_id_update)
     updated_task_title = task.title
     updated_task_created_at: datetime = task.created_at
     updated_task_due_date: datetime = task.due_date
@@ -130,24 +219,262 @@ def menu_update_task(task_list: TaskManager, task_id_update: int) -> None:
     task_list.update_task(task)
 
 
-if __name__ == "__main__":
-    manager = TaskManager()
-    total_count: int = manager.count_total_tasks()
-    total_count_incomplete: int = manager.count_incompleted_tasks()
-    total_count_complete: int = manager.count_completed_task()
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parses the command line, no command starts the interactive menu
+    :param argv: Arguments to parse, defaults to sys.argv
+    :return: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Todo App")
+    parser.add_argument("--reminders", action="store_true",
+                        help="Print a reminder when a task becomes due while the menu is running, "
+                             "and at start for tasks that became overdue in the last day")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Report the time from start to the first menu prompt on stderr")
+    commands = parser.add_subparsers(dest="command")
+
+    import_parser = commands.add_parser("import", help="Bulk import tasks from a CSV or JSON Lines file")
+    import_parser.add_argument("file", help="File to read, - for stdin")
+    import_parser.add_argument("--format", choices=FORMATS, help="File format, guessed from the extension by default")
+    import_parser.add_argument("--batch-size", type=int, default=5000, help="Tasks sent per COPY batch")
+    import_parser.add_argument("--on-conflict", choices=("skip", "update"), default="skip",
+                               help="Keep or overwrite tasks whose ID already exists")
+    import_parser.add_argument("--no-progress", action="store_true", help="Do not report progress after each batch")
+
+    export_parser = commands.add_parser("export", help="Export all tasks to a CSV or JSON Lines file")
+    export_parser.add_argument("file", help="File to write, - for stdout")
+    export_parser.add_argument("--format", choices=FORMATS, help="File format, guessed from the extension by default")
+
+    # Scripting commands write JSON Lines or CSV to stdout, messages go to stderr
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--output", choices=OUTPUT_FORMATS, default="json", help="Output format (default json)")
+
+    add_parser = commands.add_parser("add", parents=[output], help="Add a task")
+    add_parser.add_argument("task_id", type=int)
+    add_parser.add_argument("title")
+    add_parser.add_argument("--due", help="Due date, YYYY-MM-DD HH:MM or ISO 8601")
+    add_parser.add_argument("--note")
+    add_parser.add_argument("--complete", action="store_true", help="Add the task as completed")
+
+    get_parser = commands.add_parser("get", parents=[output], help="Show a task")
+    get_parser.add_argument("task_id", type=int)
+
+    list_parser = commands.add_parser("list", parents=[output], help="List tasks")
+    status = list_parser.add_mutually_exclusive_group()
+    status.add_argument("--completed", action="store_const", dest="is_complete", const=True)
+    status.add_argument("--incomplete", action="store_const", dest="is_complete", const=False)
+    list_parser.add_argument("--order-by", choices=ORDER_COLUMNS, default="due_date")
+    list_parser.add_argument("--limit", type=int, help="Maximum number of tasks, all by default")
+
+    update_parser = commands.add_parser("update", parents=[output], help="Change fields of a task")
+    update_parser.add_argument("task_id", type=int)
+    update_parser.add_argument("--title")
+    update_parser.add_argument("--due", help="Due date, YYYY-MM-DD HH:MM or ISO 8601")
+    update_parser.add_argument("--note")
+    update_status = update_parser.add_mutually_exclusive_group()
+    update_status.add_argument("--complete", action="store_const", dest="is_complete", const=True)
+    update_status.add_argument("--incomplete", action="store_const", dest="is_complete", const=False)
+
+    for name, text in (("delete", "Delete a task"), ("complete", "Mark a task complete")):
+        commands.add_parser(name, parents=[output], help=text).add_argument("task_id", type=int)
+    commands.add_parser("stats", parents=[output], help="Show task counts")
+
+    archive_parser = commands.add_parser("archive", help="Move old completed tasks to the archive and apply "
+                                                         "the retention (Postgres)")
+    archive_parser.add_argument("--days", type=int, help="Archive tasks completed more than this many days ago "
+                                                         "(default TODO_ARCHIVE_DAYS or 30)")
+    archive_parser.add_argument("--batch-size", type=int, default=1000, help="Tasks moved per transaction")
+    archive_parser.add_argument("--pause", type=float, default=0.0, help="Seconds to wait between batches")
+    archive_parser.add_argument("--retention-months", type=int,
+                                help="Drop archived months older than this many months "
+                                     "(default TODO_ARCHIVE_RETENTION_MONTHS or 12)")
+
+    batch_parser = commands.add_parser("batch", parents=[output],
+                                       help="Run newline-delimited JSON operations, one result line each")
+    batch_parser.add_argument("file", nargs="?", default="-", help="File to read, - for stdin (default)")
+    batch_parser.add_argument("--batch-size", type=int, default=500, help="Writes per transaction")
+    return parser.parse_args(argv)
+
+
+def report_progress(read: int, written: int) -> None:
+    """
+    Prints the import progress to stderr
+    :param read: Number of tasks read so far
+    :param written: Number of tasks inserted or updated so far
+    :return: None
+    """
+    print(f"Imported {read} tasks ({written} written)", file=sys.stderr)
+
+
+def run_import(task_list: TaskManager, args: argparse.Namespace) -> None:
+    """
+    Streams a task file into the database
+    :param task_list: Current instance of task manager object
+    :param args: Parsed import arguments
+    :return: None
+    """
+    fmt: str = args.format or guess_format(args.file)
+    stream = sys.stdin if args.file == "-" else open(args.file, newline="", encoding="utf-8")
+    try:
+        read, written = task_list.add_tasks(read_tasks(stream, fmt), batch_size=args.batch_size,
+                                            on_conflict=args.on_conflict,
+                                            progress=None if args.no_progress else report_progress)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    print(f"Import finished: {read} tasks read, {written} written, {read - written} skipped")
+
+
+def run_export(task_list: TaskManager, args: argparse.Namespace) -> None:
+    """
+    Streams all tasks from the database into a file
+    :param task_list: Current instance of task manager object
+    :param args: Parsed export arguments
+    :return: None
+    """
+    fmt: str = args.format or guess_format(args.file)
+    if args.file == "-":
+        task_list.export_tasks(sys.stdout, fmt)
+        return
+    with open(args.file, "w", newline="", encoding="utf-8") as stream:
+        count: int = task_list.export_tasks(stream, fmt)
+    print(f"Exported {count} tasks to {args.file}")
+
+
+def run_archive(task_list: TaskManager, args: argparse.Namespace) -> int:
+    """
+    Archives old completed tasks and drops the archived months past the retention
+    :param task_list: Current instance of task manager object
+    :param args: Parsed archive arguments
+    :return: Exit status, 1 if archiving is not available
+    """
+    archived: int | None = task_list.archive_completed(args.days, batch_size=args.batch_size, pause=args.pause)
+    if archived is None:
+        print("Archiving needs the postgres backend")
+        return 1
+    print(f"Archived {archived} completed tasks")
+    for name in task_list.drop_archived(args.retention_months) or []:
+        print(f"Dropped archive partition {name}")
+    return 0
+
+
+def command_record(args: argparse.Namespace) -> dict:
+    """
+    Turns a scripting command into the batch operation it runs
+    :param args: Parsed command arguments
+    :return: Operation record as read by BatchRunner
+    """
+    record: dict = {"op": args.command}
+    if args.command in ("add", "get", "update", "delete", "complete"):
+        record["task_id"] = args.task_id
+    if args.command == "add":
+        record.update(title=args.title, created_at=datetime.now().isoformat(), due_date=args.due, note=args.note,
+                      is_complete=args.complete)
+    elif args.command == "update":
+        changes: dict = {"title": args.title, "due_date": args.due, "note": args.note,
+                         "is_complete": args.is_complete}
+        record.update((key, value) for key, value in changes.items() if value is not None)
+    return record
+
+
+def run_command(task_list: TaskManager, args: argparse.Namespace, out: TextIO) -> int:
+    """
+    Runs a scripting command and writes its result to out
+    :param task_list: Current instance of task manager object
+    :param args: Parsed command arguments
+    :param out: Stream for the results
+    :return: Exit status, 1 if an operation failed
+    """
+    if args.command == "batch":
+        runner = BatchRunner(task_list, batch_size=args.batch_size)
+        writer = RecordWriter(out, args.output, RESULT_FIELDS)
+        failed: bool = False
+        stream = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+        try:
+            for result in runner.run(stream):
+                writer.write(result)
+                failed = failed or not result["ok"]
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        return int(failed)
+    if args.command == "list":
+        # Pages are written as they arrive, so listing every task keeps memory use flat
+        writer = RecordWriter(out, args.output, TASK_FIELDS)
+        cursor: str | None = None
+        remaining: int | None = args.limit
+        while remaining is None or remaining > 0:
+            page_size: int = min(remaining, 1000) if remaining is not None else 1000
+            page = task_list.list_tasks(is_complete=args.is_complete, order_by=args.order_by,
+                                        page_size=page_size, cursor=cursor)
+            for task in page.tasks:
+                writer.write(task_to_record(task))
+            if remaining is not None:
+                remaining -= len(page.tasks)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+        return 0
+
+    result: dict = next(BatchRunner(task_list).run([json.dumps(command_record(args))]))
+    if args.command == "get" and result["ok"]:
+        RecordWriter(out, args.output, TASK_FIELDS).write(result["result"])
+    elif args.command == "stats" and result["ok"]:
+        RecordWriter(out, args.output, STATS_FIELDS).write(result["result"])
+    else:
+        RecordWriter(out, args.output, RESULT_FIELDS).write(result)
+    return 0 if result["ok"] else 1
+
+
+def report_startup(setup_done: float, prompt_shown: float) -> None:
+    """
+    Prints the time taken to reach the first menu prompt to stderr
+    :param setup_done: perf_counter value once the task manager was created
+    :param prompt_shown: perf_counter value when the first prompt was shown
+    :return: None
+    """
+    print(f"Time to first prompt: {(prompt_shown - STARTUP_BEGIN) * 1000:.1f} ms "
+          f"(imports and setup {(setup_done - STARTUP_BEGIN) * 1000:.1f} ms, "
+          f"menu {(prompt_shown - setup_done) * 1000:.1f} ms)", file=sys.stderr)
+
+
+def run_menu(manager: TaskManager, profile_startup: bool = False) -> None:
+    """
+    Runs the interactive menu loop until the user exits
+    :param manager: Current instance of task manager object
+    :param profile_startup: Report the time to the first prompt
+    :return: None
+    """
+    setup_done: float = time.perf_counter()
+    # Writes report their outcome through the presenter, queued writes when they are applied
+    presenter.attach(manager)
+    summary = StartupSummary(manager)
+    summary_shown: bool = False
     choice = 0
-    welcome_msg(manager, total_count, total_count_complete, total_count_incomplete)
-    while choice != 8:
+    while choice != 9:
+        if not summary_shown and summary.ready.is_set():
+            if summary.stats is not None:
+                welcome_msg(summary.stats, summary.incomplete)
+            elif summary.error is not None:
+                presenter.show_error(summary.error)
+            summary_shown = True
         menu()
+        if not summary_shown:
+            print("Loading task summary, it is shown with the next menu")
+        if profile_startup:
+            report_startup(setup_done, time.perf_counter())
+            profile_startup = False
         try:
             choice = int(input("Enter your choice: "))
+            # The summary shares the database connection, so it finishes before the menu uses it
+            summary.ready.wait()
             match choice:
                 case 1:
-                    manager.show_all_tasks()
+                    menu_page_tasks(manager)
                 case 2:
-                    manager.show_completed_task()
+                    menu_page_tasks(manager, is_complete=True)
                 case 3:
-                    manager.show_uncompleted_task()
+                    menu_page_tasks(manager, is_complete=False)
                 case 4:
                     menu_add_new_task(manager)
                 case 5:
@@ -160,8 +487,55 @@ if __name__ == "__main__":
                     task_to_complete: int = int(input("Enter task ID you want to mark complete: "))
                     manager.set_complete(task_to_complete)
                 case 8:
+                    menu_search_tasks(manager)
+                case 9:
                     print("Exiting program ...")
         except ValueError:
             print("Invalid input, please enter numeric input.")
+        except StorageError as error:
+            presenter.show_error(error)
+
 
-    manager.close_connection()
+if __name__ == "__main__":
+    arguments = parse_args()
+    exit_status: int = 0
+    results: TextIO = sys.stdout
+    scripting: bool = arguments.command in BATCH_OPS or arguments.command == "batch"
+    # Scripting commands keep stdout for their results, status messages go to stderr
+    log_handler = configure_logging()
+    with redirect_stdout(sys.stderr if scripting else sys.stdout):
+        # Nothing connects until the first query, which the menu runs in the background
+        manager = TaskManager(lazy=True)
+        try:
+            match arguments.command:
+                case "import":
+                    run_import(manager, arguments)
+                case "export":
+                    run_export(manager, arguments)
+                case "archive":
+                    exit_status = run_archive(manager, arguments)
+                case command if scripting:
+                    exit_status = run_command(manager, arguments, results)
+                case _:
+                    scheduler = None
+                    if arguments.reminders:
+                        from todo.reminders import ReminderScheduler, print_reminder
+                        scheduler = ReminderScheduler(manager, [print_reminder])
+                        scheduler.start()
+                    try:
+                        run_menu(manager, profile_startup=arguments.profile_startup)
+                    finally:
+                        if scheduler is not None:
+                            scheduler.stop()
+        except StorageError as error:
+            presenter.show_error(error)
+            exit_status = 1
+        finally:
+            try:
+                manager.close_connection()
+            except StorageError as error:
+                # Writes still queued for write-behind could not be applied
+                presenter.show_error(error)
+                exit_status = 1
+            remove_log_sink(log_handler)
+    sys.exit(exit_status)
@@ -0,0 +1,25 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/helpers.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Task factory shared by the unit tests
+############################################################
+
+from datetime import datetime, timedelta
+
+from todo.task import Task
+
+BASE = datetime(2025, 6, 16, 9, 0)
+MINUTE = timedelta(minutes=1)
+DAY = timedelta(days=1)
+
+
+# Task due the given time after BASE, or without a due date when due is None. Unless created_at is
+# given it is created up to four minutes after BASE depending on the id, so creation order is not id order
+def make_task(task_id, title=None, due=DAY, is_complete=False, note=None, created_at=None):
+    if created_at is None:
+        created_at = BASE + (task_id % 5) * MINUTE
+    return Task(task_id, title or f"Task {task_id}", created_at, BASE + due if due is not None else None,
+                is_complete, note)
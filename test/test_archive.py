@@ -0,0 +1,115 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_archive.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for archiving completed tasks into monthly partitions
+############################################################
+
+from datetime import date, datetime, timedelta, timezone
+import os
+import threading
+
+import pytest
+
+from db_config import archive
+from db_config.archive import add_months, partition_name
+from db_config.memory_store import MemoryTaskStore
+from todo.task_manager import TaskManager
+from .helpers import make_task
+
+
+def test_add_months():
+    assert add_months(date(2025, 6, 16), 0) == date(2025, 6, 1)
+    assert add_months(date(2025, 6, 16), 7) == date(2026, 1, 1)
+    assert add_months(date(2025, 1, 31), -1) == date(2024, 12, 1)
+    assert add_months(date(2025, 3, 1), -14) == date(2024, 1, 1)
+    assert partition_name(date(2025, 6, 16)) == "task_archive_2025_06"
+
+
+def test_backend_without_archive():
+    manager = TaskManager(store=MemoryTaskStore(), write_behind=False)
+    manager.add_task(make_task(1, is_complete=True))
+    assert manager.archive_completed(0) is None
+    assert manager.archived_tasks() == []
+    assert manager.restore_task(1) is False
+    assert manager.drop_archived(0) is None
+    assert manager.count_total_tasks() == 1
+
+
+def test_archive_and_retention():
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to archive tasks in Postgres")
+    manager = TaskManager(pooled=True, write_behind=False, lazy=False)
+    db = manager.store.db
+    now = datetime.now(timezone.utc)
+    old_month = add_months(now.date(), -14)
+    try:
+        with db.cursor() as cur:
+            cur.execute("TRUNCATE tasks")
+            cur.execute("DELETE FROM task_archive")
+        for task_id in range(1, 7):
+            manager.add_task(make_task(task_id))
+        for task_id in range(1, 6):
+            manager.set_complete(task_id)
+        # Tasks 1 and 2 were completed 14 months ago, 3 and 4 forty days ago, 5 just now and 6 is open
+        with db.cursor() as cur:
+            cur.execute("UPDATE tasks SET completed_at = %s WHERE task_id IN (1, 2)",
+                        (datetime(old_month.year, old_month.month, 2, tzinfo=timezone.utc),))
+            cur.execute("UPDATE tasks SET completed_at = %s WHERE task_id IN (3, 4)", (now - timedelta(days=40),))
+            cur.execute("SELECT completed_at IS NOT NULL FROM tasks WHERE task_id = 5")
+            assert cur.fetchone()[0] is True
+
+        feed = manager.change_feed()
+        assert manager.archive_completed(30, batch_size=3) == 4
+        assert sorted(task.task_id for task in manager.iter_tasks()) == [5, 6]
+        assert manager.stats().total == 2
+        assert [(event.op, event.task_id) for event in feed.read()] == \
+               [("archive", 1), ("archive", 2), ("archive", 3), ("archive", 4)]
+        feed.close()
+        assert manager.archive_completed(30) == 0
+
+        assert [task.task_id for task in manager.archived_tasks()] == [3, 4, 1, 2]
+        assert [task.task_id for task in manager.archived_tasks(completed_before=now - timedelta(days=60))] == [1, 2]
+        assert all(task.is_complete for task in manager.archived_tasks(limit=1))
+
+        # Restoring brings the task back with its completion time, once
+        assert manager.restore_task(3) is True
+        assert manager.restore_task(3) is False
+        assert manager.get_task(3).is_complete is True
+        assert [task.task_id for task in manager.archived_tasks()] == [4, 1, 2]
+
+        assert manager.drop_archived(12) == [partition_name(old_month)]
+        assert [task.task_id for task in manager.archived_tasks()] == [4]
+    finally:
+        manager.close_connection()
+
+
+def test_shared_connection_is_free_during_pauses(monkeypatch):
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to archive tasks in Postgres")
+    manager = TaskManager(pooled=False, write_behind=False, lazy=False)
+    db = manager.store.db
+    pauses = []
+
+    # Another thread must get the shared connection while the archiver waits between batches
+    def sleep(seconds):
+        reader = threading.Thread(target=lambda: pauses.append(db.fetch_value("SELECT COUNT(*) FROM tasks")))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    monkeypatch.setattr(archive.time, "sleep", sleep)
+    try:
+        with db.cursor() as cur:
+            cur.execute("TRUNCATE tasks")
+            cur.execute("DELETE FROM task_archive")
+        for task_id in range(1, 6):
+            manager.add_task(make_task(task_id, is_complete=True))
+        with db.cursor() as cur:
+            cur.execute("UPDATE tasks SET completed_at = %s", (datetime.now(timezone.utc) - timedelta(days=40),))
+        assert manager.archive_completed(30, batch_size=2, pause=0.01) == 5
+        assert pauses == [3, 1]
+    finally:
+        manager.close_connection()
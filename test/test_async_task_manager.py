@@ -0,0 +1,111 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_async_task_manager.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the asyncio task manager
+############################################################
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import asyncpg
+import pytest
+
+from db_config.errors import StorageError
+from db_config.migrations import MIGRATIONS
+from todo.async_task_manager import AsyncTaskManager, numbered_params
+from todo.results import ALREADY_COMPLETE, COMPLETED, DELETED, EXISTS, INSERTED, NOT_FOUND
+from todo.task import Task
+
+
+# Create an async manager on a mock pool
+@pytest.fixture
+def async_manager():
+    pool = MagicMock()
+    pool.fetchval = AsyncMock()
+    pool.fetchrow = AsyncMock()
+    pool.fetch = AsyncMock()
+    return AsyncTaskManager(pool)
+
+
+@pytest.fixture
+def mock_task():
+    return Task(1, "Test Task", datetime.now(), datetime(2025, 6, 20, 12, 0), False, "Mock note")
+
+
+def test_numbered_params():
+    assert numbered_params("a = %s AND (b, c) > (%s, %s) LIMIT %s") == "a = $1 AND (b, c) > ($2, $3) LIMIT $4"
+
+
+def test_add_task(async_manager, mock_task):
+    async_manager.pool.fetchval.return_value = 1
+    result = asyncio.run(async_manager.add_task(mock_task))
+    assert result.status == INSERTED
+    assert result.title == "Test Task"
+    async_manager.pool.fetchval.return_value = None
+    assert asyncio.run(async_manager.add_task(mock_task)).status == EXISTS
+
+
+def test_get_task(async_manager, mock_task):
+    async_manager.pool.fetchrow.return_value = (1, "Test Task", mock_task.created_at, mock_task.due_date, False, None)
+    task = asyncio.run(async_manager.get_task(1))
+    assert task.title == "Test Task"
+    async_manager.pool.fetchrow.return_value = None
+    assert asyncio.run(async_manager.get_task(2)) is None
+
+
+def test_delete_task(async_manager, mock_task):
+    async_manager.pool.fetchrow.return_value = (1, "Test Task", mock_task.created_at, mock_task.due_date, False, None)
+    result = asyncio.run(async_manager.delete_task(1))
+    assert result.status == DELETED
+    assert result.task.title == "Test Task"
+    async_manager.pool.fetchrow.return_value = None
+    assert asyncio.run(async_manager.delete_task(2)).status == NOT_FOUND
+
+
+def test_set_complete(async_manager):
+    async_manager.pool.fetchrow.return_value = ("Test Task", False)
+    result = asyncio.run(async_manager.set_complete(1))
+    assert (result.status, result.title) == (COMPLETED, "Test Task")
+    async_manager.pool.fetchrow.return_value = ("Test Task", True)
+    assert asyncio.run(async_manager.set_complete(1)).status == ALREADY_COMPLETE
+    async_manager.pool.fetchrow.return_value = None
+    assert not asyncio.run(async_manager.set_complete(1)).ok
+
+
+def test_driver_errors_raise_storage_error(async_manager, mock_task):
+    async_manager.pool.fetchval.side_effect = asyncpg.PostgresError("server closed the connection")
+    with pytest.raises(StorageError) as raised:
+        asyncio.run(async_manager.add_task(mock_task))
+    assert isinstance(raised.value.__cause__, asyncpg.PostgresError)
+    with pytest.raises(StorageError):
+        asyncio.run(async_manager.count_total_tasks())
+
+
+def test_migrate_uses_shared_runner(async_manager):
+    conn = MagicMock()
+    with patch("todo.async_task_manager.psycopg2.connect", return_value=conn), \
+            patch("todo.async_task_manager.migrate_schema", return_value=list(MIGRATIONS[-1:])) as migrate_schema:
+        assert asyncio.run(async_manager.migrate()) == [MIGRATIONS[-1].version]
+    migrate_schema.assert_called_once_with(conn)
+    conn.close.assert_called_once()
+
+    with patch("todo.async_task_manager.psycopg2.connect", side_effect=OSError("server is down")):
+        with pytest.raises(StorageError):
+            asyncio.run(async_manager.migrate())
+
+
+def test_list_tasks_uses_numbered_params(async_manager, mock_task):
+    row = (1, "Test Task", mock_task.created_at, mock_task.due_date, False, None)
+    async_manager.pool.fetch.return_value = [row, row]
+    page = asyncio.run(async_manager.list_tasks(is_complete=False, page_size=1))
+
+    assert len(page.tasks) == 1
+    assert page.next_cursor is not None
+    query, *params = async_manager.pool.fetch.call_args.args
+    assert "is_complete = $1" in query
+    assert "LIMIT $2" in query
+    assert params == [False, 2]
@@ -0,0 +1,105 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_batch.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the newline-delimited JSON batch runner
+############################################################
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+from db_config.memory_store import MemoryTaskStore
+from todo.batch import RESULT_FIELDS, BatchRunner, RecordWriter
+from todo.task import Task
+from todo.task_manager import TaskManager
+
+
+@pytest.fixture
+def manager():
+    manager = TaskManager(store=MemoryTaskStore(), write_behind=False)
+    yield manager
+    manager.close_connection()
+
+
+def run(manager, operations, batch_size=500):
+    return list(BatchRunner(manager, batch_size=batch_size).run(json.dumps(op) for op in operations))
+
+
+def test_writes_are_batched(manager):
+    with patch.object(manager.store, "apply_writes", wraps=manager.store.apply_writes) as apply_writes:
+        results = run(manager, [{"op": "add", "task_id": task_id, "title": f"Task {task_id}"}
+                                for task_id in range(1, 6)] + [{"op": "complete", "task_id": 1}], batch_size=4)
+    assert [len(call.args[0]) for call in apply_writes.call_args_list] == [4, 2]
+    assert [result["line"] for result in results] == [1, 2, 3, 4, 5, 6]
+    assert all(result["ok"] for result in results)
+    assert results[5]["result"] == {"title": "Task 1", "already_complete": False}
+
+
+def test_reads_see_earlier_writes(manager):
+    results = run(manager, [
+        {"op": "add", "task_id": 1, "title": "Buy milk", "due_date": "2025-06-20T12:00:00"},
+        {"op": "get", "task_id": 1},
+        {"op": "update", "task_id": 1, "note": "oat"},
+        {"op": "complete", "task_id": 1},
+        {"op": "stats"},
+        {"op": "list", "is_complete": True},
+        {"op": "delete", "task_id": 1},
+        {"op": "get", "task_id": 1},
+    ])
+    assert results[1]["result"]["title"] == "Buy milk"
+    assert results[2] == {"line": 3, "op": "update", "task_id": 1, "ok": True}
+    assert results[4]["result"]["completed"] == 1
+    assert [task["note"] for task in results[5]["result"]["tasks"]] == ["oat"]
+    assert results[6]["result"]["due_date"] == "2025-06-20T12:00:00"
+    assert results[7] == {"line": 8, "op": "get", "task_id": 1, "ok": False, "error": "not found"}
+
+
+def test_full_update_is_batched(manager):
+    manager.store.insert(Task(1, "Old", None, None, False, None))
+    with patch.object(manager, "get_task", wraps=manager.get_task) as get_task:
+        results = run(manager, [{"op": "update", "task_id": 1, "title": "New", "created_at": None, "due_date": None,
+                                 "is_complete": False, "note": None}])
+    assert results[0]["ok"] is True
+    get_task.assert_not_called()
+    assert manager.store.get(1).title == "New"
+
+
+def test_failed_outcomes_and_invalid_lines(manager):
+    results = list(BatchRunner(manager).run([
+        json.dumps({"op": "add", "task_id": 1, "title": "A"}),
+        json.dumps({"op": "add", "task_id": 1, "title": "A again"}),
+        "",
+        "not json",
+        json.dumps({"op": "explode"}),
+        json.dumps({"op": "delete"}),
+        json.dumps({"op": "list", "order_by": "title"}),
+        json.dumps({"op": "complete", "task_id": 7}),
+    ]))
+    assert [(result["line"], result["ok"]) for result in results] == [(1, True), (2, False), (4, False), (5, False),
+                                                                      (6, False), (7, False), (8, False)]
+    assert results[1]["error"] == "exists"
+    assert results[2]["error"].startswith("invalid")
+    assert results[6]["error"] == "not found"
+
+
+def test_failed_transaction_reports_every_write(manager):
+    with patch.object(manager.store, "apply_writes", side_effect=RuntimeError("disk full")):
+        results = run(manager, [{"op": "add", "task_id": 1, "title": "A"}, {"op": "delete", "task_id": 2}])
+    assert [(result["ok"], result["error"]) for result in results] == [(False, "disk full"), (False, "disk full")]
+    assert manager.store.count() == 0
+
+
+def test_record_writer_csv():
+    stream = io.StringIO()
+    writer = RecordWriter(stream, "csv", RESULT_FIELDS)
+    writer.write({"line": 1, "op": "complete", "task_id": 3, "ok": True,
+                  "result": {"title": "A", "already_complete": False}})
+    assert stream.getvalue().splitlines() == ["line,op,task_id,ok,error,result",
+                                              '1,complete,3,True,,"{""title"": ""A"", ""already_complete"": false}"']
+    with pytest.raises(ValueError):
+        RecordWriter(stream, "xml", RESULT_FIELDS)
@@ -0,0 +1,128 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_change_feed.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the change log cursor and the change feed consumers
+############################################################
+
+import asyncio
+from datetime import datetime
+import os
+import threading
+
+import pytest
+
+from db_config.change_feed import LATEST_CHANGE, ChangeCursor
+from db_config.memory_store import MemoryTaskStore
+from todo.task_manager import TaskManager
+from .helpers import make_task
+
+CHANGED_AT = datetime(2025, 6, 16, 10, 0)
+
+
+def rows(xmin, xmax, *seqs):
+    if not seqs:
+        return [(xmin, xmax, None, None, None, None, None)]
+    return [(xmin, xmax, seq, seq, "insert", False, CHANGED_AT) for seq in seqs]
+
+
+def test_cursor_delivers_in_order():
+    cursor = ChangeCursor(0)
+    assert [event.seq for event in cursor.advance(rows(100, 100, 1, 2, 3))] == [1, 2, 3]
+    assert cursor.position == 3
+    assert cursor.advance(rows(100, 100)) == []
+    assert cursor.position == 3
+
+
+def test_cursor_waits_for_running_transactions():
+    cursor = ChangeCursor(3)
+    # Sequence 4 is missing while transaction 100 is still running, 5 is held back
+    assert cursor.advance(rows(100, 105, 5)) == []
+    assert cursor.advance(rows(102, 106, 5, 6)) == []
+    # Transaction that took 4 committed
+    assert [event.seq for event in cursor.advance(rows(103, 106, 4, 5, 6))] == [4, 5, 6]
+
+    # Sequence 7 was rolled back: once every transaction running when the gap was seen has ended,
+    # the events after it are delivered
+    assert cursor.advance(rows(106, 108, 8)) == []
+    assert [event.seq for event in cursor.advance(rows(108, 110, 8, 9))] == [8, 9]
+    # A gap with no transaction running is permanent
+    assert [event.seq for event in cursor.advance(rows(110, 110, 11))] == [11]
+
+
+def test_backend_without_change_log():
+    manager = TaskManager(store=MemoryTaskStore(), write_behind=False)
+    assert manager.change_feed() is None
+
+
+def open_manager():
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to read the change log of Postgres")
+    manager = TaskManager(pooled=True, write_behind=False, lazy=False)
+    with manager.store.db.cursor() as cur:
+        cur.execute("TRUNCATE tasks")
+    return manager
+
+
+def test_feed_follows_writes():
+    manager = open_manager()
+    feed = manager.change_feed()
+    try:
+        start = feed.position
+        manager.add_task(make_task(1))
+        manager.add_task(make_task(2))
+        manager.update_task(make_task(1, "Renamed"))
+        manager.set_complete(2)
+        manager.delete_task(1)
+        received = []
+        for event in feed:
+            received.append((event.op, event.task_id, event.is_complete))
+            if len(received) == 5:
+                break
+        assert received == [("insert", 1, False), ("insert", 2, False), ("update", 1, False),
+                            ("complete", 2, True), ("delete", 1, None)]
+
+        # A new feed resumes after the given sequence number
+        resumed = manager.change_feed(after=start + 3)
+        assert [(event.op, event.task_id) for event in resumed.read()] == [("complete", 2), ("delete", 1)]
+        resumed.close()
+
+        # A blocked iterator is woken by the notification of a commit in another thread
+        writer = threading.Timer(0.2, manager.add_task, (make_task(3),))
+        writer.start()
+        event = next(iter(feed))
+        writer.join()
+        assert (event.op, event.task_id) == ("insert", 3)
+    finally:
+        feed.close()
+        manager.close_connection()
+
+
+def test_async_feed():
+    manager = open_manager()
+
+    async def consume():
+        from todo.async_task_manager import AsyncTaskManager
+        async_manager = await AsyncTaskManager.create(min_size=1, max_size=2)
+        try:
+            position = await async_manager.pool.fetchval(LATEST_CHANGE)
+            await asyncio.to_thread(manager.add_task, make_task(1))
+            changes = async_manager.changes(after=position)
+            first = await asyncio.wait_for(anext(changes), 5)
+            # The next event is read after the consumer waits for it
+            writer = asyncio.get_running_loop().call_later(0.2, manager.set_complete, 1)
+            second = await asyncio.wait_for(anext(changes), 5)
+            writer.cancel()
+            await changes.aclose()
+            return first, second
+        finally:
+            await async_manager.close()
+
+    try:
+        first, second = asyncio.run(consume())
+        assert (first.op, first.task_id) == ("insert", 1)
+        assert (second.op, second.task_id, second.is_complete) == ("complete", 1, True)
+    finally:
+        manager.close_connection()
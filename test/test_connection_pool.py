@@ -0,0 +1,116 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_connection_pool.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the connection pool
+############################################################
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import psycopg2.extensions
+import pytest
+
+from db_config.connection_pool import ConnectionPool, PoolError
+
+
+def make_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    return conn
+
+
+# Patch psycopg2.connect so every call returns a new mock connection
+@pytest.fixture
+def mock_connect():
+    with patch("db_config.connection_pool.psycopg2.connect", side_effect=lambda **kwargs: make_connection()) as connect:
+        yield connect
+
+
+def test_opens_min_connections(mock_connect):
+    pool = ConnectionPool(min_size=2, max_size=4)
+    assert mock_connect.call_count == 2
+    assert pool.stats()["idle"] == 2
+    assert pool.stats()["in_use"] == 0
+
+
+def test_checkout_and_return_updates_stats(mock_connect):
+    pool = ConnectionPool(min_size=1, max_size=2)
+    with pool.connection():
+        stats = pool.stats()
+        assert stats["in_use"] == 1
+        assert stats["idle"] == 0
+    stats = pool.stats()
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+    assert stats["checkouts"] == 1
+
+
+def test_reuses_returned_connection(mock_connect):
+    pool = ConnectionPool(min_size=1, max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    assert mock_connect.call_count == 1
+
+
+def test_timeout_when_exhausted(mock_connect):
+    pool = ConnectionPool(min_size=0, max_size=1, timeout=0.05)
+    conn = pool.getconn()
+    with pytest.raises(PoolError):
+        pool.getconn()
+    pool.putconn(conn)
+
+
+def test_waiting_checkout_is_recorded(mock_connect):
+    pool = ConnectionPool(min_size=1, max_size=1, timeout=5)
+    conn = pool.getconn()
+    timer = threading.Timer(0.05, pool.putconn, args=(conn,))
+    timer.start()
+    with pool.connection() as reused:
+        assert reused is conn
+    timer.join()
+    stats = pool.stats()
+    assert stats["waits"] == 1
+    assert stats["max_wait_time"] > 0
+
+
+def test_closed_connection_is_replaced(mock_connect):
+    pool = ConnectionPool(min_size=1, max_size=1)
+    with pool.connection() as conn:
+        pass
+    conn.closed = 1
+    with pool.connection() as replacement:
+        assert replacement is not conn
+    assert pool.stats()["replaced"] == 1
+
+
+def test_stale_connection_failing_ping_is_replaced(mock_connect):
+    pool = ConnectionPool(min_size=1, max_size=1, check_interval=0)
+    with pool.connection() as conn:
+        pass
+    conn.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError
+    with pool.connection() as replacement:
+        assert replacement is not conn
+    assert pool.stats()["size"] == 1
+
+
+def test_broken_connection_is_discarded(mock_connect):
+    pool = ConnectionPool(min_size=1, max_size=1)
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection():
+            raise psycopg2.OperationalError("server closed the connection")
+    stats = pool.stats()
+    assert stats["size"] == 0
+    assert stats["idle"] == 0
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        ConnectionPool(min_size=3, max_size=2)
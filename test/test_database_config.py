@@ -0,0 +1,139 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_database_config.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for lazy connections and the cached schema check
+############################################################
+
+from unittest.mock import MagicMock, patch
+import os
+import threading
+
+import psycopg2
+import psycopg2.errors
+import pytest
+
+from db_config import database_config
+from db_config.database_config import DatabaseConfig
+from db_config.errors import StorageError
+from db_config.migrations import LATEST_VERSION
+
+
+def make_connection(schema_version):
+    conn = MagicMock()
+    cur = conn.cursor.return_value
+    cur.__enter__.return_value = cur
+    cur.fetchone.side_effect = lambda: (True,) if "to_regclass" in cur.execute.call_args.args[0] \
+        else (schema_version,)
+    return conn
+
+
+@pytest.fixture
+def mock_connect(monkeypatch):
+    monkeypatch.setenv("DB_HOST", "lazy-test-host")
+    monkeypatch.setattr(database_config, "_current_schemas", set())
+    with patch("db_config.database_config.psycopg2.connect",
+               side_effect=lambda **kwargs: make_connection(LATEST_VERSION)) as connect:
+        yield connect
+
+
+def executed(conn):
+    return [call.args[0] for call in conn.cursor.return_value.execute.call_args_list]
+
+
+def test_lazy_connects_on_first_use(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=True)
+    assert mock_connect.call_count == 0
+    assert db.connected is False
+
+    with db.cursor() as cur:
+        assert cur is db.cur
+    with db.cursor():
+        pass
+    assert mock_connect.call_count == 1
+    assert db.connected is True
+
+
+def test_eager_connects_in_constructor(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False)
+    assert mock_connect.call_count == 1
+    assert db.connected is True
+
+
+def test_current_schema_skips_migration_lock(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False)
+    statements = executed(db.conn)
+    assert not any("advisory" in statement for statement in statements)
+
+    # A second configuration for the same database does not check again
+    other = DatabaseConfig(pooled=False, lazy=False)
+    assert executed(other.conn) == []
+
+
+def test_outdated_schema_is_migrated(mock_connect):
+    mock_connect.side_effect = lambda **kwargs: make_connection(LATEST_VERSION - 1)
+    with patch("db_config.migrations.apply_migrations", return_value=[]) as apply:
+        DatabaseConfig(pooled=False, lazy=False)
+        DatabaseConfig(pooled=False, lazy=False)
+    assert apply.call_count == 1
+
+
+def test_lazy_retries_after_failure(mock_connect, caplog):
+    mock_connect.side_effect = psycopg2.OperationalError("server is down")
+    db = DatabaseConfig(pooled=False, lazy=True)
+    with pytest.raises(StorageError) as raised:
+        db.fetch_row("SELECT 1")
+    assert "server is down" in str(raised.value.__cause__.__cause__)
+    assert "Database connection failed: server is down" in caplog.text
+
+    mock_connect.side_effect = lambda **kwargs: make_connection(LATEST_VERSION)
+    db.fetch_row("SELECT 1")
+    assert db.connected is True
+
+
+def test_closed_config_does_not_reconnect(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=True)
+    db.close()
+    with pytest.raises(StorageError):
+        db.fetch_row("SELECT 1")
+    assert mock_connect.call_count == 0
+
+
+def test_query_errors_raise(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False)
+    db.cur.execute.side_effect = psycopg2.errors.UndefinedTable("relation does not exist")
+    # An error is never mistaken for a missing row
+    with pytest.raises(StorageError, match="Error fetching value") as raised:
+        db.fetch_value("SELECT 1 FROM missing")
+    assert isinstance(raised.value.__cause__, psycopg2.errors.UndefinedTable)
+    with pytest.raises(StorageError):
+        db.insert_task("INSERT INTO missing VALUES (1) RETURNING 1")
+
+
+def test_execute_query_returns_rowcount(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False)
+    db.cur.rowcount = 3
+    assert db.execute_query("UPDATE tasks SET note = NULL") == 3
+
+
+def test_stream_closed_early_releases_connection():
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to stream tasks from Postgres")
+    db = DatabaseConfig(pooled=False, lazy=False)
+    try:
+        stream = db.stream_tasks("SELECT g, 'Task', now()::timestamp, NULL::timestamp, FALSE, NULL "
+                                 "FROM generate_series(1, 10) g", itersize=2)
+        assert next(stream).task_id == 1
+        stream.close()
+        # The transaction of the named cursor is gone and other threads get the shared connection
+        assert db.conn.autocommit is True
+        assert db.conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        values = []
+        reader = threading.Thread(target=lambda: values.append(db.fetch_value("SELECT 1")))
+        reader.start()
+        reader.join(timeout=5)
+        assert values == [1]
+    finally:
+        db.close()
@@ -0,0 +1,72 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_log_sink.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the buffered logging sink
+############################################################
+
+import io
+import logging
+import time
+
+from todo.log_sink import configure_logging, install_log_sink, remove_log_sink
+
+logger = logging.getLogger("db_config.test_sink")
+
+
+def test_sink_buffers_until_capacity():
+    out = io.StringIO()
+    sink = install_log_sink(stream=out, capacity=3, flush_interval=None)
+    try:
+        logger.info("first")
+        logger.info("second")
+        assert out.getvalue() == ""
+        logger.info("third")
+        assert [line.split(": ", 1)[1] for line in out.getvalue().splitlines()] == ["first", "second", "third"]
+    finally:
+        remove_log_sink(sink)
+
+
+def test_sink_flushes_on_error_and_close():
+    out = io.StringIO()
+    sink = install_log_sink(stream=out, capacity=100, flush_interval=None)
+    try:
+        logger.info("connected")
+        logger.error("connection lost")
+        assert "connected" in out.getvalue() and "ERROR db_config.test_sink: connection lost" in out.getvalue()
+        logger.info("reconnected")
+    finally:
+        remove_log_sink(sink)
+    assert "reconnected" in out.getvalue()
+    # Detached, later records are not written
+    logger.warning("after")
+    assert "after" not in out.getvalue()
+
+
+def test_sink_flushes_in_background():
+    out = io.StringIO()
+    sink = install_log_sink(stream=out, capacity=100, flush_interval=0.01)
+    try:
+        logger.info("queued")
+        deadline = time.monotonic() + 2
+        while not out.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "queued" in out.getvalue()
+    finally:
+        remove_log_sink(sink)
+
+
+def test_configure_logging_writes_file(monkeypatch, tmp_path):
+    path = tmp_path / "todo.log"
+    monkeypatch.setenv("TODO_LOG_FILE", str(path))
+    monkeypatch.setenv("TODO_LOG_LEVEL", "info")
+    handler = configure_logging()
+    try:
+        logging.getLogger("todo.test_sink").info("written to the file")
+        logging.getLogger("todo.test_sink").debug("below the level")
+    finally:
+        remove_log_sink(handler)
+    text = path.read_text(encoding="utf-8")
+    assert "written to the file" in text and "below the level" not in text
@@ -0,0 +1,119 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_migrations.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the schema migrations
+############################################################
+
+from unittest.mock import MagicMock
+import os
+
+import psycopg2
+import pytest
+
+from db_config.database_config import get_connection_params
+from db_config.migrations import LATEST_VERSION, MIGRATIONS, apply_migrations, migrate_schema, schema_is_current
+
+
+# Mock connection whose schema_migrations table holds the given versions
+def make_connection(applied_versions):
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchall.return_value = [(version,) for version in applied_versions]
+    return conn, cur
+
+
+def executed_statements(cur):
+    return [call.args[0] for call in cur.execute.call_args_list]
+
+
+def test_versions_are_unique_and_ordered():
+    versions = [migration.version for migration in MIGRATIONS]
+    assert versions == sorted(set(versions))
+    assert LATEST_VERSION == versions[-1]
+
+
+def test_applies_all_on_empty_database():
+    conn, cur = make_connection([])
+    applied = apply_migrations(conn)
+
+    assert [migration.version for migration in applied] == [migration.version for migration in MIGRATIONS]
+    statements = executed_statements(cur)
+    assert statements[0].startswith("SELECT pg_advisory_lock")
+    assert statements[-1].startswith("SELECT pg_advisory_unlock")
+    assert conn.autocommit is True
+
+
+def test_skips_applied_versions():
+    conn, cur = make_connection([migration.version for migration in MIGRATIONS])
+    assert apply_migrations(conn) == []
+    assert not any(statement.startswith("INSERT INTO schema_migrations") for statement in executed_statements(cur))
+
+
+def test_unlocks_on_failure():
+    conn, cur = make_connection([])
+    cur.execute.side_effect = lambda query, params=None: (_ for _ in ()).throw(RuntimeError("boom")) \
+        if query.startswith("CREATE INDEX") else None
+    with pytest.raises(RuntimeError):
+        apply_migrations(conn)
+    assert executed_statements(cur)[-1].startswith("SELECT pg_advisory_unlock")
+    assert conn.autocommit is True
+
+
+def test_schema_is_current():
+    conn, cur = make_connection([])
+    cur.fetchone.side_effect = [(True,), (LATEST_VERSION,)]
+    assert schema_is_current(conn) is True
+    assert not any("advisory" in statement for statement in executed_statements(cur))
+
+    cur.fetchone.side_effect = [(True,), (LATEST_VERSION - 1,)]
+    assert schema_is_current(conn) is False
+
+    cur.fetchone.side_effect = [(False,)]
+    assert schema_is_current(conn) is False
+
+
+def test_migrate_schema_checks_version_before_locking():
+    conn, cur = make_connection([])
+    cur.fetchone.side_effect = [(True,), (LATEST_VERSION,)]
+    assert migrate_schema(conn) == []
+    assert not any("advisory" in statement for statement in executed_statements(cur))
+
+    cur.fetchone.side_effect = [(False,)]
+    assert [migration.version for migration in migrate_schema(conn)] == [migration.version for migration in MIGRATIONS]
+    assert executed_statements(cur)[-1].startswith("SELECT pg_advisory_unlock")
+
+
+
+@pytest.mark.parametrize("errcode", ["insufficient_privilege", "duplicate_object"])
+def test_trigram_index_skipped_when_extension_cannot_be_created(errcode):
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to run the migration in Postgres")
+    trigram = next(migration for migration in MIGRATIONS if migration.version == 6)
+    conn = psycopg2.connect(**get_connection_params())
+    try:
+        # Everything below is rolled back. pg_trgm is listed as available whether the server ships it or
+        # not, and an event trigger rejects CREATE EXTENSION the way a server without the privilege does
+        with conn.cursor() as cur:
+            cur.execute("DROP EXTENSION IF EXISTS pg_trgm CASCADE")
+            cur.execute("CREATE SCHEMA todo_trgm_test")
+            cur.execute("CREATE VIEW todo_trgm_test.pg_available_extensions AS SELECT 'pg_trgm'::name AS name")
+            cur.execute("CREATE FUNCTION todo_trgm_test.reject_extension() RETURNS event_trigger "
+                        "LANGUAGE plpgsql AS $$ BEGIN "
+                        f"RAISE EXCEPTION 'cannot create extension' USING ERRCODE = '{errcode}'; "
+                        "END $$")
+            cur.execute("CREATE EVENT TRIGGER todo_trgm_test ON ddl_command_start WHEN TAG IN ('CREATE EXTENSION') "
+                        "EXECUTE FUNCTION todo_trgm_test.reject_extension()")
+            cur.execute("SET LOCAL search_path = todo_trgm_test, pg_catalog")
+            cur.execute("CREATE TABLE tasks (task_id INT PRIMARY KEY, title VARCHAR(255))")
+            for statement in trigram.statements:
+                cur.execute(statement)
+            cur.execute("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'), "
+                        "EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'tasks_title_trgm_idx' "
+                        "AND schemaname = 'todo_trgm_test')")
+            assert cur.fetchone() == (False, False)
+    finally:
+        conn.rollback()
+        conn.close()
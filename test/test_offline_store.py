@@ -0,0 +1,126 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_offline_store.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the local replica's change journal and sync with Postgres
+############################################################
+
+from datetime import datetime, timedelta, timezone
+import os
+import time
+
+import psycopg2
+import pytest
+
+from db_config.offline_store import OfflineTaskStore, TaskSync
+from .helpers import make_task
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = OfflineTaskStore(str(tmp_path / "local.db"), sync=False)
+    yield store
+    store.close()
+
+
+def remote_row(task, updated_at, deleted=False):
+    return (task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note, updated_at,
+            deleted)
+
+
+def test_writes_are_journaled(store):
+    store.insert(make_task(1))
+    store.insert(make_task(2))
+    store.update(make_task(1, "Renamed"))
+    store.complete(2)
+    store.delete(2)
+    assert store.pending_changes() == 2
+
+    seq, upserts, deletes = store.changes(100)
+    assert [task.title for task, _ in upserts] == ["Renamed"]
+    assert [task_id for task_id, _ in deletes] == [2]
+    store.acknowledge(seq)
+    assert store.pending_changes() == 0
+    assert store.changes(100) == (0, [], [])
+
+
+def test_apply_remote_is_not_journaled(store):
+    now = datetime.now(timezone.utc)
+    assert store.apply_remote([remote_row(make_task(1), now), remote_row(make_task(2), now)]) == 2
+    assert store.get(1).title == "Task 1"
+    assert store.pending_changes() == 0
+    # The same rows again change nothing, a deletion removes the task
+    assert store.apply_remote([remote_row(make_task(1), now), remote_row(make_task(2), now, deleted=True)]) == 1
+    assert store.get(2) is None
+    assert store.pending_changes() == 0
+
+
+def test_last_writer_wins(store):
+    store.insert(make_task(1, "Local"))
+    store.insert(make_task(2, "Local"))
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    future = datetime.now(timezone.utc) + timedelta(minutes=5)
+    store.apply_remote([remote_row(make_task(1, "Older remote"), past),
+                        remote_row(make_task(2, "Newer remote"), future)])
+    assert store.get(1).title == "Local"
+    assert store.get(2).title == "Newer remote"
+    # The local change that lost is no longer pushed
+    _, upserts, _ = store.changes(100)
+    assert [task.task_id for task, _ in upserts] == [1]
+
+
+def test_sync_cursor(store):
+    assert store.sync_cursor() == 0
+    store.set_sync_cursor(1234)
+    assert store.sync_cursor() == 1234
+
+
+def test_offline_keeps_changes(store):
+    sync = TaskSync(store, host="/nonexistent", port=1, user="todo", database="todo", connect_timeout=1)
+    store.insert(make_task(1))
+    with pytest.raises(psycopg2.OperationalError):
+        sync.sync_now()
+    assert sync.status()["online"] is False
+    assert sync.status()["pending"] == 1
+    assert store.get(1).title == "Task 1"
+
+
+def test_sync_between_clients(tmp_path):
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to sync against Postgres")
+    first = OfflineTaskStore(str(tmp_path / "first.db"), sync=False)
+    second = OfflineTaskStore(str(tmp_path / "second.db"), sync=False)
+    first_sync, second_sync = TaskSync(first, batch_size=2), TaskSync(second)
+    try:
+        conn = first_sync._connect()
+        with conn, conn.cursor() as cur:
+            cur.execute("TRUNCATE tasks, task_deletions")
+        conn.close()
+
+        for task_id in (1, 2, 3):
+            first.insert(make_task(task_id))
+        assert first_sync.sync_now() == (3, 0)
+        second_sync.sync_now()
+        assert second.count() == 3
+
+        # Both edit task 1, the later edit wins everywhere; deletes and completions reach the other client
+        first.update(make_task(1, "First"))
+        time.sleep(0.01)
+        second.update(make_task(1, "Second"))
+        second.delete(2)
+        first.complete(3)
+        second_sync.sync_now()
+        first_sync.sync_now()
+        second_sync.sync_now()
+        for store in (first, second):
+            assert [(task.task_id, task.title, task.is_complete) for task in store.iter_tasks()] == \
+                   [(1, "Second", False), (3, "Task 3", True)]
+        assert first.pending_changes() == 0 and second.pending_changes() == 0
+        assert first_sync.sync_now() == (0, 0)
+    finally:
+        first_sync.stop()
+        second_sync.stop()
+        first.close()
+        second.close()
@@ -0,0 +1,47 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_pagination.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the keyset page cursors
+############################################################
+
+from datetime import datetime
+
+import pytest
+
+from todo.pagination import decode_cursor, encode_cursor
+from todo.task import Task
+
+
+@pytest.fixture
+def last_task():
+    return Task(42, "Last on page", datetime(2025, 6, 16, 9, 30), datetime(2025, 6, 20, 12, 0), False)
+
+
+def test_cursor_round_trip(last_task):
+    cursor = encode_cursor("due_date", last_task)
+    assert decode_cursor(cursor, "due_date") == (datetime(2025, 6, 20, 12, 0), 42)
+
+
+def test_cursor_task_id_order(last_task):
+    cursor = encode_cursor("task_id", last_task)
+    assert decode_cursor(cursor, "task_id") == (42, 42)
+
+
+def test_cursor_missing_value(last_task):
+    last_task.due_date = None
+    cursor = encode_cursor("due_date", last_task)
+    assert decode_cursor(cursor, "due_date") == (None, 42)
+
+
+def test_cursor_order_mismatch(last_task):
+    cursor = encode_cursor("due_date", last_task)
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "created_at")
+
+
+def test_cursor_garbage():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor", "due_date")
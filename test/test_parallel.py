@@ -0,0 +1,115 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_parallel.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for applying task writes on a pool of worker threads
+############################################################
+
+import os
+
+import pytest
+
+from db_config.memory_store import MemoryTaskStore
+from db_config.task_store import COMPLETE, DELETE, UPDATE, WriteOp
+from todo.parallel import ParallelTaskExecutor, split_chunks
+from todo.task_manager import TaskManager
+from .helpers import make_task
+
+
+class PooledMemoryStore(MemoryTaskStore):
+    # Reports several connections and rejects writes to one task id
+    def __init__(self, failing_id=None):
+        super().__init__()
+        self.failing_id = failing_id
+
+    def max_connections(self):
+        return 4
+
+    def apply_writes(self, ops):
+        if any(op.task_id == self.failing_id for op in ops):
+            raise ValueError(f"task {self.failing_id} is locked")
+        return super().apply_writes(ops)
+
+
+@pytest.fixture
+def manager():
+    manager = TaskManager(store=PooledMemoryStore(failing_id=13), write_behind=False)
+    manager.add_tasks(make_task(task_id) for task_id in range(1, 101))
+    return manager
+
+
+def test_split_chunks_keeps_tasks_together():
+    ops = [WriteOp(UPDATE, 3), WriteOp(COMPLETE, 1), WriteOp(DELETE, 3), WriteOp(COMPLETE, 2),
+           WriteOp(COMPLETE, 3)]
+    assert split_chunks(ops, 2) == [[1, 3], [0, 2, 4]]
+    assert split_chunks(ops, 10) == [[1, 3, 0, 2, 4]]
+    assert split_chunks([], 10) == []
+
+
+def test_results_in_input_order(manager):
+    executor = ParallelTaskExecutor(manager, workers=8, chunk_size=10)
+    assert executor.workers == 4
+    task_ids = list(range(100, 0, -1)) + [500]
+    results = executor.complete(task_ids)
+    assert [result.op.task_id for result in results] == task_ids
+    # The chunk with task 13 is retried one write at a time, only task 13 fails
+    failed = [result for result in results if result.error is not None]
+    assert [(result.op.task_id, str(result.error)) for result in failed] == [(13, "task 13 is locked")]
+    assert results[-1].ok is False and results[-1].error is None
+    assert manager.count_completed_task() == 99
+
+
+def test_update_and_delete(manager):
+    executor = ParallelTaskExecutor(manager, chunk_size=7)
+    results = executor.update(make_task(task_id, "Renamed") for task_id in range(1, 51))
+    assert sum(result.ok for result in results) == 49
+    assert manager.get_task(50).title == "Renamed"
+    results = executor.delete(range(51, 101))
+    assert all(result.ok for result in results)
+    assert results[0].result.title == "Task 51"
+    assert manager.count_total_tasks() == 50
+
+
+def test_cancel_skips_remaining_chunks(manager):
+    executor = ParallelTaskExecutor(manager, workers=1, chunk_size=10)
+    progress = []
+
+    def on_progress(done, total):
+        progress.append(done)
+        executor.cancel()
+
+    results = executor.complete(range(1, 101), progress=on_progress)
+    assert progress == list(range(10, 101, 10))
+    assert all(result.ok for result in results[:10])
+    assert all(result.cancelled for result in results[10:])
+    assert manager.count_completed_task() == 10
+    # The next run starts afresh
+    assert all(result.ok for result in executor.complete(range(20, 30)))
+
+
+def test_cancel_before_run_skips_it(manager):
+    executor = ParallelTaskExecutor(manager, workers=2, chunk_size=10)
+    executor.cancel()
+    results = executor.complete(range(1, 31))
+    assert all(result.cancelled for result in results)
+    assert manager.count_completed_task() == 0
+    # The cancel only applied to that run
+    assert all(result.ok for result in executor.complete(range(1, 11)))
+
+
+def test_parallel_postgres():
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to run parallel writes against Postgres")
+    manager = TaskManager(pooled=True, write_behind=False, lazy=False)
+    try:
+        with manager.store.db.cursor() as cur:
+            cur.execute("TRUNCATE tasks")
+        manager.add_tasks(make_task(task_id) for task_id in range(1, 2001))
+        executor = ParallelTaskExecutor(manager, workers=4, chunk_size=100)
+        results = executor.complete(range(1, 2001))
+        assert all(result.ok for result in results)
+        assert manager.count_completed_task() == 2000
+    finally:
+        manager.close_connection()
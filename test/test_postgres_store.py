@@ -0,0 +1,147 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_postgres_store.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the SQL sent by the Postgres storage backend
+############################################################
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from db_config.postgres_store import PostgresTaskStore
+from todo.task import Task
+
+
+@pytest.fixture
+def store():
+    return PostgresTaskStore(db=MagicMock())
+
+
+@pytest.fixture
+def mock_task():
+    return Task(1, "Test Task", datetime(2025, 6, 16, 9, 0), datetime(2025, 6, 20, 12, 0), False, "Mock note")
+
+
+def test_insert_single_statement(store, mock_task):
+    store.db.insert_task.return_value = (1,)
+    assert store.insert(mock_task) is True
+    query, params = store.db.insert_task.call_args.args
+    assert query.name == "insert_task"
+    assert "ON CONFLICT (task_id) DO NOTHING RETURNING task_id" in query.statement
+    assert params == (1, "Test Task", mock_task.created_at, mock_task.due_date, False, "Mock note")
+
+    store.db.insert_task.return_value = None
+    assert store.insert(mock_task) is False
+
+
+def test_exists_db_error(store):
+    store.db.fetch_value.return_value = None
+    assert store.exists(3) is False
+
+
+def test_delete_returns_task(store, mock_task):
+    store.db.delete_task.return_value = (1, "Test Task", mock_task.created_at, mock_task.due_date, False, None)
+    assert store.delete(1).title == "Test Task"
+    assert "RETURNING task_id, title" in store.db.delete_task.call_args.args[0].statement
+
+
+def test_bulk_insert_streams_rows(store, mock_task):
+    store.db.copy_tasks_in.return_value = (1, 1)
+    assert store.bulk_insert([mock_task], batch_size=10) == (1, 1)
+    rows = store.db.copy_tasks_in.call_args.args[0]
+    assert list(rows) == [(1, "Test Task", mock_task.created_at, mock_task.due_date, False, "Mock note")]
+    assert store.db.copy_tasks_in.call_args.kwargs["batch_size"] == 10
+
+
+def test_iter_tasks_reads_keyset_batches(store, mock_task):
+    second = Task(5, "Second", mock_task.created_at, None, False)
+    store.db.itersize = 2
+    store.db.fetch_all_tasks.side_effect = [[mock_task, second], []]
+    assert [task.task_id for task in store.iter_tasks(is_complete=False)] == [1, 5]
+
+    first, last = store.db.fetch_all_tasks.call_args_list
+    assert first.args[0].name == "iter_tasks_by_status"
+    assert first.args[1] == (-2 ** 31 - 1, False, 2)
+    # The next batch starts after the last task id read
+    assert last.args[1] == (5, False, 2)
+    store.db.stream_tasks.assert_not_called()
+
+
+def test_list_page_first_page(store, mock_task):
+    second = Task(2, "Second", mock_task.created_at, datetime(2025, 6, 21, 12, 0), False)
+    store.db.fetch_all_tasks.return_value = [mock_task, second]
+    page = store.list_page(False, None, None, "due_date", 1, None)
+
+    assert page.tasks == [mock_task]
+    assert page.next_cursor is not None
+    query, params = store.db.fetch_all_tasks.call_args.args
+    assert "ORDER BY due_date, task_id LIMIT %s" in query
+    assert params == (False, 2)
+
+
+def test_list_page_next_page_seeks_past_cursor(store, mock_task):
+    store.db.fetch_all_tasks.return_value = [mock_task, mock_task]
+    cursor = store.list_page(None, None, None, "due_date", 1, None).next_cursor
+    store.db.fetch_all_tasks.side_effect = [[mock_task], []]
+    page = store.list_page(None, None, None, "due_date", 1, cursor)
+
+    query, params = store.db.fetch_all_tasks.call_args_list[1].args
+    assert "(due_date, task_id) > (%s, %s)" in query
+    assert "OFFSET" not in query
+    assert params == (mock_task.due_date, mock_task.task_id, 2)
+    # The short page continues into the tasks without a due date
+    query, params = store.db.fetch_all_tasks.call_args_list[2].args
+    assert "due_date IS NULL" in query
+    assert params == (1,)
+    assert page.tasks == [mock_task]
+    assert page.next_cursor is None
+
+
+def test_stats_single_query(store):
+    store.db.fetch_row.return_value = (10, 4, 6, 2)
+    assert store.stats(datetime(2025, 6, 18)) == (10, 4, 6, 2)
+    store.db.fetch_row.assert_called_once()
+    query, params = store.db.fetch_row.call_args.args
+    assert "FILTER" in query.statement
+    assert params == (datetime(2025, 6, 18),)
+
+
+def test_stats_cached_reads_counter_table(store):
+    store.db.enable_task_counters.return_value = True
+    assert store.enable_cached_stats() is True
+    store.db.fetch_row.return_value = (10, 4, 6, 2)
+    assert store.stats(datetime.now()).total == 10
+    assert "FROM task_counters" in store.db.fetch_row.call_args.args[0].statement
+
+
+def test_stats_db_error(store):
+    store.db.fetch_row.return_value = None
+    assert store.stats(datetime.now()) is None
+
+
+def test_count_db_error(store):
+    store.db.fetch_value.return_value = None
+    assert store.count(is_complete=True) == -1
+
+
+def test_search_prefix_query(store):
+    store.db.fetch_value.return_value = False
+    store.db.fetch_all_tasks.return_value = []
+    assert store.search("Groc list!", 5) == []
+    query, params = store.db.fetch_all_tasks.call_args.args
+    assert "search_vector @@ q" in query and "<%" not in query
+    assert params == ("groc:* & list:*", 5)
+
+    store.trigram = True
+    store.search("groc", 5)
+    query, params = store.db.fetch_all_tasks.call_args.args
+    assert "%s <%% title" in query
+    assert params == ("groc:*", "groc", "groc", 5)
+
+    store.db.fetch_all_tasks.reset_mock()
+    assert store.search("--", 5) == []
+    store.db.fetch_all_tasks.assert_not_called()
@@ -0,0 +1,85 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_prepared_statements.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the named query registry and the per-connection prepared statements
+############################################################
+
+from unittest.mock import MagicMock
+
+import psycopg2.errors
+import pytest
+
+from db_config.postgres_store import GET_TASK
+from db_config.prepared_statements import QUERIES, PreparedQuery, PreparedStatements, register_query
+
+
+def make_cursor(conn=None):
+    cur = MagicMock()
+    cur.connection = conn or MagicMock(autocommit=True)
+    return cur
+
+
+def executed(cur):
+    return [call.args[0] for call in cur.execute.call_args_list]
+
+
+def test_statements_number_placeholders():
+    query = PreparedQuery("find", "SELECT * FROM tasks WHERE title LIKE 'a%%' AND task_id = %s AND note = %s", 2)
+    assert query.prepare_statement == ("PREPARE todo_find AS SELECT * FROM tasks WHERE title LIKE 'a%' "
+                                       "AND task_id = $1 AND note = $2")
+    assert query.execute_statement == "EXECUTE todo_find (%s, %s)"
+    assert PreparedQuery("count", "SELECT COUNT(*) FROM tasks", 0).execute_statement == "EXECUTE todo_count"
+
+
+def test_register_query():
+    assert QUERIES["get_task"] is GET_TASK
+    assert GET_TASK.param_count == 1
+    # Registering the same statement again is allowed, a different one under the same name is not
+    assert register_query("get_task", GET_TASK.statement) == GET_TASK
+    with pytest.raises(ValueError):
+        register_query("get_task", "SELECT 1")
+    with pytest.raises(ValueError):
+        register_query("drop table", "SELECT 1")
+
+
+def test_prepared_once_per_connection():
+    prepared = PreparedStatements()
+    first = make_cursor()
+    for task_id in (1, 2, 3):
+        prepared.execute(first, GET_TASK, (task_id,))
+    assert executed(first) == [GET_TASK.prepare_statement] + [GET_TASK.execute_statement] * 3
+
+    # A new connection, e.g. one opened by the pool, prepares again
+    second = make_cursor()
+    prepared.execute(second, GET_TASK, (4,))
+    assert executed(second) == [GET_TASK.prepare_statement, GET_TASK.execute_statement]
+    assert prepared.stats() == {"get_task": {"prepares": 2, "executions": 4, "hits": 2, "hit_rate": 0.5}}
+
+
+def test_disabled_runs_plain_statement():
+    prepared = PreparedStatements(enabled=False)
+    cur = make_cursor()
+    prepared.execute(cur, GET_TASK, (1,))
+    cur.execute.assert_called_once_with(GET_TASK.statement, (1,))
+    assert prepared.stats() == {}
+
+
+def test_dropped_statement_is_prepared_again():
+    prepared = PreparedStatements()
+    cur = make_cursor()
+    prepared.execute(cur, GET_TASK, (1,))
+    cur.execute.side_effect = [psycopg2.errors.InvalidSqlStatementName("gone"), None, None]
+    prepared.execute(cur, GET_TASK, (1,))
+    assert executed(cur)[-3:] == [GET_TASK.execute_statement, GET_TASK.prepare_statement, GET_TASK.execute_statement]
+
+    # Inside a transaction the error is raised, the next call prepares again
+    cur = make_cursor(MagicMock(autocommit=False))
+    prepared.execute(cur, GET_TASK, (1,))
+    cur.execute.side_effect = [psycopg2.errors.InvalidSqlStatementName("gone"), None, None]
+    with pytest.raises(psycopg2.errors.InvalidSqlStatementName):
+        prepared.execute(cur, GET_TASK, (1,))
+    prepared.execute(cur, GET_TASK, (1,))
+    assert executed(cur)[-2:] == [GET_TASK.prepare_statement, GET_TASK.execute_statement]
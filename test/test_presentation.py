@@ -0,0 +1,118 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_presentation.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the write results and their terminal output
+############################################################
+
+from datetime import datetime
+import io
+
+import psycopg2
+import pytest
+
+from db_config.errors import StorageError
+from db_config.memory_store import MemoryTaskStore
+from db_config.sqlite_store import SQLiteTaskStore
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, WriteOp
+from todo.presentation import ConsolePresenter, format_result
+from todo.results import WriteResult, error_message
+from todo.task import Task
+from todo.task_manager import TaskManager
+
+
+@pytest.fixture
+def task():
+    return Task(1, "Test Task", datetime(2025, 6, 16, 9, 0), datetime(2025, 6, 20, 12, 0), False, "Mock note")
+
+
+@pytest.mark.parametrize("op, result, message", [
+    (INSERT, True, "Test Task inserted to database"),
+    (INSERT, False, "Test Task already exists"),
+    (UPDATE, True, "Test Task updated successfully"),
+    (UPDATE, False, "Task ID 1 does not exist"),
+    (DELETE, "task", "Test Task deleted successfully"),
+    (DELETE, None, "Task ID 1 does not exist"),
+    (COMPLETE, ("Test Task", False), "Test Task marked complete"),
+    (COMPLETE, ("Test Task", True), "Test Task is already complete"),
+    (COMPLETE, None, "Task ID 1 does not exist"),
+])
+def test_format_result(task, op, result, message):
+    write = WriteOp(op, 1, task if op in (INSERT, UPDATE) else None)
+    assert format_result(WriteResult.from_store(write, task if result == "task" else result)) == message
+
+
+def test_error_message_includes_cause():
+    try:
+        try:
+            raise psycopg2.OperationalError("server closed the connection\n")
+        except psycopg2.Error as error:
+            raise StorageError("Error fetching row") from error
+    except StorageError as error:
+        assert error_message(error) == "Error fetching row: server closed the connection"
+    assert error_message(ValueError()) == "ValueError"
+
+
+def test_presenter_prints_queued_writes(task):
+    out = io.StringIO()
+    manager = TaskManager(store=MemoryTaskStore(), write_behind=True)
+    manager.write_queue.max_delay = 60
+    ConsolePresenter(out).attach(manager)
+    manager.add_task(task)
+    manager.set_complete(task.task_id)
+    manager.delete_task(404)
+    assert out.getvalue() == ""
+
+    manager.flush()
+    assert out.getvalue().splitlines() == ["Test Task inserted to database", "Test Task marked complete",
+                                           "Task ID 404 does not exist"]
+
+
+def test_presenter_prints_failed_batch(task):
+    out = io.StringIO()
+    store = MemoryTaskStore()
+    manager = TaskManager(store=store, write_behind=True)
+    manager.write_queue.max_delay = 60
+    presenter = ConsolePresenter(out)
+    presenter.attach(manager)
+
+    def fail(ops):
+        raise StorageError("Error running transaction")
+
+    store.apply_writes = fail
+    manager.add_task(task)
+    with pytest.raises(StorageError):
+        manager.flush()
+    assert out.getvalue() == "Error: 1 queued writes were not applied: Error running transaction\n"
+
+    presenter.detach(manager)
+    manager.add_task(task)
+    with pytest.raises(StorageError):
+        manager.flush()
+    assert out.getvalue().count("\n") == 1
+
+
+def test_show_tasks_streams(task):
+    out = io.StringIO()
+
+    def tasks():
+        yield task
+        assert "Title: Test Task" in out.getvalue()
+
+    ConsolePresenter(out).show_tasks(tasks())
+    assert out.getvalue().count("*" * 40) == 2
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_show_tasks_without_due_date(backend, tmp_path):
+    store = MemoryTaskStore() if backend == "memory" else SQLiteTaskStore(str(tmp_path / "todo.db"))
+    manager = TaskManager(store=store, write_behind=False)
+    try:
+        manager.add_task(Task(5, "nodue", datetime(2025, 6, 16, 9, 0), None, False))
+        out = io.StringIO()
+        ConsolePresenter(out).show_tasks(manager.iter_tasks())
+        assert "Title: nodue" in out.getvalue() and "Due Date: -" in out.getvalue()
+    finally:
+        manager.close_connection()
@@ -0,0 +1,65 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_query_stats.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the query statistics and slow query log
+############################################################
+
+from datetime import datetime
+
+from db_config.query_stats import QueryStats, normalize_statement, redact_params
+
+
+def test_record_aggregates_per_statement():
+    stats = QueryStats(slow_threshold=None)
+    stats.record("SELECT 1\n  FROM tasks", None, 0.0004, 1)
+    stats.record("SELECT 1 FROM tasks", None, 0.003, 2)
+    stats.record("SELECT 1 FROM tasks", None, 0.02, -1, RuntimeError("boom"))
+
+    snapshot = stats.snapshot()
+    assert list(snapshot) == ["SELECT 1 FROM tasks"]
+    entry = snapshot["SELECT 1 FROM tasks"]
+    assert (entry["calls"], entry["errors"], entry["rows"]) == (3, 1, 3)
+    assert entry["max_ms"] == 20.0
+    assert entry["histogram"]["0.0005"] == 1
+    assert entry["histogram"]["0.005"] == 2
+    assert entry["histogram"]["+Inf"] == 3
+
+
+def test_slow_log_redacts_params(caplog):
+    stats = QueryStats(slow_threshold=0.1, slow_log_size=2)
+    stats.record("SELECT title FROM tasks WHERE task_id = %s", (42,), 0.05, 1)
+    stats.record("UPDATE tasks SET title = %s WHERE task_id = %s", ("secret title", 42), 0.15, 1)
+
+    slow = stats.slow_queries()
+    assert len(slow) == 1
+    assert slow[0]["params"] == ["<str>", "<int>"]
+    assert slow[0]["duration_ms"] == 150.0
+    assert "Slow query (150.0 ms, 1 rows)" in caplog.text
+    assert "secret" not in caplog.text
+
+    for _ in range(3):
+        stats.record("SELECT pg_sleep(1)", None, 1.0, 1)
+    assert len(stats.slow_queries()) == 2
+
+
+def test_redact_params_shapes():
+    assert redact_params(None) is None
+    assert redact_params({"due": datetime.now(), "note": None}) == {"due": "<datetime>", "note": None}
+    assert normalize_statement(b"SELECT  1") == "SELECT 1"
+
+
+def test_prometheus_text():
+    stats = QueryStats(slow_threshold=None)
+    stats.record('SELECT "title" FROM tasks', None, 0.002, 5)
+    text = stats.prometheus()
+    assert "# TYPE todo_db_query_duration_seconds histogram" in text
+    assert 'todo_db_query_duration_seconds_bucket{statement="SELECT \\"title\\" FROM tasks",le="0.0025"} 1' in text
+    assert 'todo_db_query_duration_seconds_count{statement="SELECT \\"title\\" FROM tasks"} 1' in text
+    assert 'todo_db_query_rows_total{statement="SELECT \\"title\\" FROM tasks"} 5' in text
+    assert text.endswith("\n")
+
+    stats.reset()
+    assert stats.snapshot() == {}
@@ -0,0 +1,175 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_reminders.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the due-date reminder scheduler
+############################################################
+
+from datetime import datetime, timedelta
+import json
+import threading
+
+import pytest
+
+from db_config.memory_store import MemoryTaskStore
+from todo.reminders import DEFAULT_CATCH_UP, Reminder, ReminderScheduler, WebhookReminder
+from todo.task import Task
+from todo.task_manager import TaskManager
+from .helpers import BASE, MINUTE, make_task
+
+NOW = BASE
+
+
+@pytest.fixture
+def manager():
+    manager = TaskManager(store=MemoryTaskStore(), write_behind=False)
+    yield manager
+    manager.close_connection()
+
+
+@pytest.fixture
+def scheduler(manager):
+    return ReminderScheduler(manager, [], clock=lambda: NOW, page_size=2)
+
+
+def test_reload_loads_incomplete_deadlines(manager):
+    fired = []
+    scheduler = ReminderScheduler(manager, [fired.append], catch_up=15 * MINUTE, clock=lambda: NOW, page_size=2)
+    for task in [make_task(1, due=30 * MINUTE), make_task(2, due=-10 * MINUTE), make_task(3, due=None),
+                 make_task(4, due=5 * MINUTE, is_complete=True), make_task(5, due=10 * MINUTE),
+                 make_task(6, due=-20 * MINUTE)]:
+        manager.add_task(task)
+    # Task 6 became overdue before the catch-up window
+    assert scheduler.reload() == 3
+    assert scheduler.next_deadline() == NOW - timedelta(minutes=10)
+
+    assert scheduler.fire_due(NOW) == [Reminder(2, "Task 2", NOW - timedelta(minutes=10), True)]
+    assert scheduler.fire_due(NOW + timedelta(minutes=15)) == [Reminder(5, "Task 5", NOW + timedelta(minutes=10),
+                                                                        False)]
+    assert fired == [Reminder(2, "Task 2", NOW - timedelta(minutes=10), True),
+                     Reminder(5, "Task 5", NOW + timedelta(minutes=10), False)]
+    assert scheduler.pending() == 1
+
+
+def test_task_overdue_at_start_is_reminded(manager):
+    fired = []
+    manager.add_task(make_task(1, due=-3 * timedelta(hours=1)))
+    manager.add_task(make_task(2, due=-DEFAULT_CATCH_UP - MINUTE))
+    manager.add_task(make_task(3, due=10 * MINUTE))
+    scheduler = ReminderScheduler(manager, [fired.append], clock=lambda: NOW)
+    assert scheduler.reload() == 2
+    scheduler.fire_due(NOW)
+    assert fired == [Reminder(1, "Task 1", NOW - timedelta(hours=3), True)]
+
+
+def test_reload_without_catch_up(manager, scheduler):
+    manager.add_task(make_task(1, due=-10 * MINUTE))
+    manager.add_task(make_task(2, due=10 * MINUTE))
+    scheduler.catch_up = timedelta(0)
+    assert scheduler.reload() == 1
+    scheduler.catch_up = None
+    assert scheduler.reload() == 2
+    assert [reminder.task_id for reminder in scheduler.fire_due(NOW)] == [1]
+
+
+def test_deadline_is_reminded_once(manager, scheduler):
+    manager.add_write_listener(scheduler.on_write)
+    manager.add_task(make_task(1, due=-10 * MINUTE))
+    manager.add_task(make_task(2, due=10 * MINUTE))
+    assert [reminder.task_id for reminder in scheduler.fire_due(NOW + timedelta(minutes=15))] == [1, 2]
+
+    # Renaming or reloading does not remind the same deadline again
+    manager.update_task(make_task(1, "Renamed", due=-10 * MINUTE))
+    scheduler.catch_up = None
+    assert scheduler.reload() == 0
+    assert scheduler.fire_due(NOW + timedelta(days=1)) == []
+
+    # A new deadline is reminded
+    manager.update_task(make_task(2, due=30 * MINUTE))
+    assert scheduler.fire_due(NOW + timedelta(days=1)) == [Reminder(2, "Task 2", NOW + timedelta(minutes=30), False)]
+    assert scheduler.stats()["fired"] == 3
+
+
+def test_follows_manager_writes(manager, scheduler):
+    manager.add_write_listener(scheduler.on_write)
+    manager.add_task(make_task(1, due=10 * MINUTE))
+    manager.add_task(make_task(2, due=20 * MINUTE))
+    manager.add_task(make_task(3, due=30 * MINUTE))
+    manager.update_task(make_task(1, due=40 * MINUTE, title="Moved"))
+    manager.update_task(make_task(2, due=20 * MINUTE, title="Renamed"))
+    manager.set_complete(3)
+    manager.delete_task(9)
+    assert scheduler.pending() == 2
+
+    assert scheduler.fire_due(NOW + timedelta(minutes=35)) == [Reminder(2, "Renamed", NOW + timedelta(minutes=20),
+                                                                        False)]
+    manager.delete_task(1)
+    assert scheduler.fire_due(NOW + timedelta(days=1)) == []
+    assert scheduler.next_deadline() is None
+
+
+def test_lead_time(manager):
+    scheduler = ReminderScheduler(manager, [], lead_time=timedelta(minutes=15), clock=lambda: NOW)
+    scheduler.schedule(make_task(1, due=30 * MINUTE))
+    assert scheduler.fire_due(NOW + timedelta(minutes=10)) == []
+    assert [reminder.task_id for reminder in scheduler.fire_due(NOW + timedelta(minutes=15))] == [1]
+
+
+def test_failing_callback_does_not_stop_others(manager):
+    fired = []
+
+    def broken(reminder):
+        raise RuntimeError("boom")
+
+    scheduler = ReminderScheduler(manager, [broken, fired.append], clock=lambda: NOW)
+    scheduler.schedule(make_task(1, due=-MINUTE))
+    scheduler.fire_due()
+    assert [reminder.task_id for reminder in fired] == [1]
+
+
+def test_stale_entries_are_compacted(manager, scheduler):
+    for minutes in range(3000):
+        scheduler.schedule(make_task(1, due=minutes * MINUTE))
+    assert scheduler.pending() == 1
+    assert scheduler.stats()["heap_size"] <= 1026
+
+
+def test_thread_sleeps_until_deadline(manager):
+    fired = threading.Event()
+    scheduler = ReminderScheduler(manager, [lambda reminder: fired.set()])
+    assert scheduler.start() == 0
+    try:
+        manager.add_task(Task(1, "Soon", datetime.now(), datetime.now() + timedelta(milliseconds=50), False, None))
+        assert fired.wait(2)
+        assert scheduler.stats()["fired"] == 1
+    finally:
+        scheduler.stop()
+
+
+def test_bulk_import_reloads(manager):
+    fired = threading.Event()
+    reminders = []
+    scheduler = ReminderScheduler(manager, [reminders.append, lambda reminder: fired.set()])
+    scheduler.start()
+    try:
+        # The reload only picks up deadlines from now on, the overdue task is not reminded
+        manager.add_tasks([make_task(1, due=10 * MINUTE),
+                           Task(2, "Soon", datetime.now(), datetime.now() + timedelta(milliseconds=50), False, None)])
+        assert fired.wait(2)
+        assert [(reminder.task_id, reminder.overdue) for reminder in reminders] == [(2, False)]
+        assert scheduler.pending() == 0
+    finally:
+        scheduler.stop()
+
+
+def test_webhook_posts_json():
+    sent = []
+    webhook = WebhookReminder("http://hooks.example/todo", send=lambda *args: sent.append(args))
+    webhook(Reminder(1, "Pay rent", NOW, True))
+    url, body, timeout = sent[0]
+    assert url == "http://hooks.example/todo"
+    assert json.loads(body) == {"task_id": 1, "title": "Pay rent", "due_date": "2025-06-16T09:00:00",
+                                "overdue": True}
+    assert timeout == 5.0
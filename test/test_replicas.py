@@ -0,0 +1,141 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_replicas.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for read replica routing and failover
+############################################################
+
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from db_config import database_config
+from db_config.database_config import DatabaseConfig
+from db_config.migrations import LATEST_VERSION
+from db_config.replicas import PRIMARY, REPLICA, ReplicaFailure, ReplicaSet, replica_params
+
+DOWN = "replica-down"
+# Accepts connections but drops them during every query
+FLAKY = "replica-flaky"
+
+
+def make_connection(host):
+    conn = MagicMock(closed=False)
+    conn.host = host
+    conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+    cur = conn.cursor.return_value
+    cur.__enter__.return_value = cur
+    cur.connection = conn
+    cur.fetchone.side_effect = lambda: (True,) if "to_regclass" in cur.execute.call_args.args[0] \
+        else (LATEST_VERSION,) if "schema_migrations" in cur.execute.call_args.args[0] else (host,)
+    return conn
+
+
+def connect(**kwargs):
+    if kwargs["host"] == DOWN:
+        raise psycopg2.OperationalError("could not connect")
+    conn = make_connection(kwargs["host"])
+    if kwargs["host"] == FLAKY:
+        conn.cursor.return_value.execute.side_effect = psycopg2.OperationalError("server closed the connection")
+    return conn
+
+
+@pytest.fixture
+def mock_connect(monkeypatch):
+    monkeypatch.setenv("DB_HOST", "primary")
+    monkeypatch.setenv("DB_PREPARED_STATEMENTS", "false")
+    monkeypatch.setattr(database_config, "_current_schemas", set())
+    with patch("db_config.database_config.psycopg2.connect", side_effect=connect) as mock:
+        yield mock
+
+
+def read_host(db, route=None):
+    return db.fetch_value("SELECT 1", route=route)
+
+
+def test_replica_params_inherit_primary():
+    params = replica_params("host=replica1 port=5433 dbname=todo_ro",
+                            {"host": "primary", "user": "app", "password": "secret", "port": "5432",
+                             "database": "todo", "cursor_factory": None})
+    assert params == {"host": "replica1", "user": "app", "password": "secret", "port": "5433",
+                      "database": "todo_ro"}
+
+
+def test_round_robin(mock_connect):
+    replicas = ReplicaSet(["host=r1", "host=r2"], {})
+    hosts = []
+    for _ in range(4):
+        with replicas.connection() as conn:
+            hosts.append(conn.host)
+    assert hosts == ["r1", "r2", "r1", "r2"]
+    assert [replica["reads"] for replica in replicas.stats()] == [2, 2]
+
+
+def test_failover_skips_down_replica(mock_connect):
+    replicas = ReplicaSet([f"host={DOWN}", "host=r2"], {}, retry_interval=60)
+    for _ in range(3):
+        with replicas.connection() as conn:
+            assert conn.host == "r2"
+    stats = replicas.stats()
+    assert stats[0] == {"name": f"{DOWN}:5432", "healthy": False, "reads": 0, "failures": 1}
+    assert stats[1]["reads"] == 3
+
+    # A replica that fails during a query is skipped by the following calls
+    with pytest.raises(ReplicaFailure):
+        with replicas.connection():
+            raise psycopg2.OperationalError("server closed the connection")
+    with replicas.connection() as conn:
+        assert conn is None
+
+
+def test_reads_use_replicas_and_writes_the_primary(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False, replicas=["host=r1", "host=r2"])
+    db.read_your_writes = 60
+    assert [read_host(db) for _ in range(3)] == ["r1", "r2", "r1"]
+
+    db.insert_task("INSERT INTO tasks VALUES (%s) RETURNING task_id", (1,))
+    assert db.conn.cursor.return_value.execute.call_args.args[0].startswith("INSERT")
+    # Reads right after a write see it on the primary unless they ask for a replica
+    assert read_host(db) == "primary"
+    assert read_host(db, route=REPLICA) == "r2"
+    db.read_your_writes = 0
+    assert read_host(db) == "r1"
+    db.close()
+
+
+def test_route_override(mock_connect):
+    db = DatabaseConfig(pooled=True, lazy=False, replicas=["host=r1"])
+    assert read_host(db, route=PRIMARY) == "primary"
+    with db.use_route(PRIMARY):
+        assert read_host(db) == "primary"
+        assert read_host(db, route=REPLICA) == "r1"
+    assert read_host(db) == "r1"
+    with pytest.raises(ValueError):
+        with db.use_route("standby"):
+            pass
+    db.close()
+
+
+def test_all_replicas_down_reads_primary(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False, replicas=[f"host={DOWN}"])
+    assert read_host(db) == "primary"
+    assert db.replica_stats()[0]["healthy"] is False
+    db.close()
+
+
+def test_replica_failing_during_read_is_retried(mock_connect):
+    db = DatabaseConfig(pooled=False, lazy=False, replicas=[f"host={FLAKY}", "host=r2"])
+    db.replicas.retry_interval = 60
+    assert read_host(db) == "r2"
+    assert db.replica_stats()[0] == {"name": f"{FLAKY}:5432", "healthy": False, "reads": 1, "failures": 1}
+    assert read_host(db) == "r2"
+    db.close()
+
+    # Without another replica the retry reads the primary
+    db = DatabaseConfig(pooled=True, lazy=False, replicas=[f"host={FLAKY}"])
+    assert read_host(db) == "primary"
+    assert db.replica_stats()[0]["healthy"] is False
+    db.close()
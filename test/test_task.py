@@ -0,0 +1,48 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_task.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the task class
+############################################################
+
+from datetime import datetime
+
+import pytest
+
+from todo.task import Task
+
+ROW = (3, "Row task", datetime(2025, 6, 16, 9, 0), datetime(2025, 6, 20, 12, 0), True, "From the db")
+
+
+def test_from_row():
+    task = Task.from_row(ROW)
+    assert (task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note) == ROW
+
+
+def test_from_rows():
+    tasks = list(Task.from_rows([ROW, ROW]))
+    assert len(tasks) == 2
+    assert all(task.title == "Row task" for task in tasks)
+
+
+def test_attributes_are_writable():
+    task = Task.from_row(ROW)
+    task.title = "Renamed"
+    task.is_complete = False
+    assert task.title == "Renamed"
+    assert task.is_complete is False
+
+
+def test_no_instance_dict():
+    task = Task.from_row(ROW)
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.unknown = 1
+
+
+def test_str_without_due_date():
+    task = Task(4, "Someday", datetime(2025, 6, 16, 9, 0), None, False)
+    assert "Due Date: -\n" in str(task)
+    assert "Created At: 06/16/2025 09:00:00 AM" in str(task)
@@ -0,0 +1,107 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_task_cache.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the task cache
+############################################################
+
+import pytest
+
+from todo.task_cache import TaskCache
+from .helpers import make_task
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_and_miss_counters():
+    cache = TaskCache(max_size=2)
+    assert cache.get(1) == (False, None)
+    cache.put(1, make_task(1))
+    cached, task = cache.get(1)
+    assert cached is True
+    assert task.title == "Task 1"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_missing_task_is_cached():
+    cache = TaskCache()
+    cache.put(5, None)
+    assert cache.get(5) == (True, None)
+
+
+def test_least_recently_used_is_evicted():
+    cache = TaskCache(max_size=2)
+    cache.put(1, make_task(1))
+    cache.put(2, make_task(2))
+    cache.get(1)
+    cache.put(3, make_task(3))
+    assert cache.get(2) == (False, None)
+    assert cache.get(1)[0] is True
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = TaskCache(ttl=10, clock=clock)
+    cache.put(1, make_task(1))
+    clock.now = 9.9
+    assert cache.get(1)[0] is True
+    clock.now = 10.0
+    assert cache.get(1) == (False, None)
+    assert cache.stats()["size"] == 0
+
+
+def test_returned_task_is_a_copy():
+    cache = TaskCache()
+    cache.put(1, make_task(1))
+    cache.get(1)[1].title = "Changed"
+    assert cache.get(1)[1].title == "Task 1"
+
+
+def test_invalidate_and_clear():
+    cache = TaskCache()
+    cache.put(1, make_task(1))
+    cache.put(2, make_task(2))
+    cache.invalidate(1)
+    assert cache.get(1)[0] is False
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+def test_outdated_read_is_not_stored():
+    cache = TaskCache(max_size=2)
+    generation = cache.generation()
+    cache.invalidate(1)
+    assert cache.put(1, make_task(1, "Old"), generation) is False
+    assert cache.get(1) == (False, None)
+    # Other task ids are not affected
+    assert cache.put(2, make_task(2), generation) is True
+
+    generation = cache.generation()
+    cache.put(1, make_task(1, "Written"))
+    assert cache.put(1, make_task(1, "Old"), generation) is False
+    assert cache.get(1)[1].title == "Written"
+
+    generation = cache.generation()
+    cache.clear()
+    assert cache.put(3, make_task(3), generation) is False
+    # Many changes keep the change record bounded, reads from before them are treated as outdated
+    generation = cache.generation()
+    for task_id in range(10, 20):
+        cache.invalidate(task_id)
+    assert cache.put(4, make_task(4), generation) is False
+    assert cache.put(4, make_task(4), cache.generation()) is True
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        TaskCache(max_size=0)
@@ -0,0 +1,77 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_task_io.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Unit test for the task file readers
+############################################################
+
+import io
+from datetime import datetime
+
+import pytest
+
+from db_config.memory_store import MemoryTaskStore
+from db_config.sqlite_store import SQLiteTaskStore
+from todo.task_io import guess_format, read_tasks
+from todo.task_manager import TaskManager
+
+
+def test_read_csv():
+    stream = io.StringIO("task_id,title,created_at,due_date,is_complete,note\n"
+                         "1,\"Buy milk, eggs\",2025-06-16 10:00:00,2025-06-20 12:00:00,f,\n"
+                         "2,Pay rent,2025-06-16 10:00:00,2025-07-01 09:00:00,t,\"first line\nsecond line\"\n")
+    tasks = list(read_tasks(stream, "csv"))
+    assert [task.task_id for task in tasks] == [1, 2]
+    assert tasks[0].title == "Buy milk, eggs"
+    assert tasks[0].due_date == datetime(2025, 6, 20, 12, 0)
+    assert tasks[0].is_complete is False
+    assert tasks[0].note is None
+    assert tasks[1].is_complete is True
+    assert tasks[1].note == "first line\nsecond line"
+
+
+def test_read_jsonl():
+    stream = io.StringIO('{"task_id": 7, "title": "Call mom", "due_date": "2025-06-20T12:00:00", '
+                         '"is_complete": false, "note": null}\n\n')
+    tasks = list(read_tasks(stream, "jsonl"))
+    assert len(tasks) == 1
+    assert tasks[0].task_id == 7
+    assert tasks[0].due_date == datetime(2025, 6, 20, 12, 0)
+    assert isinstance(tasks[0].created_at, datetime)
+
+
+def test_read_is_lazy():
+    stream = io.StringIO('{"task_id": 1}\nnot json\n')
+    tasks = read_tasks(stream, "jsonl")
+    assert next(tasks).task_id == 1
+    with pytest.raises(ValueError):
+        next(tasks)
+
+
+def test_guess_format():
+    assert guess_format("tasks.jsonl") == "jsonl"
+    assert guess_format("tasks.NDJSON") == "jsonl"
+    assert guess_format("tasks.csv") == "csv"
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_import_without_due_date_then_list(backend, tmp_path):
+    store = MemoryTaskStore() if backend == "memory" else SQLiteTaskStore(str(tmp_path / "todo.db"))
+    manager = TaskManager(store=store, write_behind=False)
+    try:
+        csv_stream = io.StringIO("task_id,title,created_at,due_date,is_complete,note\n"
+                                 "1,Someday,2025-06-16 10:00:00,,f,\n"
+                                 "2,Pay rent,2025-06-16 10:00:00,2025-07-01 09:00:00,f,\n")
+        jsonl_stream = io.StringIO('{"task_id": 3, "title": "Read a book"}\n')
+        assert manager.add_tasks(read_tasks(csv_stream, "csv")) == (2, 2)
+        assert manager.add_tasks(read_tasks(jsonl_stream, "jsonl")) == (1, 1)
+
+        # Tasks without a due date come last
+        tasks = manager.list_tasks(is_complete=False).tasks
+        assert [task.task_id for task in tasks] == [2, 1, 3]
+        assert [task.due_date for task in tasks[1:]] == [None, None]
+        assert all("Due Date: -" in str(task) for task in tasks[1:])
+    finally:
+        manager.close_connection()
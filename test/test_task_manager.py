@@ -3,7 +3,7 @@
 # File Name    : test/test_task_manager.py
 # Author       : Nishan Subba
 # Created Date : 2025-06-17
-# Updated Date : 2025-06-17
+# Updated Date : 2026-10-18
 # Description  : Unit test for the task manager class
 ############################################################
 
@@ -14,14 +14,21 @@ import pytest
 
 from todo.task_manager import TaskManager
 from todo.task import Task
+from todo.task_cache import TaskCache
+from todo.task_stats import TaskStats
+from db_config.memory_store import MemoryTaskStore
+from todo.results import ALREADY_COMPLETE, COMPLETED, DELETED, EXISTS, INSERTED, NOT_FOUND, UPDATED
+from db_config.errors import StorageError
+from db_config.task_store import COMPLETE, INSERT, TaskStore, WriteOp
 
 
-# Create instance of DB connection with Mock
+# Create instance of the task manager with a mocked storage backend
 @pytest.fixture
 def task_manager_mock_db():
-    manager = TaskManager()
-    manager.db = MagicMock()
-    return manager
+    store = MagicMock()
+    # Single writes go through the real dispatch to the mocked insert/update/delete/complete
+    store.apply_write.side_effect = lambda op: TaskStore.apply_write(store, op)
+    return TaskManager(store=store, write_behind=False)
 
 # Create a mock Task instance
 @pytest.fixture
@@ -36,66 +43,316 @@ def mock_task():
     )
 
 
-def test_add_task_new(task_manager_mock_db, mock_task):
-    task_manager_mock_db.db.fetch_value.return_value = 0  # Simulate not found
-    task_manager_mock_db.add_task(mock_task)
+def test_add_task_new(task_manager_mock_db, mock_task, capsys):
+    task_manager_mock_db.store.insert.return_value = True
+    result = task_manager_mock_db.add_task(mock_task)
 
-    task_manager_mock_db.db.insert_task.assert_called_once()
-    task_manager_mock_db.db.fetch_value.assert_called_once()
+    task_manager_mock_db.store.insert.assert_called_once_with(mock_task)
+    task_manager_mock_db.store.exists.assert_not_called()
+    assert (result.status, result.title, result.ok) == (INSERTED, "Test Task", True)
+    # Outcomes are returned, nothing is printed
+    assert capsys.readouterr().out == ""
 
 
 def test_add_task_existing(task_manager_mock_db, mock_task):
-    task_manager_mock_db.db.fetch_value.return_value = 1  # Already exists
-    task_manager_mock_db.add_task(mock_task)
+    task_manager_mock_db.store.insert.return_value = False
+    result = task_manager_mock_db.add_task(mock_task)
+
+    task_manager_mock_db.store.insert.assert_called_once()
+    assert (result.status, result.ok) == (EXISTS, False)
+
 
-    task_manager_mock_db.db.insert_task.assert_not_called()
+def test_add_task_storage_error(task_manager_mock_db, mock_task):
+    task_manager_mock_db.store.insert.side_effect = StorageError("Error inserting task")
+    with pytest.raises(StorageError):
+        task_manager_mock_db.add_task(mock_task)
 
 
 def test_is_task_true(task_manager_mock_db):
-    task_manager_mock_db.db.fetch_value.return_value = 1
+    task_manager_mock_db.store.exists.return_value = True
     assert task_manager_mock_db.is_task(1) is True
 
 
 def test_is_task_false(task_manager_mock_db):
-    task_manager_mock_db.db.fetch_value.return_value = 0
+    task_manager_mock_db.store.exists.return_value = False
     assert task_manager_mock_db.is_task(2) is False
 
 
 def test_delete_task_exists(task_manager_mock_db, mock_task):
-    task_manager_mock_db.db.fetch_value.return_value = 1
-    task_manager_mock_db.db.fetch_task.return_value = mock_task
-    task_manager_mock_db.db.delete_task.return_value = True
-    task_manager_mock_db.delete_task(mock_task.task_id)
-    task_manager_mock_db.db.delete_task.assert_called_once()
+    task_manager_mock_db.store.delete.return_value = mock_task
+    result = task_manager_mock_db.delete_task(mock_task.task_id)
+    task_manager_mock_db.store.delete.assert_called_once_with(mock_task.task_id)
+    task_manager_mock_db.store.exists.assert_not_called()
+    task_manager_mock_db.store.get.assert_not_called()
+    assert (result.status, result.task) == (DELETED, mock_task)
 
 
 def test_delete_task_not_exists(task_manager_mock_db):
-    task_manager_mock_db.db.fetch_value.return_value = 0
-    task_manager_mock_db.delete_task(999)
-    task_manager_mock_db.db.delete_task.assert_not_called()
+    task_manager_mock_db.store.delete.return_value = None
+    result = task_manager_mock_db.delete_task(999)
+    assert (result.status, result.op.task_id, result.ok) == (NOT_FOUND, 999, False)
 
 
 def test_update_task_exists(task_manager_mock_db, mock_task):
-    task_manager_mock_db.db.fetch_value.return_value = 1
-    task_manager_mock_db.db.update_task.return_value = True
-    task_manager_mock_db.update_task(mock_task)
-    task_manager_mock_db.db.update_task.assert_called_once()
+    task_manager_mock_db.store.update.return_value = True
+    result = task_manager_mock_db.update_task(mock_task)
+    task_manager_mock_db.store.update.assert_called_once_with(mock_task)
+    task_manager_mock_db.store.exists.assert_not_called()
+    assert result.status == UPDATED
 
 
 def test_update_task_not_exists(task_manager_mock_db, mock_task):
-    task_manager_mock_db.db.fetch_value.return_value = 0
-    task_manager_mock_db.update_task(mock_task)
-    task_manager_mock_db.db.update_task.assert_not_called()
+    task_manager_mock_db.store.update.return_value = False
+    assert task_manager_mock_db.update_task(mock_task).status == NOT_FOUND
+
+
+def test_set_complete(task_manager_mock_db):
+    task_manager_mock_db.store.complete.return_value = ("Test Task", False)
+    result = task_manager_mock_db.set_complete(1)
+    task_manager_mock_db.store.complete.assert_called_once_with(1)
+    assert (result.status, result.title) == (COMPLETED, "Test Task")
+
+
+def test_set_complete_already_complete(task_manager_mock_db):
+    task_manager_mock_db.store.complete.return_value = ("Test Task", True)
+    result = task_manager_mock_db.set_complete(1)
+    assert (result.status, result.ok) == (ALREADY_COMPLETE, True)
+
+
+def test_set_complete_not_exists(task_manager_mock_db):
+    task_manager_mock_db.store.complete.return_value = None
+    assert task_manager_mock_db.set_complete(404).status == NOT_FOUND
 
 
 def test_get_task_exists(task_manager_mock_db, mock_task):
-    task_manager_mock_db.db.fetch_value.return_value = 1
-    task_manager_mock_db.db.fetch_task.return_value = mock_task
+    task_manager_mock_db.store.get.return_value = mock_task
     result = task_manager_mock_db.get_task(mock_task.task_id)
     assert result == mock_task
+    task_manager_mock_db.store.exists.assert_not_called()
 
 
 def test_get_task_not_exists(task_manager_mock_db):
-    task_manager_mock_db.db.fetch_value.return_value = 0
+    task_manager_mock_db.store.get.return_value = None
     result = task_manager_mock_db.get_task(404)
     assert result is None
+
+
+def test_add_tasks_passes_batches(task_manager_mock_db, mock_task):
+    task_manager_mock_db.store.bulk_insert.return_value = (1, 1)
+    result = task_manager_mock_db.add_tasks([mock_task], batch_size=10)
+
+    assert result == (1, 1)
+    assert list(task_manager_mock_db.store.bulk_insert.call_args.args[0]) == [mock_task]
+    assert task_manager_mock_db.store.bulk_insert.call_args.kwargs["batch_size"] == 10
+
+
+def test_list_tasks_passes_filters(task_manager_mock_db):
+    task_manager_mock_db.list_tasks(is_complete=False, order_by="created_at", page_size=5, cursor="abc")
+    task_manager_mock_db.store.list_page.assert_called_once_with(False, None, None, "created_at", 5, "abc")
+
+
+def test_list_tasks_invalid_page_size(task_manager_mock_db):
+    with pytest.raises(ValueError):
+        task_manager_mock_db.list_tasks(page_size=0)
+
+
+def test_search(task_manager_mock_db):
+    task_manager_mock_db.store.search.return_value = []
+    assert task_manager_mock_db.search("milk", limit=5) == []
+    task_manager_mock_db.store.search.assert_called_once_with("milk", 5)
+    with pytest.raises(ValueError):
+        task_manager_mock_db.search("milk", limit=0)
+
+
+def test_stats(task_manager_mock_db):
+    task_manager_mock_db.store.stats.return_value = TaskStats(10, 4, 6, 2)
+    stats = task_manager_mock_db.stats(now=datetime(2025, 6, 18))
+
+    assert stats == (10, 4, 6, 2)
+    assert stats.overdue == 2
+    task_manager_mock_db.store.stats.assert_called_once_with(datetime(2025, 6, 18))
+
+
+def test_stats_db_error(task_manager_mock_db):
+    task_manager_mock_db.store.stats.return_value = None
+    assert task_manager_mock_db.stats() == (-1, -1, -1, -1)
+
+
+def test_counts(task_manager_mock_db):
+    task_manager_mock_db.store.count.side_effect = lambda is_complete=None: {None: 3, True: 1, False: 2}[is_complete]
+    assert task_manager_mock_db.count_total_tasks() == 3
+    assert task_manager_mock_db.count_completed_task() == 1
+    assert task_manager_mock_db.count_incompleted_tasks() == 2
+
+
+def test_default_store_from_environment(monkeypatch):
+    monkeypatch.setenv("TODO_BACKEND", "memory")
+    manager = TaskManager()
+    assert isinstance(manager.store, MemoryTaskStore)
+    assert manager.cached_stats is False
+
+
+def test_get_task_cached(task_manager_mock_db, mock_task):
+    task_manager_mock_db.cache = TaskCache()
+    task_manager_mock_db.store.get.return_value = mock_task
+    task_manager_mock_db.get_task(mock_task.task_id)
+    assert task_manager_mock_db.is_task(mock_task.task_id) is True
+    assert task_manager_mock_db.get_task(mock_task.task_id).title == "Test Task"
+
+    task_manager_mock_db.store.get.assert_called_once()
+    task_manager_mock_db.store.exists.assert_not_called()
+    assert task_manager_mock_db.cache_stats()["hits"] == 2
+
+
+def test_writes_update_cache(task_manager_mock_db, mock_task):
+    task_manager_mock_db.cache = TaskCache()
+    task_manager_mock_db.store.insert.return_value = True
+    task_manager_mock_db.add_task(mock_task)
+    assert task_manager_mock_db.get_task(mock_task.task_id).title == "Test Task"
+
+    task_manager_mock_db.store.complete.return_value = ("Test Task", False)
+    task_manager_mock_db.set_complete(mock_task.task_id)
+    assert task_manager_mock_db.cache.get(mock_task.task_id) == (False, None)
+
+    task_manager_mock_db.store.delete.return_value = mock_task
+    task_manager_mock_db.delete_task(mock_task.task_id)
+    assert task_manager_mock_db.get_task(mock_task.task_id) is None
+    task_manager_mock_db.store.get.assert_not_called()
+
+
+def test_cache_notification_from_other_process(task_manager_mock_db, mock_task):
+    task_manager_mock_db.cache = TaskCache()
+    task_manager_mock_db.cache.put(1, mock_task)
+    task_manager_mock_db._on_cache_notification(f"{task_manager_mock_db._cache_origin}:1")
+    assert task_manager_mock_db.cache.get(1)[0] is True
+    task_manager_mock_db._on_cache_notification("other-process:1")
+    assert task_manager_mock_db.cache.get(1)[0] is False
+
+
+def test_invalidation_during_read_is_not_cached(task_manager_mock_db, mock_task):
+    manager = task_manager_mock_db
+    manager.cache = TaskCache()
+
+    # Another process changes the task while the row is on its way
+    def get(task_id):
+        manager._on_cache_notification(f"other-process:{task_id}")
+        return mock_task
+
+    manager.store.get.side_effect = get
+    assert manager.get_task(1).title == "Test Task"
+    assert manager.cache.get(1) == (False, None)
+    manager.store.get.side_effect = None
+    manager.store.get.return_value = mock_task
+    manager.get_task(1)
+    assert manager.cache.get(1)[0] is True
+
+
+def test_cache_notification_failures_are_logged(mock_task, caplog):
+    store = MagicMock()
+    store.apply_write.side_effect = lambda op: TaskStore.apply_write(store, op)
+    store.listen.side_effect = StorageError("Error listening for notifications")
+    manager = TaskManager(store=store, cache=TaskCache(), cache_notify=True, write_behind=False)
+    assert manager._cache_listener is None
+    assert "Cache notifications disabled" in caplog.text
+
+    store.listen.side_effect = None
+    manager = TaskManager(store=store, cache=TaskCache(), cache_notify=True, write_behind=False)
+    store.notify.side_effect = StorageError("Error sending notification")
+    store.insert.return_value = True
+    assert manager.add_task(mock_task).status == INSERTED
+    assert manager.get_task(mock_task.task_id).title == "Test Task"
+    assert "Cache notification not sent" in caplog.text
+
+
+def test_atomic_applies_writes_in_one_batch(task_manager_mock_db, mock_task):
+    task_manager_mock_db.store.apply_writes.return_value = [True, ("Test Task", False)]
+    with task_manager_mock_db.atomic() as results:
+        assert task_manager_mock_db.add_task(mock_task) is None
+        task_manager_mock_db.set_complete(mock_task.task_id)
+        task_manager_mock_db.store.apply_writes.assert_not_called()
+
+    ops = task_manager_mock_db.store.apply_writes.call_args.args[0]
+    assert [(op.kind, op.task_id) for op in ops] == [("insert", 1), ("complete", 1)]
+    task_manager_mock_db.store.insert.assert_not_called()
+    assert [result.status for result in results] == [INSERTED, COMPLETED]
+
+
+def test_apply_writes_returns_results_quietly(task_manager_mock_db, mock_task, capsys):
+    task_manager_mock_db.store.apply_writes.return_value = [True, None]
+    listener = MagicMock()
+    task_manager_mock_db.add_write_listener(listener)
+    ops = [WriteOp(INSERT, 1, mock_task), WriteOp(COMPLETE, 2)]
+    assert task_manager_mock_db.apply_writes(ops) == [True, None]
+    assert capsys.readouterr().out == ""
+    assert [call.args for call in listener.call_args_list] == [(ops[0], True), (ops[1], None)]
+
+
+def test_atomic_discards_writes_on_error(task_manager_mock_db, mock_task):
+    with pytest.raises(RuntimeError):
+        with task_manager_mock_db.atomic():
+            task_manager_mock_db.add_task(mock_task)
+            raise RuntimeError("abort")
+    task_manager_mock_db.store.apply_writes.assert_not_called()
+
+
+def test_write_behind_flushes_before_reads(mock_task):
+    manager = TaskManager(store=MemoryTaskStore(), write_behind=True)
+    manager.write_queue.max_delay = 60
+    listener = MagicMock()
+    manager.add_write_listener(listener)
+    assert manager.add_task(mock_task) is None
+    manager.set_complete(mock_task.task_id)
+    assert manager.write_queue.pending() == 2
+    listener.assert_not_called()
+
+    assert manager.get_task(mock_task.task_id).is_complete is True
+    assert manager.write_queue.stats()["flushes"] == 1
+    assert listener.call_args.args == (WriteOp(COMPLETE, 1), ("Test Task", False))
+
+
+def test_write_behind_failure_reaches_error_listeners(mock_task):
+    store = MemoryTaskStore()
+    store.apply_writes = MagicMock(side_effect=StorageError("Error running transaction"))
+    manager = TaskManager(store=store, write_behind=True)
+    manager.write_queue.max_delay = 60
+    errors = []
+    manager.add_error_listener(lambda ops, error: errors.append((ops, error)))
+    manager.add_task(mock_task)
+    with pytest.raises(StorageError):
+        manager.flush()
+    assert [(ops, str(error)) for ops, error in errors] == [([WriteOp(INSERT, 1, mock_task)],
+                                                              "Error running transaction")]
+    assert manager.write_queue.stats()["failed_ops"] == 1
+
+
+def test_read_raises_when_pending_writes_fail(mock_task):
+    store = MemoryTaskStore()
+    store.apply_writes = MagicMock(side_effect=StorageError("Error running transaction"))
+    manager = TaskManager(store=store, write_behind=True)
+    manager.write_queue.max_delay = 60
+    manager.add_task(mock_task)
+    # The read would otherwise run as if the write had been applied
+    with pytest.raises(StorageError):
+        manager.get_task(mock_task.task_id)
+
+
+def test_close_connection_flushes_writes(mock_task):
+    store = MemoryTaskStore()
+    store.close = MagicMock()
+    manager = TaskManager(store=store, write_behind=True)
+    manager.write_queue.max_delay = 60
+    manager.add_task(mock_task)
+    manager.close_connection()
+    assert store.exists(mock_task.task_id) is True
+
+
+def test_close_connection_reports_lost_writes(mock_task):
+    store = MemoryTaskStore()
+    store.close = MagicMock()
+    store.apply_writes = MagicMock(side_effect=StorageError("Error running transaction"))
+    manager = TaskManager(store=store, write_behind=True)
+    manager.write_queue.max_delay = 60
+    manager.add_task(mock_task)
+    with pytest.raises(StorageError):
+        manager.close_connection()
+    store.close.assert_called_once()
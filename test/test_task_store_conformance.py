@@ -0,0 +1,277 @@
+############################################################
+# Project Name : Todo App
+# File Name    : test/test_task_store_conformance.py
+# Author       : Nishan Subba
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Behaviour every storage backend must share, run against each backend
+############################################################
+
+import io
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from db_config.errors import StorageError
+from db_config.memory_store import MemoryTaskStore
+from db_config.offline_store import OfflineTaskStore
+from db_config.sqlite_store import SQLiteTaskStore
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, WriteOp, create_store
+from todo.pagination import ORDER_COLUMNS
+from todo.task import Task
+from todo.task_io import read_tasks
+from .helpers import BASE, DAY, make_task
+
+
+def open_postgres():
+    # Runs against the DB_* database and empties its tasks table, so it is opt-in
+    if os.getenv("TODO_TEST_POSTGRES") not in ("1", "true", "yes"):
+        pytest.skip("set TODO_TEST_POSTGRES=1 to run the conformance suite against Postgres")
+    from db_config.postgres_store import PostgresTaskStore
+    store = PostgresTaskStore(pooled=False)
+    if store.db.conn is None:
+        pytest.skip("Postgres is not reachable")
+    with store.db.cursor() as cur:
+        cur.execute("TRUNCATE tasks")
+    store.db.itersize = 2
+    return store
+
+
+@pytest.fixture(params=["memory", "sqlite", "offline", "postgres"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        backend = MemoryTaskStore(itersize=2)
+    elif request.param == "sqlite":
+        backend = SQLiteTaskStore(str(tmp_path / "todo.db"), itersize=2)
+    elif request.param == "offline":
+        backend = OfflineTaskStore(str(tmp_path / "local.db"), sync=False, itersize=2)
+    else:
+        backend = open_postgres()
+    yield backend
+    backend.close()
+
+
+def fields(task):
+    return task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note
+
+
+def seed(store):
+    tasks = [make_task(1, due=3 * DAY), make_task(2, due=-2 * DAY), make_task(3, due=None),
+             make_task(4, due=3 * DAY, is_complete=True), make_task(5, due=-5 * DAY, is_complete=True),
+             make_task(6, due=None, is_complete=True), make_task(7), make_task(8, due=-DAY)]
+    for task in tasks:
+        assert store.insert(task) is True
+    return tasks
+
+
+def test_insert_get_round_trip(store):
+    task = Task(1, "Buy milk", datetime(2025, 6, 16, 9, 0, 0, 123456), datetime(2025, 6, 20, 12, 0), False,
+                "2 litres")
+    assert store.insert(task) is True
+    assert store.insert(make_task(1, "Other")) is False
+    assert fields(store.get(1)) == fields(task)
+    assert store.get(2) is None
+    assert store.exists(1) is True
+    assert store.exists(2) is False
+
+
+def test_stored_task_is_a_copy(store):
+    task = make_task(1)
+    store.insert(task)
+    task.title = "Changed"
+    fetched = store.get(1)
+    fetched.title = "Changed again"
+    assert store.get(1).title == "Task 1"
+
+
+def test_update(store):
+    store.insert(make_task(1))
+    assert store.update(make_task(1, "Renamed", due=2 * DAY, is_complete=True, note="done")) is True
+    assert fields(store.get(1)) == fields(make_task(1, "Renamed", due=2 * DAY, is_complete=True, note="done"))
+    assert store.update(make_task(2)) is False
+    assert store.exists(2) is False
+
+
+def test_delete(store):
+    store.insert(make_task(1))
+    deleted = store.delete(1)
+    assert fields(deleted) == fields(make_task(1))
+    assert store.delete(1) is None
+    assert store.get(1) is None
+
+
+def test_complete(store):
+    store.insert(make_task(1))
+    assert store.complete(1) == ("Task 1", False)
+    assert store.complete(1) == ("Task 1", True)
+    assert store.get(1).is_complete is True
+    assert store.complete(2) is None
+
+
+def test_stats_and_counts(store):
+    seed(store)
+    assert store.stats(BASE) == (8, 3, 5, 2)
+    assert store.stats(BASE + timedelta(days=2)) == (8, 3, 5, 3)
+    store.complete(2)
+    store.delete(8)
+    assert store.stats(BASE) == (7, 4, 3, 0)
+    assert store.count() == 7
+    assert store.count(is_complete=True) == 4
+    assert store.count(is_complete=False) == 3
+
+
+def test_iter_tasks(store):
+    tasks = seed(store)
+    assert sorted(task.task_id for task in store.iter_tasks()) == [task.task_id for task in tasks]
+    assert sorted(task.task_id for task in store.iter_tasks(is_complete=True)) == [4, 5, 6]
+    assert sorted(task.task_id for task in store.iter_tasks(is_complete=False)) == [1, 2, 3, 7, 8]
+
+
+def test_iter_tasks_between_batches_holds_nothing(store):
+    seed(store)
+    tasks = store.iter_tasks()
+    next(tasks)
+    # Another thread writes while the iterator is paused, and again after it is dropped
+    counts = []
+    for _ in range(2):
+        writer = threading.Thread(target=lambda: counts.append(store.insert(make_task(100 + len(counts)))))
+        writer.start()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        tasks = None
+    assert counts == [True, True]
+
+
+def expected_order(tasks, order_by):
+    # Tasks with a value first, then the ones without, ties and missing values ordered by task id
+    return [task.task_id for task in sorted(tasks, key=lambda task: (getattr(task, order_by) is None,
+                                                                     getattr(task, order_by) or 0,
+                                                                     task.task_id))]
+
+
+def read_all_pages(store, order_by, page_size, is_complete=None, due_after=None, due_before=None):
+    task_ids, cursor = [], None
+    while True:
+        page = store.list_page(is_complete, due_after, due_before, order_by, page_size, cursor)
+        assert len(page.tasks) <= page_size
+        task_ids += [task.task_id for task in page.tasks]
+        if page.next_cursor is None:
+            return task_ids
+        cursor = page.next_cursor
+
+
+@pytest.mark.parametrize("order_by", ORDER_COLUMNS)
+@pytest.mark.parametrize("page_size", [1, 3, 100])
+def test_list_page_walks_every_task_in_order(store, order_by, page_size):
+    tasks = seed(store)
+    assert read_all_pages(store, order_by, page_size) == expected_order(tasks, order_by)
+
+
+@pytest.mark.parametrize("order_by", ORDER_COLUMNS)
+def test_list_page_filters(store, order_by):
+    tasks = seed(store)
+    incomplete = [task for task in tasks if not task.is_complete]
+    assert read_all_pages(store, order_by, 2, is_complete=False) == expected_order(incomplete, order_by)
+
+    due_after, due_before = BASE - timedelta(days=2), BASE + timedelta(days=3)
+    in_range = [task for task in tasks if task.due_date is not None and due_after <= task.due_date < due_before]
+    assert read_all_pages(store, order_by, 2, due_after=due_after, due_before=due_before) == \
+        expected_order(in_range, order_by)
+
+
+def test_list_page_invalid_order(store):
+    with pytest.raises(ValueError):
+        store.list_page(None, None, None, "title", 10, None)
+
+
+def test_failures_raise_storage_error(store):
+    if isinstance(store, MemoryTaskStore):
+        pytest.skip("the memory store has no failures")
+    store.insert(make_task(1))
+    store.close()
+    # A closed store fails every operation instead of reporting a missing task
+    for operation in (lambda: store.get(1), lambda: store.exists(1), lambda: store.insert(make_task(2)),
+                      lambda: store.complete(1), lambda: store.count()):
+        with pytest.raises(StorageError):
+            operation()
+
+
+def test_bulk_insert(store):
+    store.insert(make_task(1, "Existing"))
+    progress = []
+    tasks = [make_task(task_id, due=task_id * DAY) for task_id in range(1, 6)]
+    tasks.append(make_task(5, "Last wins", due=9 * DAY))
+    assert store.bulk_insert(tasks, batch_size=3, progress=lambda *counts: progress.append(counts)) == (6, 4)
+    assert progress == [(3, 2), (6, 4)]
+    assert store.get(1).title == "Existing"
+    assert store.get(5).title == "Last wins"
+    assert store.count() == 5
+
+    assert store.bulk_insert([make_task(1, "Replaced")], on_conflict="update") == (1, 1)
+    assert store.get(1).title == "Replaced"
+    with pytest.raises(ValueError):
+        store.bulk_insert([], on_conflict="merge")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "jsonl"])
+def test_export_round_trip(store, fmt):
+    tasks = seed(store)
+    stream = io.StringIO()
+    assert store.export(stream, fmt) == len(tasks)
+    stream.seek(0)
+    assert [fields(task) for task in read_tasks(stream, fmt)] == [fields(task) for task in tasks]
+
+
+def test_create_store_selects_backend(monkeypatch, tmp_path):
+    monkeypatch.setenv("TODO_SQLITE_PATH", str(tmp_path / "env.db"))
+    assert isinstance(create_store("memory"), MemoryTaskStore)
+    monkeypatch.setenv("TODO_BACKEND", "sqlite")
+    sqlite_store = create_store()
+    assert isinstance(sqlite_store, SQLiteTaskStore)
+    assert sqlite_store.path == str(tmp_path / "env.db")
+    sqlite_store.close()
+    with pytest.raises(ValueError):
+        create_store("oracle")
+
+
+def test_apply_writes_in_order(store):
+    store.insert(make_task(9))
+    ops = [WriteOp(INSERT, 1, make_task(1)), WriteOp(INSERT, 2, make_task(2, due=2 * DAY)),
+           WriteOp(INSERT, 1, make_task(1, "Duplicate", due=5 * DAY)),
+           WriteOp(UPDATE, 2, make_task(2, "Two", due=3 * DAY)),
+           WriteOp(COMPLETE, 1), WriteOp(COMPLETE, 1), WriteOp(DELETE, 2), WriteOp(DELETE, 3),
+           WriteOp(UPDATE, 3, make_task(3)), WriteOp(DELETE, 9)]
+    results = store.apply_writes(ops)
+
+    assert results[:6] == [True, True, False, True, ("Task 1", False), ("Task 1", True)]
+    assert fields(results[6]) == fields(make_task(2, "Two", due=3 * DAY))
+    assert results[7:9] == [None, False]
+    assert fields(results[9]) == fields(make_task(9))
+    assert fields(store.get(1)) == fields(make_task(1, is_complete=True))
+    assert store.count() == 1
+
+
+def test_search(store):
+    store.insert(make_task(1, "Grocery shopping", note="milk and eggs"))
+    store.insert(make_task(2, "Call plumber", note="kitchen sink before grocery run"))
+    store.insert(make_task(3, "Milk the cow", note=None))
+    store.insert(make_task(4, "Tax return", note="grocery receipts"))
+
+    # Title matches rank above note matches, the order among note matches depends on the backend
+    found = [task.task_id for task in store.search("grocery", 10)]
+    assert found[0] == 1 and sorted(found) == [1, 2, 4]
+    assert [task.task_id for task in store.search("groc", 1)] == [1]
+    assert [task.task_id for task in store.search("Milk!", 10)] == [3, 1]
+    assert [task.task_id for task in store.search("milk groc", 10)] == [1]
+    assert fields(store.search("plumb", 10)[0]) == fields(make_task(2, "Call plumber",
+                                                                    note="kitchen sink before grocery run"))
+    assert store.search("zebra", 10) == []
+    assert store.search("  ?! ", 10) == []
+
+    store.update(make_task(1, "Hardware store", note=None))
+    store.delete(2)
+    store.complete(4)
+    assert [task.task_id for task in store.search("grocery", 10)] == [4]
+    assert [task.task_id for task in store.search("hardware", 10)] == [1]
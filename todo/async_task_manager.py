@@ -0,0 +1,318 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/async_task_manager.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Asyncio version of the task manager on a pooled asyncpg connection
+############################################################
+
+from datetime import datetime
+from typing import AsyncIterator
+import asyncio
+import contextlib
+import itertools
+import os
+import re
+
+import asyncpg
+import psycopg2
+
+from .pagination import TaskPage, build_page, page_queries
+from .results import WriteResult
+from .task import Task
+from .task_stats import TaskStats
+from db_config.change_feed import CHANGE_CHANNEL, LATEST_CHANGE, READ_CHANGES, ChangeCursor, ChangeEvent
+from db_config.database_config import get_connection_params, load_env
+from db_config.errors import StorageError
+from db_config.migrations import Migration, migrate_schema
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, WriteOp
+
+TASK_COLUMNS: str = "task_id, title, created_at, due_date, is_complete, note"
+
+
+def numbered_params(query: str) -> str:
+    """
+    Converts psycopg2 %s placeholders to the $1, $2, ... placeholders used by asyncpg.
+    :param query: SQL query with %s placeholders
+    :return: SQL query with numbered placeholders
+    """
+    counter = itertools.count(1)
+    return re.sub(r"%s", lambda _: f"${next(counter)}", query)
+
+
+def run_migrations() -> list[Migration]:
+    """
+    Brings the schema up to date over a psycopg2 connection opened from the DB_* environment variables.
+    :return: Migrations applied by this call
+    """
+    conn = psycopg2.connect(**get_connection_params())
+    try:
+        conn.autocommit = True
+        return migrate_schema(conn)
+    finally:
+        conn.close()
+
+
+class AsyncTaskManager:
+    def __init__(self, pool: asyncpg.Pool) -> None:
+        """
+        Wraps an existing asyncpg pool, use create() to open one from the DB_* environment variables.
+        :param pool: Connection pool shared by every operation
+        """
+        self.pool = pool
+
+    @classmethod
+    async def create(cls, min_size: int | None = None, max_size: int | None = None) -> "AsyncTaskManager":
+        """
+        Opens a connection pool and brings the schema up to date.
+        :param min_size: Connections opened up front, defaults to DB_POOL_MIN
+        :param max_size: Maximum number of connections, defaults to DB_POOL_MAX
+        :return: Ready to use manager
+        """
+        load_env()
+        try:
+            pool: asyncpg.Pool = await asyncpg.create_pool(
+                **get_connection_params(),
+                min_size=min_size if min_size is not None else int(os.getenv("DB_POOL_MIN", "1")),
+                max_size=max_size if max_size is not None else int(os.getenv("DB_POOL_MAX", "10")),
+            )
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error connecting to the database") from error
+        manager = cls(pool)
+        await manager.migrate()
+        return manager
+
+    async def migrate(self) -> list[int]:
+        """
+        Applies pending schema migrations with the runner of the sync manager, in a worker thread.
+        Connects with the DB_* environment variables, not through the pool.
+        :return: Versions applied by this call
+        """
+        try:
+            applied: list[Migration] = await asyncio.to_thread(run_migrations)
+        except (Exception, psycopg2.DatabaseError) as error:
+            raise StorageError("Error migrating database schema") from error
+        return [migration.version for migration in applied]
+
+    async def add_task(self, task: Task) -> WriteResult:
+        """
+        Adds a task to the database.
+        :param task: Task to add
+        :return: Write result, not ok if the task id already exists
+        """
+        try:
+            task_id = await self.pool.fetchval(
+                "INSERT INTO tasks (task_id, title, created_at, due_date, is_complete, note) "
+                "VALUES ($1, $2, $3, $4, $5, $6) ON CONFLICT (task_id) DO NOTHING RETURNING task_id",
+                task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error adding task") from error
+        return WriteResult.from_store(WriteOp(INSERT, task.task_id, task), task_id is not None)
+
+    async def is_task(self, task_id: int) -> bool:
+        """
+        Checks if the task is in the database.
+        :param task_id: Task id to check
+        :return: True if task is in the database else False
+        """
+        try:
+            return await self.pool.fetchval("SELECT EXISTS (SELECT 1 FROM tasks WHERE task_id = $1)", task_id)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error checking task") from error
+
+    async def get_task(self, task_id: int) -> Task | None:
+        """
+        Gets a task from the database.
+        :param task_id: Task to get
+        :return: Task or None if task does not exist
+        """
+        try:
+            row = await self.pool.fetchrow(f"SELECT {TASK_COLUMNS} FROM tasks WHERE task_id = $1", task_id)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error getting task") from error
+        return Task.from_row(row) if row else None
+
+    async def update_task(self, task: Task) -> WriteResult:
+        """
+        Updates a task in the database.
+        :param task: Task with the new values
+        :return: Write result, not ok if the task does not exist
+        """
+        try:
+            task_id = await self.pool.fetchval(
+                "UPDATE tasks SET title = $1, created_at = $2, due_date = $3, is_complete = $4, note = $5 "
+                "WHERE task_id = $6 RETURNING task_id",
+                task.title, task.created_at, task.due_date, task.is_complete, task.note, task.task_id)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error updating task") from error
+        return WriteResult.from_store(WriteOp(UPDATE, task.task_id, task), task_id is not None)
+
+    async def delete_task(self, task_id: int) -> WriteResult:
+        """
+        Deletes a task from the database.
+        :param task_id: Task id to delete
+        :return: Write result with the deleted task, not ok if it does not exist
+        """
+        try:
+            row = await self.pool.fetchrow(f"DELETE FROM tasks WHERE task_id = $1 RETURNING {TASK_COLUMNS}", task_id)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error deleting task") from error
+        return WriteResult.from_store(WriteOp(DELETE, task_id), Task.from_row(row) if row else None)
+
+    async def set_complete(self, task_id: int) -> WriteResult:
+        """
+        Sets a task complete.
+        :param task_id: Task id to change the status
+        :return: Write result, completed or already complete, not ok if the task does not exist
+        """
+        try:
+            row = await self.pool.fetchrow(
+                "WITH target AS ("
+                "SELECT task_id, title, is_complete FROM tasks WHERE task_id = $1 FOR UPDATE), "
+                "updated AS ("
+                "UPDATE tasks SET is_complete = TRUE FROM target "
+                "WHERE tasks.task_id = target.task_id AND target.is_complete IS NOT TRUE "
+                "RETURNING tasks.task_id) "
+                "SELECT title, is_complete IS TRUE FROM target", task_id)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error completing task") from error
+        return WriteResult.from_store(WriteOp(COMPLETE, task_id), (row[0], row[1]) if row else None)
+
+    async def stats(self, now: datetime | None = None) -> TaskStats:
+        """
+        Counts total, completed, incomplete and overdue tasks with a single query.
+        :param now: Tasks due before this time are overdue, defaults to the current time
+        :return: Task counts
+        """
+        try:
+            row = await self.pool.fetchrow(
+                "SELECT COUNT(*), "
+                "COUNT(*) FILTER (WHERE is_complete), "
+                "COUNT(*) FILTER (WHERE NOT is_complete), "
+                "COUNT(*) FILTER (WHERE NOT is_complete AND due_date < $1) "
+                "FROM tasks", now or datetime.now())
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error counting tasks") from error
+        return TaskStats(*row)
+
+    async def count_total_tasks(self) -> int:
+        """
+        Counts the total number of tasks in the database.
+        :return: Number of tasks in the database
+        """
+        try:
+            return await self.pool.fetchval("SELECT COUNT(*) FROM tasks")
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error counting tasks") from error
+
+    async def count_completed_task(self) -> int:
+        """
+        Counts the total number of completed tasks in the database.
+        :return: Number of completed tasks in the database
+        """
+        try:
+            return await self.pool.fetchval("SELECT COUNT(*) FROM tasks WHERE is_complete = $1", True)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error counting tasks") from error
+
+    async def count_incompleted_tasks(self) -> int:
+        """
+        Counts the total number of incompleted tasks in the database.
+        :return: Number of incompleted tasks in the database
+        """
+        try:
+            return await self.pool.fetchval("SELECT COUNT(*) FROM tasks WHERE is_complete = $1", False)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error counting tasks") from error
+
+    async def list_tasks(self, is_complete: bool | None = None, due_after: datetime | None = None,
+                         due_before: datetime | None = None, order_by: str = "due_date", page_size: int = 50,
+                         cursor: str | None = None) -> TaskPage:
+        """
+        Gets one page of tasks using keyset pagination, see TaskManager.list_tasks.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :param due_after: Only tasks due at or after this time
+        :param due_before: Only tasks due before this time
+        :param order_by: Column to order by, one of due_date, created_at or task_id
+        :param page_size: Maximum number of tasks in the page
+        :param cursor: Cursor from the previous page, None for the first page
+        :return: Page of tasks and the cursor of the next page
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        limit: int = page_size + 1
+        tasks: list[Task] = []
+        for query_stmt, params in page_queries(f"SELECT {TASK_COLUMNS} FROM tasks", order_by, cursor,
+                                               is_complete, due_after, due_before):
+            try:
+                rows = await self.pool.fetch(numbered_params(query_stmt), *params, limit - len(tasks))
+            except (Exception, asyncpg.PostgresError) as error:
+                raise StorageError("Error listing tasks") from error
+            tasks += Task.from_rows(rows)
+            if len(tasks) >= limit:
+                break
+        return build_page(tasks, page_size, order_by)
+
+    async def iter_tasks(self, is_complete: bool | None = None, prefetch: int | None = None) -> AsyncIterator[Task]:
+        """
+        Streams tasks through a server-side cursor without loading them all into memory.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :param prefetch: Rows fetched per round trip, defaults to DB_ITERSIZE
+        :return: Async iterator of tasks
+        """
+        prefetch = prefetch or int(os.getenv("DB_ITERSIZE", "2000"))
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    if is_complete is None:
+                        rows = conn.cursor(f"SELECT {TASK_COLUMNS} FROM tasks", prefetch=prefetch)
+                    else:
+                        rows = conn.cursor(f"SELECT {TASK_COLUMNS} FROM tasks WHERE is_complete = $1", is_complete,
+                                           prefetch=prefetch)
+                    async for row in rows:
+                        yield Task.from_row(row)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error streaming tasks") from error
+
+    async def changes(self, after: int | None = None, batch_size: int = 500,
+                      poll_interval: float = 1.0) -> AsyncIterator[ChangeEvent]:
+        """
+        Yields task changes as they are committed, woken by LISTEN/NOTIFY, until the consumer stops.
+        Holds one connection of the pool while iterating.
+        :param after: Sequence number of the last event already handled, 0 for the whole log,
+                      None to receive only changes committed from now on
+        :param batch_size: Maximum number of events read per query
+        :param poll_interval: Seconds to wait for a notification before checking the log again
+        :return: Async iterator of change events in sequence order
+        """
+        woken = asyncio.Event()
+
+        def wake(*args) -> None:
+            woken.set()
+
+        try:
+            async with self.pool.acquire() as conn:
+                await conn.add_listener(CHANGE_CHANNEL, wake)
+                try:
+                    cursor = ChangeCursor(after if after is not None else await conn.fetchval(LATEST_CHANGE))
+                    while True:
+                        woken.clear()
+                        rows = await conn.fetch(numbered_params(READ_CHANGES), cursor.position, batch_size)
+                        events: list[ChangeEvent] = cursor.advance([tuple(row) for row in rows])
+                        for event in events:
+                            yield event
+                        if len(events) < batch_size:
+                            with contextlib.suppress(asyncio.TimeoutError):
+                                await asyncio.wait_for(woken.wait(), poll_interval)
+                finally:
+                    await conn.remove_listener(CHANGE_CHANNEL, wake)
+        except (Exception, asyncpg.PostgresError) as error:
+            raise StorageError("Error reading task changes") from error
+
+    async def close(self) -> None:
+        """
+        Closes every connection of the pool.
+        :return: None
+        """
+        await self.pool.close()
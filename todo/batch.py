@@ -0,0 +1,212 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/batch.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Runs newline-delimited JSON task operations in batched transactions
+############################################################
+
+from typing import Iterable, Iterator, TextIO
+import csv
+import json
+
+from .results import ALREADY_COMPLETE, DELETED, EXISTS, WriteResult, error_message
+from .task import Task
+from .task_io import parse_bool, parse_datetime, task_from_record
+from .task_manager import TaskManager
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, WriteOp, task_to_record
+
+BATCH_OPS: tuple[str, ...] = ("add", "get", "list", "update", "delete", "complete", "stats")
+OUTPUT_FORMATS: tuple[str, ...] = ("json", "csv")
+
+# CSV columns of the records written for each kind of output
+TASK_FIELDS: tuple[str, ...] = ("task_id", "title", "created_at", "due_date", "is_complete", "note")
+STATS_FIELDS: tuple[str, ...] = ("total", "completed", "incomplete", "overdue")
+RESULT_FIELDS: tuple[str, ...] = ("line", "op", "task_id", "ok", "error", "result")
+
+# Fields an update must carry to be applied without reading the task first
+UPDATE_FIELDS: frozenset[str] = frozenset(("title", "created_at", "due_date", "is_complete", "note"))
+
+
+class RecordWriter:
+    def __init__(self, stream: TextIO, fmt: str, fields: tuple[str, ...]) -> None:
+        """
+        Writes records as JSON Lines or as CSV with a header row.
+        Nested values are written as JSON text in CSV.
+        :param stream: Text stream to write to
+        :param fmt: "json" or "csv"
+        :param fields: CSV columns, in order
+        """
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format {fmt!r}")
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        self._csv: csv.DictWriter | None = None
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=fields, extrasaction="ignore")
+            self._csv.writeheader()
+
+    def write(self, record: dict) -> None:
+        """
+        Writes one record.
+        :param record: Record keyed by field name
+        :return: None
+        """
+        if self._csv is None:
+            self.stream.write(json.dumps(record) + "\n")
+            return
+        self._csv.writerow({key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                            for key, value in record.items()})
+
+
+def apply_changes(task: Task, record: dict) -> Task:
+    """
+    Copies a task with the fields present in a record replaced.
+    :param task: Current task
+    :param record: Decoded operation with some of the task fields
+    :return: Updated task
+    """
+    return Task(task.task_id,
+                record["title"] if "title" in record else task.title,
+                parse_datetime(record["created_at"]) if "created_at" in record else task.created_at,
+                parse_datetime(record["due_date"]) if "due_date" in record else task.due_date,
+                parse_bool(record["is_complete"]) if "is_complete" in record else task.is_complete,
+                record["note"] if "note" in record else task.note)
+
+
+def write_result(op: WriteOp, result) -> dict:
+    """
+    Describes the outcome of an applied write.
+    :param op: Applied write
+    :param result: Result returned by the store
+    :return: ok flag plus the error or the affected task
+    """
+    outcome = WriteResult.from_store(op, result)
+    if not outcome.ok:
+        return {"ok": False, "error": "exists" if outcome.status == EXISTS else "not found"}
+    if outcome.status == DELETED:
+        return {"ok": True, "result": task_to_record(outcome.task)}
+    if op.kind == COMPLETE:
+        return {"ok": True,
+                "result": {"title": outcome.title, "already_complete": outcome.status == ALREADY_COMPLETE}}
+    return {"ok": True}
+
+
+class BatchRunner:
+    def __init__(self, manager: TaskManager, batch_size: int = 500) -> None:
+        """
+        Runs operations over the manager's connection.
+        Consecutive writes are applied together, batch_size per transaction; a read first applies
+        the writes before it, so every operation sees the ones before it.
+        :param manager: Task manager to run the operations with
+        :param batch_size: Writes per transaction
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.manager = manager
+        self.batch_size = batch_size
+        # (line number, operation name, write) waiting for the next transaction
+        self._pending: list[tuple[int, str, WriteOp]] = []
+
+    def run(self, lines: Iterable[str]) -> Iterator[dict]:
+        """
+        Runs one JSON operation per line, for example {"op": "complete", "task_id": 7}.
+        :param lines: Lines of newline-delimited JSON, blank lines are skipped
+        :return: Iterator of one result per operation, in input order, with line, op, task_id, ok
+                 and either error or the result of the operation
+        """
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record: dict = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("operation must be a JSON object")
+                name: str = record.get("op")
+                if name not in BATCH_OPS:
+                    raise ValueError(f"unknown op {name!r}, expected one of {', '.join(BATCH_OPS)}")
+                op: WriteOp | None = self._write_op(name, record)
+            except (ValueError, KeyError, TypeError) as error:
+                yield from self.flush()
+                yield {"line": line_no, "op": None, "task_id": None, "ok": False, "error": f"invalid: {error}"}
+                continue
+            if op is not None:
+                self._pending.append((line_no, name, op))
+                if len(self._pending) >= self.batch_size:
+                    yield from self.flush()
+                continue
+            yield from self.flush()
+            try:
+                result: dict = self._read(name, record)
+            except (ValueError, KeyError, TypeError) as error:
+                result = {"task_id": record.get("task_id"), "ok": False, "error": f"invalid: {error}"}
+            except Exception as error:
+                result = {"task_id": record.get("task_id"), "ok": False, "error": error_message(error)}
+            yield {"line": line_no, "op": name, **result}
+        yield from self.flush()
+
+    def _write_op(self, name: str, record: dict) -> WriteOp | None:
+        """
+        Builds the write of an operation.
+        :param name: Operation name
+        :param record: Decoded operation
+        :return: Write to queue or None for operations that have to run now
+        """
+        if name == "add":
+            return WriteOp(INSERT, int(record["task_id"]), task_from_record(record))
+        if name == "delete":
+            return WriteOp(DELETE, int(record["task_id"]))
+        if name == "complete":
+            return WriteOp(COMPLETE, int(record["task_id"]))
+        if name == "update" and UPDATE_FIELDS <= record.keys():
+            # Every field is given, so the task does not have to be read first
+            return WriteOp(UPDATE, int(record["task_id"]), task_from_record(record))
+        return None
+
+    def _read(self, name: str, record: dict) -> dict:
+        """
+        Runs an operation that reads, including updates that only change some fields.
+        :param name: Operation name
+        :param record: Decoded operation
+        :return: Result fields of the operation
+        """
+        if name == "stats":
+            stats = self.manager.stats()
+            return {"task_id": None, "ok": True, "result": dict(zip(STATS_FIELDS, stats))}
+        if name == "list":
+            page = self.manager.list_tasks(is_complete=parse_bool(record["is_complete"])
+                                           if record.get("is_complete") is not None else None,
+                                           order_by=record.get("order_by", "due_date"),
+                                           page_size=int(record.get("page_size", 50)),
+                                           cursor=record.get("cursor"))
+            return {"task_id": None, "ok": True,
+                    "result": {"tasks": [task_to_record(task) for task in page.tasks],
+                               "next_cursor": page.next_cursor}}
+        task_id: int = int(record["task_id"])
+        task: Task | None = self.manager.get_task(task_id)
+        if task is None:
+            return {"task_id": task_id, "ok": False, "error": "not found"}
+        if name == "get":
+            return {"task_id": task_id, "ok": True, "result": task_to_record(task)}
+        op = WriteOp(UPDATE, task_id, apply_changes(task, record))
+        return {"task_id": task_id, **write_result(op, self.manager.apply_writes([op])[0])}
+
+    def flush(self) -> Iterator[dict]:
+        """
+        Applies the queued writes in one transaction.
+        If the transaction fails none of them is applied and each reports the error.
+        :return: Iterator of the results of the queued writes
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        try:
+            results: list = self.manager.apply_writes([op for _, _, op in pending])
+        except Exception as error:
+            for line_no, name, op in pending:
+                yield {"line": line_no, "op": name, "task_id": op.task_id, "ok": False, "error": error_message(error)}
+            return
+        for (line_no, name, op), result in zip(pending, results):
+            yield {"line": line_no, "op": name, "task_id": op.task_id, **write_result(op, result)}
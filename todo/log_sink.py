@@ -0,0 +1,121 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/log_sink.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Buffered logging sink for the status messages of the storage layer and the task manager
+############################################################
+
+from typing import TextIO
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+
+# Loggers of the packages, every module logs to a child of one of them
+LOGGERS: tuple[str, ...] = ("todo", "db_config")
+LOG_FORMAT: str = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class BufferedLogSink(logging.handlers.MemoryHandler):
+    def __init__(self, target: logging.Handler, capacity: int = 1000, flush_level: int = logging.ERROR,
+                 flush_interval: float | None = 1.0) -> None:
+        """
+        Keeps log records in memory and writes them to the target handler in batches, so logging
+        costs a list append on the thread that logs instead of a write.
+        Records are written when capacity is reached, when a record at flush_level or above arrives,
+        every flush_interval seconds and when the sink is closed.
+        :param target: Handler that writes the records
+        :param capacity: Number of records kept before they are written
+        :param flush_level: Records at this level or above are written at once with those before them
+        :param flush_interval: Seconds between background flushes, None to flush only on the other triggers
+        """
+        super().__init__(capacity, flushLevel=flush_level, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        if flush_interval:
+            self._thread = threading.Thread(target=self._run, name="todo-log-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Flushes every flush_interval seconds until the sink is closed.
+        :return: None
+        """
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """
+        Stops the background flusher, writes the buffered records and closes the target.
+        :return: None
+        """
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        target: logging.Handler | None = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+def install_log_sink(path: str | None = None, stream: TextIO | None = None, level: int = logging.INFO,
+                     capacity: int = 1000, flush_interval: float | None = 1.0) -> BufferedLogSink:
+    """
+    Sends the log records of the todo and db_config packages to a buffered sink.
+    :param path: File to append the records to, stream is used when None
+    :param stream: Text stream to write to, defaults to stderr
+    :param level: Lowest level recorded
+    :param capacity: Number of records kept before they are written
+    :param flush_interval: Seconds between background flushes, None to flush only when full or on errors
+    :return: Installed sink, pass it to remove_log_sink to write the rest and detach it
+    """
+    target: logging.Handler = (logging.FileHandler(path, encoding="utf-8") if path
+                               else logging.StreamHandler(stream or sys.stderr))
+    target.setFormatter(logging.Formatter(LOG_FORMAT))
+    sink = BufferedLogSink(target, capacity=capacity, flush_interval=flush_interval)
+    for name in LOGGERS:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        logger.addHandler(sink)
+    return sink
+
+
+def remove_log_sink(sink: logging.Handler) -> None:
+    """
+    Detaches a sink from the package loggers and closes it, writing what it still holds.
+    :param sink: Handler returned by install_log_sink or configure_logging
+    :return: None
+    """
+    for name in LOGGERS:
+        logger = logging.getLogger(name)
+        logger.removeHandler(sink)
+        if not logger.handlers:
+            logger.setLevel(logging.NOTSET)
+    sink.close()
+
+
+def configure_logging() -> logging.Handler:
+    """
+    Sets up logging for the command line program from the environment: records at TODO_LOG_LEVEL
+    (WARNING by default) go to stderr as they happen, or through a buffered sink to the file
+    TODO_LOG_FILE when it is set, flushed every TODO_LOG_FLUSH_MS milliseconds (1000).
+    :return: Installed handler, pass it to remove_log_sink on exit
+    """
+    level: int = logging.getLevelName(os.getenv("TODO_LOG_LEVEL", "WARNING").upper())
+    if not isinstance(level, int):
+        level = logging.WARNING
+    path: str | None = os.getenv("TODO_LOG_FILE")
+    if path:
+        return install_log_sink(path=path, level=level,
+                                flush_interval=float(os.getenv("TODO_LOG_FLUSH_MS", "1000")) / 1000)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    for name in LOGGERS:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        logger.addHandler(handler)
+    return handler
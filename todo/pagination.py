@@ -0,0 +1,133 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/pagination.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Page of tasks and opaque keyset cursors for paginated listings
+############################################################
+
+from datetime import datetime
+from typing import NamedTuple
+import base64
+import binascii
+import json
+
+from .task import Task
+
+# Columns a listing can be ordered by, task_id always breaks ties
+ORDER_COLUMNS: tuple[str, ...] = ("due_date", "created_at", "task_id")
+
+
+class TaskPage(NamedTuple):
+    """
+    One page of a task listing.
+    next_cursor is passed back to get the following page and is None on the last page.
+    """
+    tasks: list[Task]
+    next_cursor: str | None
+
+
+def encode_cursor(order_by: str, task: Task) -> str:
+    """
+    Builds the cursor pointing just after the given task.
+    :param order_by: Column the listing is ordered by
+    :param task: Last task of the current page
+    :return: Opaque URL-safe cursor string
+    """
+    value = getattr(task, order_by)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload: bytes = json.dumps({"o": order_by, "v": value, "id": task.task_id}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> tuple[datetime | int | None, int]:
+    """
+    Reads the position stored in a cursor.
+    :param cursor: Cursor returned with a previous page
+    :param order_by: Column the listing is ordered by, must match the cursor
+    :return: Tuple of the last sort value and the last task id
+    """
+    try:
+        padded: str = cursor + "=" * (-len(cursor) % 4)
+        payload: dict = json.loads(base64.urlsafe_b64decode(padded))
+        value, task_id = payload["v"], int(payload["id"])
+        cursor_order: str = payload["o"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as error:
+        raise ValueError("Invalid page cursor") from error
+    if cursor_order != order_by:
+        raise ValueError(f"Cursor was created for ordering by {cursor_order}, not {order_by}")
+    if value is not None and order_by != "task_id":
+        value = datetime.fromisoformat(value)
+    return value, task_id
+
+
+def page_queries(select_stmt: str, order_by: str = "due_date", cursor: str | None = None,
+                 is_complete: bool | None = None, due_after: datetime | None = None,
+                 due_before: datetime | None = None) -> list[tuple[str, list]]:
+    """
+    Builds the keyset queries for one page.
+    Tasks with a value in the order column are read first, tasks without one follow ordered by task id.
+    The caller runs the queries in order, appending the number of rows still needed as the LIMIT
+    parameter, and stops once the page is full.
+    :param select_stmt: SELECT ... FROM part of the query
+    :param order_by: Column to order by, one of ORDER_COLUMNS
+    :param cursor: Cursor from the previous page, None for the first page
+    :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+    :param due_after: Only tasks due at or after this time
+    :param due_before: Only tasks due before this time
+    :return: List of queries ending in "LIMIT %s" with their parameters, without the limit
+    """
+    if order_by not in ORDER_COLUMNS:
+        raise ValueError(f"Cannot order tasks by {order_by!r}")
+
+    conditions: list[str] = []
+    params: list = []
+    if is_complete is not None:
+        conditions.append("is_complete = %s")
+        params.append(is_complete)
+    if due_after is not None:
+        conditions.append("due_date >= %s")
+        params.append(due_after)
+    if due_before is not None:
+        conditions.append("due_date < %s")
+        params.append(due_before)
+    last_value, last_id = decode_cursor(cursor, order_by) if cursor else (None, None)
+
+    def query(keyset: list[str], keyset_params: list, order: str) -> tuple[str, list]:
+        where: str = " AND ".join(conditions + keyset)
+        return (f"{select_stmt}{' WHERE ' + where if where else ''} ORDER BY {order} LIMIT %s",
+                params + keyset_params)
+
+    if order_by == "task_id":
+        if last_id is None:
+            return [query([], [], "task_id")]
+        return [query(["task_id > %s"], [last_id], "task_id")]
+
+    queries: list[tuple[str, list]] = []
+    if last_id is None:
+        queries.append(query([f"{order_by} IS NOT NULL"], [], f"{order_by}, task_id"))
+    elif last_value is not None:
+        queries.append(query([f"({order_by}, task_id) > (%s, %s)"], [last_value, last_id], f"{order_by}, task_id"))
+    # Range filters on due_date never match tasks without a due date
+    if not (order_by == "due_date" and (due_after is not None or due_before is not None)):
+        if last_id is not None and last_value is None:
+            queries.append(query([f"{order_by} IS NULL", "task_id > %s"], [last_id], "task_id"))
+        else:
+            queries.append(query([f"{order_by} IS NULL"], [], "task_id"))
+    return queries
+
+
+def build_page(tasks: list[Task], page_size: int, order_by: str) -> TaskPage:
+    """
+    Turns the rows read by the page queries into a page.
+    :param tasks: Up to page_size + 1 tasks, the extra one only tells that another page follows
+    :param page_size: Maximum number of tasks in the page
+    :param order_by: Column the listing is ordered by
+    :return: Page of tasks and the cursor of the next page
+    """
+    if len(tasks) > page_size:
+        tasks = tasks[:page_size]
+        return TaskPage(tasks, encode_cursor(order_by, tasks[-1]))
+    return TaskPage(tasks, None)
@@ -0,0 +1,175 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/parallel.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Applies large batches of task writes on a bounded pool of worker threads
+############################################################
+
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Callable, Iterable, NamedTuple
+import threading
+
+from .task import Task
+from .task_manager import TaskManager
+from db_config.task_store import COMPLETE, DELETE, UPDATE, WriteOp
+
+
+class OperationResult(NamedTuple):
+    """
+    Outcome of one write: the store's result, or the error that stopped it. Writes skipped by
+    cancel() have a CancelledError.
+    """
+    op: WriteOp
+    result: object = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the write took effect.
+        :return: True if applied without error and the task existed (or was new for an insert)
+        """
+        return self.error is None and bool(self.result)
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the write was skipped because the run was cancelled.
+        :return: True if skipped else False
+        """
+        return isinstance(self.error, CancelledError)
+
+
+def split_chunks(ops: list[WriteOp], chunk_size: int) -> list[list[int]]:
+    """
+    Splits writes into chunks of their positions, ordered by task id.
+    Chunks cover disjoint task ids, so workers never wait for each other's row locks, and the writes
+    to one task stay in one chunk in their original order.
+    :param ops: Writes in the order they were made
+    :param chunk_size: Target number of writes per chunk
+    :return: Positions in ops of the writes of every chunk
+    """
+    order: list[int] = sorted(range(len(ops)), key=lambda index: ops[index].task_id)
+    chunks: list[list[int]] = []
+    chunk: list[int] = []
+    for index in order:
+        if len(chunk) >= chunk_size and ops[chunk[-1]].task_id != ops[index].task_id:
+            chunks.append(chunk)
+            chunk = []
+        chunk.append(index)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class ParallelTaskExecutor:
+    def __init__(self, manager: TaskManager, workers: int | None = None, chunk_size: int = 500) -> None:
+        """
+        Spreads writes over worker threads, each applying one chunk per transaction on its own connection.
+        Throughput grows with the number of connections, so use a pooled manager with DB_POOL_MAX
+        at least the number of workers.
+        :param manager: Task manager to apply the writes with, its cache and write listeners are updated
+        :param workers: Number of worker threads, defaults to the connections the backend can use at once
+        :param chunk_size: Writes per transaction
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        limit: int = manager.store.max_connections()
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be positive")
+        self.manager = manager
+        # More workers than connections would only wait for a free connection
+        self.workers: int = min(workers or limit, limit)
+        self.chunk_size = chunk_size
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Stops the current run, or the next one when none is running: chunks already being applied
+        finish, the others are skipped. Can be called from any thread, including a progress callback.
+        :return: None
+        """
+        self._cancelled.set()
+
+    def _apply(self, ops: list[WriteOp]) -> list[OperationResult]:
+        """
+        Applies a chunk in one transaction. If it fails, its writes are applied one at a time so the
+        error is reported only for the writes that cause it.
+        :param ops: Writes of the chunk
+        :return: Result of every write, in order
+        """
+        if self._cancelled.is_set():
+            return [OperationResult(op, error=CancelledError()) for op in ops]
+        try:
+            return [OperationResult(op, result) for op, result in zip(ops, self.manager.apply_writes(ops))]
+        except Exception as error:
+            if len(ops) == 1:
+                return [OperationResult(ops[0], error=error)]
+        return [result for op in ops for result in self._apply([op])]
+
+    def run(self, ops: Iterable[WriteOp],
+            progress: Callable[[int, int], None] | None = None) -> list[OperationResult]:
+        """
+        Applies writes on the worker threads and waits for them. Chunks commit independently, so a
+        failure or cancel() leaves the chunks already committed applied.
+        :param ops: Writes, those to the same task are applied in the given order
+        :param progress: Called with the number of writes done and the total after every chunk
+        :return: Result of every write, in the order of ops
+        """
+        ops = list(ops)
+        results: list[OperationResult | None] = [None] * len(ops)
+        done: int = 0
+        lock = threading.Lock()
+
+        def finished(chunk: list[int], future: Future) -> None:
+            nonlocal done
+            chunk_results: list[OperationResult] = future.result()
+            with lock:
+                for index, result in zip(chunk, chunk_results):
+                    results[index] = result
+                done += len(chunk)
+                count: int = done
+            if progress is not None:
+                progress(count, len(ops))
+
+        # Leaving the with block waits for every chunk. A cancel() only applies to the run it stopped
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="todo-worker") as pool:
+                for chunk in split_chunks(ops, self.chunk_size):
+                    future: Future = pool.submit(self._apply, [ops[index] for index in chunk])
+                    future.add_done_callback(lambda future, chunk=chunk: finished(chunk, future))
+        finally:
+            self._cancelled.clear()
+        return results
+
+    def complete(self, task_ids: Iterable[int],
+                 progress: Callable[[int, int], None] | None = None) -> list[OperationResult]:
+        """
+        Marks tasks complete.
+        :param task_ids: Task ids to complete
+        :param progress: Called with the number of writes done and the total after every chunk
+        :return: Result of every completion, in the order of task_ids
+        """
+        return self.run((WriteOp(COMPLETE, task_id) for task_id in task_ids), progress)
+
+    def delete(self, task_ids: Iterable[int],
+               progress: Callable[[int, int], None] | None = None) -> list[OperationResult]:
+        """
+        Deletes tasks.
+        :param task_ids: Task ids to delete
+        :param progress: Called with the number of writes done and the total after every chunk
+        :return: Result of every deletion, in the order of task_ids
+        """
+        return self.run((WriteOp(DELETE, task_id) for task_id in task_ids), progress)
+
+    def update(self, tasks: Iterable[Task],
+               progress: Callable[[int, int], None] | None = None) -> list[OperationResult]:
+        """
+        Replaces tasks with new versions.
+        :param tasks: New versions of the tasks
+        :param progress: Called with the number of writes done and the total after every chunk
+        :return: Result of every update, in the order of tasks
+        """
+        return self.run((WriteOp(UPDATE, task.task_id, task) for task in tasks), progress)
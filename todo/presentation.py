@@ -0,0 +1,118 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/presentation.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Terminal output of tasks, write outcomes and errors for the interactive program
+############################################################
+
+from typing import Iterable, TextIO
+import sys
+
+from .results import ALREADY_COMPLETE, COMPLETED, DELETED, EXISTS, INSERTED, UPDATED, WriteResult, error_message
+from .task import Task
+from .task_manager import TaskManager
+from db_config.task_store import WriteOp
+
+
+def format_result(result: WriteResult) -> str:
+    """
+    Describes the outcome of a write in a sentence.
+    :param result: Outcome of the write
+    :return: Message for the user
+    """
+    if result.status == INSERTED:
+        return f"{result.title} inserted to database"
+    if result.status == EXISTS:
+        return f"{result.title} already exists"
+    if result.status == UPDATED:
+        return f"{result.title} updated successfully"
+    if result.status == DELETED:
+        return f"{result.title if result.title is not None else result.op.task_id} deleted successfully"
+    if result.status == COMPLETED:
+        return f"{result.title} marked complete"
+    if result.status == ALREADY_COMPLETE:
+        return f"{result.title} is already complete"
+    return f"Task ID {result.op.task_id} does not exist"
+
+
+class ConsolePresenter:
+    def __init__(self, out: TextIO | None = None) -> None:
+        """
+        Prints tasks and the outcome of operations for the interactive program.
+        :param out: Stream to write to, defaults to the sys.stdout of the moment of each write
+        """
+        self.out = out
+
+    def _print(self, *values) -> None:
+        """
+        Writes one line.
+        :param values: Values printed separated by spaces
+        :return: None
+        """
+        print(*values, file=self.out or sys.stdout)
+
+    def show_tasks(self, tasks: Iterable[Task]) -> None:
+        """
+        Prints tasks as they are produced.
+        :param tasks: Tasks to print
+        :return: None
+        """
+        for task in tasks:
+            self._print("*" * 40)
+            self._print(task)
+            self._print("*" * 40)
+
+    def show_result(self, result: WriteResult) -> None:
+        """
+        Prints the outcome of a write.
+        :param result: Outcome of the write
+        :return: None
+        """
+        self._print(format_result(result))
+
+    def show_error(self, error: BaseException) -> None:
+        """
+        Prints a failed operation.
+        :param error: Raised error
+        :return: None
+        """
+        self._print("Error:", error_message(error))
+
+    def write_applied(self, op: WriteOp | None, result) -> None:
+        """
+        Write listener printing every applied write, including queued ones; bulk imports are skipped.
+        :param op: Applied write or None after a bulk import
+        :param result: Result returned by the store for the write
+        :return: None
+        """
+        if op is not None:
+            self.show_result(WriteResult.from_store(op, result))
+
+    def writes_failed(self, ops: list[WriteOp], error: Exception) -> None:
+        """
+        Error listener printing a failed batch of queued writes.
+        :param ops: Writes of the batch, none of them applied
+        :param error: Raised error
+        :return: None
+        """
+        self._print(f"Error: {len(ops)} queued writes were not applied:", error_message(error))
+
+    def attach(self, manager: TaskManager) -> None:
+        """
+        Prints the outcome of every write made through a manager from now on.
+        :param manager: Task manager to follow
+        :return: None
+        """
+        manager.add_write_listener(self.write_applied)
+        manager.add_error_listener(self.writes_failed)
+
+    def detach(self, manager: TaskManager) -> None:
+        """
+        Stops printing the writes of a manager.
+        :param manager: Task manager followed with attach
+        :return: None
+        """
+        manager.remove_write_listener(self.write_applied)
+        manager.remove_error_listener(self.writes_failed)
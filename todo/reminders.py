@@ -0,0 +1,387 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/reminders.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Scheduler firing reminders for due and overdue tasks from a min-heap of deadlines
+############################################################
+
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple
+import heapq
+import json
+import logging
+import threading
+
+from .task import Task
+from .task_manager import TaskManager
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, WriteOp
+
+logger = logging.getLogger(__name__)
+
+# How long ago a deadline may have passed for the scheduler to still remind it when it starts
+DEFAULT_CATCH_UP: timedelta = timedelta(days=1)
+
+
+class Reminder(NamedTuple):
+    """
+    Reminder passed to the callbacks.
+    overdue is True when the deadline had already passed when the task was scheduled.
+    """
+    task_id: int
+    title: str
+    due_date: datetime
+    overdue: bool
+
+
+def print_reminder(reminder: Reminder) -> None:
+    """
+    Prints a reminder to stdout.
+    :param reminder: Reminder to show
+    :return: None
+    """
+    state: str = "is overdue" if reminder.overdue else "is due"
+    print(f"Reminder: {reminder.title} (task {reminder.task_id}) {state} since {reminder.due_date:%Y-%m-%d %H:%M}")
+
+
+def log_reminder(reminder: Reminder) -> None:
+    """
+    Logs a reminder with the todo.reminders logger.
+    :param reminder: Reminder to log
+    :return: None
+    """
+    logger.warning("Task %s %r %s at %s", reminder.task_id, reminder.title,
+                   "overdue" if reminder.overdue else "due", reminder.due_date.isoformat())
+
+
+class WebhookReminder:
+    def __init__(self, url: str, timeout: float = 5.0,
+                 send: Callable[[str, bytes, float], None] | None = None) -> None:
+        """
+        Callback posting reminders as JSON to a webhook.
+        :param url: Webhook URL
+        :param timeout: Seconds to wait for the webhook
+        :param send: Called with the url, the JSON body and the timeout, posts with urllib by default
+        """
+        self.url = url
+        self.timeout = timeout
+        self._send = send or self.post
+
+    @staticmethod
+    def post(url: str, body: bytes, timeout: float) -> None:
+        """
+        Posts a JSON body.
+        :param url: Webhook URL
+        :param body: JSON encoded reminder
+        :param timeout: Seconds to wait for the webhook
+        :return: None
+        """
+        # Imported here, urllib.request and its ssl and http imports add to the startup time of the app
+        import urllib.request
+        request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"},
+                                         method="POST")
+        with urllib.request.urlopen(request, timeout=timeout):
+            pass
+
+    def __call__(self, reminder: Reminder) -> None:
+        body: bytes = json.dumps({
+            "task_id": reminder.task_id,
+            "title": reminder.title,
+            "due_date": reminder.due_date.isoformat(),
+            "overdue": reminder.overdue,
+        }).encode("utf-8")
+        self._send(self.url, body, self.timeout)
+
+
+class ReminderScheduler:
+    def __init__(self, manager: TaskManager, callbacks: list[Callable[[Reminder], None]] | None = None,
+                 lead_time: timedelta = timedelta(0), catch_up: timedelta | None = DEFAULT_CATCH_UP,
+                 max_sleep: float = 300.0, clock: Callable[[], datetime] = datetime.now,
+                 page_size: int = 1000) -> None:
+        """
+        Creates a scheduler for the incomplete tasks of a task manager.
+        Deadlines are kept in a min-heap and the scheduler thread sleeps until the earliest one, so
+        waiting costs no CPU however many tasks are pending. Writes made through the manager update
+        the heap as they are applied. Each deadline is reminded once: a reminded task is only
+        scheduled again when its due date changes.
+        :param manager: Task manager whose tasks are watched
+        :param callbacks: Called with every reminder, print_reminder by default
+        :param lead_time: How long before the deadline a reminder fires
+        :param catch_up: How long ago a deadline may have passed for loading to remind it as overdue,
+                         a day by default, None to remind every overdue task
+        :param max_sleep: Longest sleep in seconds, bounds the delay after the wall clock is adjusted
+        :param clock: Current time, in the same time zone as the stored due dates
+        :param page_size: Tasks read per query when loading deadlines
+        """
+        self.manager = manager
+        self.callbacks: list[Callable[[Reminder], None]] = list(callbacks) if callbacks is not None \
+            else [print_reminder]
+        self.lead_time = lead_time
+        self.catch_up = catch_up
+        self.max_sleep = max_sleep
+        self.page_size = page_size
+        self._clock = clock
+        self._cond = threading.Condition()
+        # Heap of (fire time, sequence number, task id), entries whose sequence number no longer
+        # matches _tasks are stale and skipped
+        self._heap: list[tuple[datetime, int, int]] = []
+        # Task id to (sequence number, due date, title, overdue)
+        self._tasks: dict[int, tuple[int, datetime, str, bool]] = {}
+        self._seq: int = 0
+        # Task id to the due date it was reminded of, so the same deadline does not fire twice
+        self._reminded: dict[int, datetime] = {}
+        # Writes seen while a reload reads the tasks, replayed on top of what it read
+        self._journal: list[tuple[int, Task | None]] | None = None
+        self._reload_requested = False
+        self._fired: int = 0
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def start(self) -> int:
+        """
+        Loads the deadlines, starts following the manager's writes and starts the scheduler thread.
+        :return: Number of deadlines loaded
+        """
+        self.manager.add_write_listener(self.on_write)
+        loaded: int = self.reload()
+        self._thread = threading.Thread(target=self._run, name="todo-reminders", daemon=True)
+        self._thread.start()
+        return loaded
+
+    def reload(self) -> int:
+        """
+        Reads the incomplete tasks due since catch_up ago, ordered by due date so the partial index on
+        incomplete tasks serves the query, and replaces the scheduled deadlines with them.
+        Deadlines already reminded are skipped.
+        :return: Number of deadlines loaded
+        """
+        with self._cond:
+            self._journal = []
+        due_after: datetime | None = self._clock() - self.catch_up if self.catch_up is not None else None
+        tasks: list[Task] = []
+        cursor: str | None = None
+        try:
+            while True:
+                page = self.manager.list_tasks(is_complete=False, due_after=due_after, order_by="due_date",
+                                               page_size=self.page_size, cursor=cursor)
+                # Tasks without a due date come last
+                tasks += [task for task in page.tasks if task.due_date is not None]
+                if page.next_cursor is None or (page.tasks and page.tasks[-1].due_date is None):
+                    break
+                cursor = page.next_cursor
+        except Exception:
+            with self._cond:
+                self._journal = None
+            raise
+        with self._cond:
+            journal, self._journal = self._journal, None
+            self._tasks.clear()
+            self._heap.clear()
+            for task in tasks:
+                self._schedule(task)
+            for task_id, task in journal:
+                if task is None:
+                    self._forget(task_id)
+                else:
+                    self._schedule(task)
+            self._cond.notify()
+            return len(self._tasks)
+
+    def _schedule(self, task: Task) -> None:
+        """
+        Adds or moves the deadline of a task, or drops it once the task is complete or has no due date.
+        A deadline that was already reminded is not scheduled again. The caller holds the lock.
+        :param task: Current state of the task
+        :return: None
+        """
+        if task.is_complete or task.due_date is None:
+            self._forget(task.task_id)
+            return
+        reminded: datetime | None = self._reminded.get(task.task_id)
+        if reminded is not None:
+            if reminded == task.due_date:
+                return
+            # Moved to a new deadline, which gets its own reminder
+            del self._reminded[task.task_id]
+        current = self._tasks.get(task.task_id)
+        if current is not None and current[1] == task.due_date:
+            # Same deadline, only the title can have changed
+            self._tasks[task.task_id] = (current[0], current[1], task.title, current[3])
+            return
+        self._seq += 1
+        overdue: bool = task.due_date <= self._clock()
+        self._tasks[task.task_id] = (self._seq, task.due_date, task.title, overdue)
+        fire_at: datetime = task.due_date - self.lead_time
+        if not self._heap or fire_at < self._heap[0][0]:
+            # Wake the scheduler thread, it is sleeping until a later deadline
+            self._cond.notify()
+        heapq.heappush(self._heap, (fire_at, self._seq, task.task_id))
+        # Drop stale entries once they make up most of the heap
+        if len(self._heap) > 2 * len(self._tasks) + 1024:
+            self._heap = [(due - self.lead_time, seq, task_id) for task_id, (seq, due, _, _) in self._tasks.items()]
+            heapq.heapify(self._heap)
+
+    def _forget(self, task_id: int) -> None:
+        """
+        Drops the deadline of a task and the record of its reminder, the caller holds the lock.
+        :param task_id: Task id to drop
+        :return: None
+        """
+        self._tasks.pop(task_id, None)
+        self._reminded.pop(task_id, None)
+
+    def schedule(self, task: Task) -> None:
+        """
+        Adds, moves or drops the deadline of a task.
+        :param task: Current state of the task
+        :return: None
+        """
+        with self._cond:
+            if self._journal is not None:
+                self._journal.append((task.task_id, task))
+            self._schedule(task)
+
+    def unschedule(self, task_id: int) -> None:
+        """
+        Drops the deadline of a task.
+        :param task_id: Task id to drop
+        :return: None
+        """
+        with self._cond:
+            if self._journal is not None:
+                self._journal.append((task_id, None))
+            self._forget(task_id)
+
+    def on_write(self, op: WriteOp | None, result) -> None:
+        """
+        Write listener registered with the task manager.
+        :param op: Applied write, None after a bulk change of many tasks
+        :param result: Result returned by the store for the write
+        :return: None
+        """
+        if op is None:
+            # Reloading reads through the manager, so it runs on the scheduler thread
+            with self._cond:
+                self._reload_requested = True
+                self._cond.notify()
+        elif not result:
+            return
+        elif op.kind in (INSERT, UPDATE):
+            self.schedule(op.task)
+        elif op.kind in (DELETE, COMPLETE):
+            self.unschedule(op.task_id)
+
+    def pending(self) -> int:
+        """
+        Number of scheduled deadlines.
+        :return: Number of tasks waiting for a reminder
+        """
+        with self._cond:
+            return len(self._tasks)
+
+    def next_deadline(self) -> datetime | None:
+        """
+        Earliest scheduled deadline.
+        :return: Due date of the next reminder or None when nothing is scheduled
+        """
+        with self._cond:
+            self._drop_stale()
+            if not self._heap:
+                return None
+            return self._tasks[self._heap[0][2]][1]
+
+    def _drop_stale(self) -> None:
+        """
+        Pops stale entries off the top of the heap, the caller holds the lock.
+        :return: None
+        """
+        while self._heap:
+            _, seq, task_id = self._heap[0]
+            current = self._tasks.get(task_id)
+            if current is not None and current[0] == seq:
+                return
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now: datetime) -> list[Reminder]:
+        """
+        Removes the deadlines whose reminder time has come, the caller holds the lock.
+        :param now: Current time
+        :return: Reminders to fire
+        """
+        reminders: list[Reminder] = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] > now:
+                return reminders
+            _, _, task_id = heapq.heappop(self._heap)
+            _, due_date, title, overdue = self._tasks.pop(task_id)
+            self._reminded[task_id] = due_date
+            reminders.append(Reminder(task_id, title, due_date, overdue))
+
+    def fire_due(self, now: datetime | None = None) -> list[Reminder]:
+        """
+        Fires the reminders whose time has come.
+        A callback that fails is reported and the remaining callbacks still run.
+        :param now: Current time, defaults to the clock
+        :return: Reminders fired
+        """
+        with self._cond:
+            reminders: list[Reminder] = self._pop_due(now or self._clock())
+            self._fired += len(reminders)
+        for reminder in reminders:
+            for callback in self.callbacks:
+                try:
+                    callback(reminder)
+                except Exception:
+                    logger.exception("Error sending reminder")
+        return reminders
+
+    def stats(self) -> dict:
+        """
+        Counters of the scheduler.
+        :return: Dictionary with pending, fired and heap_size
+        """
+        with self._cond:
+            return {"pending": len(self._tasks), "fired": self._fired, "heap_size": len(self._heap)}
+
+    def _run(self) -> None:
+        """
+        Sleeps until the next reminder is due, fires it and repeats until stopped.
+        :return: None
+        """
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                reload: bool = self._reload_requested
+                self._reload_requested = False
+                if not reload:
+                    self._drop_stale()
+                    now: datetime = self._clock()
+                    if not self._heap or self._heap[0][0] > now:
+                        timeout: float = self.max_sleep
+                        if self._heap:
+                            timeout = min(timeout, (self._heap[0][0] - now).total_seconds())
+                        self._cond.wait(timeout)
+                        continue
+            if reload:
+                try:
+                    self.reload()
+                except Exception:
+                    logger.exception("Error loading task deadlines")
+                continue
+            self.fire_due()
+
+    def stop(self) -> None:
+        """
+        Stops the scheduler thread and stops following the manager's writes.
+        :return: None
+        """
+        self.manager.remove_write_listener(self.on_write)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
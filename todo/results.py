@@ -0,0 +1,82 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/results.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Typed outcome of the writes made through the task manager
+############################################################
+
+from typing import NamedTuple
+
+from .task import Task
+from db_config.errors import StorageError
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, WriteOp
+
+# Outcomes of a write
+INSERTED: str = "inserted"
+UPDATED: str = "updated"
+DELETED: str = "deleted"
+COMPLETED: str = "completed"
+ALREADY_COMPLETE: str = "already_complete"
+EXISTS: str = "exists"
+NOT_FOUND: str = "not_found"
+
+# Outcomes of writes that did not change anything because of the task they targeted
+REJECTED: frozenset[str] = frozenset((EXISTS, NOT_FOUND))
+
+
+class WriteResult(NamedTuple):
+    """
+    Outcome of one applied write. title is the task title when it is known, task is the new
+    state for inserts and updates and the removed task for deletes.
+    Storage failures are not results, they raise StorageError.
+    """
+    op: WriteOp
+    status: str
+    title: str | None = None
+    task: Task | None = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the write did what it asked for; completing a task that is already complete counts.
+        :return: True unless the task already existed (insert) or did not exist (other writes)
+        """
+        return self.status not in REJECTED
+
+    @classmethod
+    def from_store(cls, op: WriteOp, result) -> "WriteResult":
+        """
+        Builds the result of a write from what the store returned for it.
+        :param op: Applied write
+        :param result: Result returned by TaskStore.insert, update, delete or complete
+        :return: Write result
+        """
+        if not result:
+            if op.kind == INSERT:
+                return cls(op, EXISTS, op.task.title, op.task)
+            return cls(op, NOT_FOUND)
+        if op.kind == INSERT:
+            return cls(op, INSERTED, op.task.title, op.task)
+        if op.kind == UPDATE:
+            return cls(op, UPDATED, op.task.title, op.task)
+        if op.kind == DELETE:
+            return cls(op, DELETED, result.title, result)
+        if op.kind == COMPLETE:
+            title, was_complete = result
+            return cls(op, ALREADY_COMPLETE if was_complete else COMPLETED, title)
+        raise ValueError(f"Unknown write kind {op.kind!r}")
+
+
+def error_message(error: BaseException) -> str:
+    """
+    Describes a failed operation in one line, with the database error behind a storage error.
+    :param error: Raised error
+    :return: Error text
+    """
+    message: str = str(error).strip() or type(error).__name__
+    cause: BaseException | None = error.__cause__
+    if isinstance(error, StorageError) and cause is not None and str(cause).strip():
+        message = f"{message}: {str(cause).strip()}"
+    return message
@@ -3,16 +3,20 @@
 # File Name    : todo/task.py
 # Author       : @nissubba1
 # Created Date : 2025-06-16
-# Updated Date : 2025-06-17
+# Updated Date : 2026-10-18
 # Description  : Class to create new abstract task object
 ############################################################
 
 from datetime import datetime
-from typing import Optional
+from itertools import starmap
+from typing import Iterable, Iterator, Optional, Sequence
 
 
 class Task:
-    def __init__(self, task_id: int, title: str, created_at: datetime, due_date: datetime, is_complete: bool,
+    # Plain slot attributes instead of a per-instance __dict__ and property pairs keep large listings small
+    __slots__ = ("task_id", "title", "created_at", "due_date", "is_complete", "note")
+
+    def __init__(self, task_id: int, title: str, created_at: datetime, due_date: Optional[datetime], is_complete: bool,
                  note: Optional[str] = None) -> None:
         """
         Initialize a Task instance.
@@ -20,70 +24,44 @@ class Task:
         :param task_id: Unique identifier for the task.
         :param title: Title or name of the task.
         :param created_at: Timestamp when the task was created.
-        :param due_date: Deadline for the task.
+        :param due_date: Deadline for the task, None when it has none.
         :param is_complete: Status indicating if the task is complete.
         :param note: Optional additional note or description for the task.
         """
-        self._task_id = task_id
-        self._title = title
-        self._created_at = created_at
-        self._due_date = due_date
-        self._is_complete = is_complete
-        self._note = note
-
-    @property
-    def task_id(self) -> int:
-        return self._task_id
-
-    @task_id.setter
-    def task_id(self, task_id: int) -> None:
-        self._task_id = task_id
-
-    @property
-    def title(self) -> str:
-        return self._title
-
-    @title.setter
-    def title(self, title: str) -> None:
-        self._title = title
-
-    @property
-    def created_at(self) -> datetime:
-        return self._created_at
-
-    @created_at.setter
-    def created_at(self, created_at: datetime) -> None:
-        self._created_at = created_at
-
-    @property
-    def due_date(self) -> datetime:
-        return self._due_date
+        self.task_id: int = task_id
+        self.title: str = title
+        self.created_at: datetime = created_at
+        self.due_date: Optional[datetime] = due_date
+        self.is_complete: bool = is_complete
+        self.note: Optional[str] = note
+
+    @classmethod
+    def from_row(cls, row: Sequence) -> "Task":
+        """
+        Builds a Task from a database row.
 
-    @due_date.setter
-    def due_date(self, due_date: datetime) -> None:
-        self._due_date = due_date
+        :param row: Row with the columns task_id, title, created_at, due_date, is_complete, note.
+        :return: Task instance.
+        """
+        return cls(*row)
 
-    @property
-    def is_complete(self) -> bool:
-        return self._is_complete
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> Iterator["Task"]:
+        """
+        Lazily builds Tasks from database rows, faster than calling from_row for each row.
 
-    @is_complete.setter
-    def is_complete(self, is_complete: bool) -> None:
-        self._is_complete = is_complete
+        :param rows: Rows with the columns task_id, title, created_at, due_date, is_complete, note.
+        :return: Iterator of Task instances.
+        """
+        return starmap(cls, rows)
 
     @staticmethod
-    def format_date_time(date) -> str:
+    def format_date_time(date: Optional[datetime]) -> str:
+        if date is None:
+            return "-"
         format_date = "%m/%d/%Y %I:%M:%S %p"
         return date.strftime(format_date)
 
-    @property
-    def note(self) -> str:
-        return self._note
-
-    @note.setter
-    def note(self, note: str) -> None:
-        self._note = note
-
     def __str__(self) -> str:
         return (f"ID: {self.task_id}\n"
                 f"Title: {self.title}\n"
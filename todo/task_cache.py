@@ -0,0 +1,143 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/task_cache.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Thread-safe LRU cache of tasks keyed by task id with expiry
+############################################################
+
+from collections import OrderedDict
+from typing import Callable
+import copy
+import threading
+import time
+
+from .task import Task
+
+
+class TaskCache:
+    def __init__(self, max_size: int = 1024, ttl: float | None = 60.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Creates an empty cache.
+        Lookups of missing tasks are cached too, so repeated checks for a free task id stay in process.
+        :param max_size: Maximum number of task ids kept, the least recently used is evicted first
+        :param ttl: Seconds an entry stays valid, None keeps entries until evicted or invalidated
+        :param clock: Monotonic time source
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, tuple[Task | None, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Bumped by every change; _changed holds the generation of the last change per task id and reads
+        # that started before _floor count as outdated, which keeps _changed bounded
+        self._generation = 0
+        self._changed: dict[int, int] = {}
+        self._floor = 0
+
+    def _mark_changed(self, task_id: int) -> None:
+        """
+        Records a change of a task id, the caller holds the lock.
+        :param task_id: Changed task id
+        :return: None
+        """
+        self._generation += 1
+        self._changed[task_id] = self._generation
+        if len(self._changed) > 2 * self.max_size:
+            self._changed.clear()
+            self._floor = self._generation
+
+    def generation(self) -> int:
+        """
+        Current generation, taken before reading a task from storage and passed to put with the result.
+        :return: Generation number
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, task_id: int) -> tuple[bool, Task | None]:
+        """
+        Looks up a task.
+        :param task_id: Task id to look up
+        :return: Tuple of whether the id was cached and the task, None for a task known not to exist
+        """
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is None or (self.ttl is not None and entry[1] <= self._clock()):
+                if entry is not None:
+                    del self._entries[task_id]
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(task_id)
+            self._hits += 1
+            task = entry[0]
+        # Callers may modify the task they get, the cached one stays untouched
+        return True, copy.copy(task) if task is not None else None
+
+    def put(self, task_id: int, task: Task | None, generation: int | None = None) -> bool:
+        """
+        Stores a task, or records that the task does not exist.
+        With the generation taken before the task was read, nothing is stored when the task changed or was
+        invalidated since, as the task read may be older than that change.
+        :param task_id: Task id to store
+        :param task: Task to cache or None if the task does not exist
+        :param generation: Result of generation() before the read, None for the state just written
+        :return: True if stored, False if the read was outdated
+        """
+        expires_at: float = self._clock() + self.ttl if self.ttl is not None else float("inf")
+        stored = copy.copy(task) if task is not None else None
+        with self._lock:
+            if generation is not None and (generation < self._floor
+                                           or self._changed.get(task_id, 0) > generation):
+                return False
+            self._mark_changed(task_id)
+            self._entries[task_id] = (stored, expires_at)
+            self._entries.move_to_end(task_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return True
+
+    def invalidate(self, task_id: int) -> None:
+        """
+        Removes a task id from the cache.
+        :param task_id: Task id to remove
+        :return: None
+        """
+        with self._lock:
+            self._mark_changed(task_id)
+            self._entries.pop(task_id, None)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._changed.clear()
+            self._floor = self._generation
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the cache counters.
+        :return: Dictionary with hits, misses, evictions, size and hit ratio
+        """
+        with self._lock:
+            lookups: int = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,82 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/task_io.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Streaming readers for CSV and JSON Lines task files
+############################################################
+
+from datetime import datetime
+from typing import Iterator, TextIO
+import csv
+import json
+
+from .task import Task
+
+FORMATS: tuple[str, ...] = ("csv", "jsonl")
+
+
+def guess_format(path: str) -> str:
+    """
+    Guesses the file format from the file extension.
+    :param path: Path of the task file
+    :return: "jsonl" for .jsonl/.ndjson files, otherwise "csv"
+    """
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    return "csv"
+
+
+def parse_datetime(value) -> datetime | None:
+    """
+    Parses an ISO 8601 date time as written by the exporter.
+    :param value: Date time string, datetime or empty value
+    :return: Parsed datetime or None for empty values
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def parse_bool(value) -> bool:
+    """
+    Parses a boolean written as t/f, true/false, yes/no or 1/0.
+    :param value: String or boolean value
+    :return: Parsed boolean, empty values are False
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("t", "true", "1", "yes", "y")
+
+
+def task_from_record(record: dict) -> Task:
+    """
+    Builds a Task from a decoded CSV or JSON record.
+    :param record: Mapping with the task columns as keys
+    :return: Task instance, without a due date when due_date is empty or missing
+    """
+    created_at = parse_datetime(record.get("created_at")) or datetime.now()
+    note = record.get("note")
+    return Task(int(record["task_id"]), record.get("title") or "", created_at,
+                parse_datetime(record.get("due_date")), parse_bool(record.get("is_complete", False)),
+                note if note != "" else None)
+
+
+def read_tasks(stream: TextIO, fmt: str = "csv") -> Iterator[Task]:
+    """
+    Lazily reads tasks from a CSV file with a header row or a JSON Lines file.
+    :param stream: Text stream to read from
+    :param fmt: "csv" or "jsonl"
+    :return: Iterator of tasks in file order
+    """
+    if fmt == "csv":
+        records = csv.DictReader(stream)
+    elif fmt == "jsonl":
+        records = (json.loads(line) for line in stream if line.strip())
+    else:
+        raise ValueError(f"Unknown task file format {fmt!r}")
+    for record in records:
+        yield task_from_record(record)
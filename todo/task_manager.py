@@ -3,34 +3,324 @@
 # File Name    : todo/task_manager.py
 # Author       : @nissubba1
 # Created Date : 2025-06-16
-# Updated Date : 2025-06-17
-# Description  : Class to manage tasks and perform CURD operations with persistent database connection
+# Updated Date : 2026-10-18
+# Description  : Class to manage tasks and perform CURD operations on the configured storage backend
 ############################################################
 
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Iterable, Iterator, TextIO
+from uuid import uuid4
+import logging
+import os
+import threading
+
+from .pagination import TaskPage
+from .results import WriteResult, error_message
 from .task import Task
-from db_config.database_config import DatabaseConfig
+from .task_cache import TaskCache
+from .task_stats import TaskStats
+from .write_queue import WriteQueue
+from db_config.archive import add_months
+from db_config.change_feed import ChangeFeed
+from db_config.database_config import env_flag, load_env
+from db_config.errors import StorageError
+from db_config.notification_listener import RECONNECTED, NotificationListener
+from db_config.task_store import COMPLETE, DELETE, INSERT, UPDATE, TaskStore, WriteOp, create_store
+
+# Notification channel used to invalidate task caches in other processes
+CACHE_CHANNEL: str = "todo_task_cache"
+
+logger = logging.getLogger(__name__)
 
 
 class TaskManager:
-    def __init__(self) -> None:
+    def __init__(self, pooled: bool | None = None, cached_stats: bool | None = None,
+                 cache: TaskCache | None = None, cache_notify: bool | None = None,
+                 store: TaskStore | None = None, write_behind: bool | None = None,
+                 lazy: bool | None = None) -> None:
         """
-        Initializes the database connection instance
+        Initializes the storage backend
+        :param pooled: Use a connection pool so threads sharing the manager run their queries in parallel
+                       instead of one at a time, defaults to the DB_POOL_ENABLED environment variable
+        :param cached_stats: Read stats from the trigger-maintained task_counters table (Postgres only),
+                             defaults to the TODO_CACHED_STATS environment variable
+        :param cache: Read-through cache for single task lookups, by default one is created when
+                      TODO_CACHE_SIZE is set (with TODO_CACHE_TTL seconds expiry)
+        :param cache_notify: Invalidate the caches of other processes through LISTEN/NOTIFY (Postgres only),
+                             defaults to the TODO_CACHE_NOTIFY environment variable
+        :param store: Storage backend, by default the one named by TODO_BACKEND (Postgres if unset)
+        :param write_behind: Queue writes and apply them in grouped transactions, flushed every
+                             TODO_WRITE_BATCH writes or TODO_WRITE_DELAY_MS milliseconds,
+                             defaults to the TODO_WRITE_BEHIND environment variable
+        :param lazy: Connect to Postgres on the first query instead of now,
+                     defaults to the DB_LAZY_CONNECT environment variable
         """
-        self.db = DatabaseConfig()
+        load_env()
+        self.store: TaskStore = store or create_store(pooled=pooled, lazy=lazy)
+        if cached_stats is None:
+            cached_stats = env_flag("TODO_CACHED_STATS")
+        self.cached_stats: bool = cached_stats and self.store.enable_cached_stats()
+
+        if cache is None and int(os.getenv("TODO_CACHE_SIZE", "0")) > 0:
+            ttl: str = os.getenv("TODO_CACHE_TTL", "60")
+            cache = TaskCache(max_size=int(os.getenv("TODO_CACHE_SIZE")), ttl=float(ttl) if ttl else None)
+        self.cache: TaskCache | None = cache
+        # Identifies this manager in cache notifications so it skips its own messages
+        self._cache_origin: str = uuid4().hex
+        self._cache_listener: NotificationListener | None = None
+        if cache_notify is None:
+            cache_notify = env_flag("TODO_CACHE_NOTIFY")
+        if self.cache is not None and cache_notify:
+            try:
+                self._cache_listener = self.store.listen(CACHE_CHANNEL, self._on_cache_notification)
+            except StorageError as error:
+                # The cache still works, entries changed by other processes only last until the TTL
+                logger.warning("Cache notifications disabled: %s", error_message(error))
 
-    def add_task(self, task: Task) -> None:
+        # Called with every applied write, see add_write_listener
+        self._write_listeners: list[Callable[[WriteOp | None, object], None]] = []
+        # Called with the writes of a failed write-behind batch, see add_error_listener
+        self._error_listeners: list[Callable[[list[WriteOp], Exception], None]] = []
+        # Writes collected by atomic(), per thread
+        self._local = threading.local()
+        if write_behind is None:
+            write_behind = env_flag("TODO_WRITE_BEHIND")
+        self.write_queue: WriteQueue | None = None
+        if write_behind:
+            self.write_queue = WriteQueue(self._apply_batch, max_batch=int(os.getenv("TODO_WRITE_BATCH", "500")),
+                                          max_delay=float(os.getenv("TODO_WRITE_DELAY_MS", "50")) / 1000)
+
+    def _on_cache_notification(self, payload: str) -> None:
         """
-        Adds a task to the database.
-        :param task: task to add
+        Invalidates a cached task changed by another process.
+        :param payload: "<origin>:<task_id>", "<origin>:*" or the listener's reconnect marker
+        :return: None
+        """
+        if payload == RECONNECTED:
+            self.cache.clear()
+            return
+        origin, _, task_id = payload.partition(":")
+        if origin == self._cache_origin:
+            return
+        if task_id == "*":
+            self.cache.clear()
+        else:
+            self.cache.invalidate(int(task_id))
+
+    def _cache_changed(self, task_id: int | None, task: Task | None = None, exists: bool | None = None) -> None:
+        """
+        Updates the cache after a write and tells other processes about it.
+        :param task_id: Changed task id, None when many tasks changed
+        :param task: New state of the task when it is known
+        :param exists: False when the task is known to be gone
+        :return: None
+        """
+        if self.cache is None:
+            return
+        if task_id is None:
+            self.cache.clear()
+        elif task is not None:
+            self.cache.put(task_id, task)
+        elif exists is False:
+            self.cache.put(task_id, None)
+        else:
+            self.cache.invalidate(task_id)
+        if self._cache_listener is not None:
+            try:
+                self.store.notify(CACHE_CHANNEL, f"{self._cache_origin}:{'*' if task_id is None else task_id}")
+            except StorageError as error:
+                # The write is committed, so it is not failed over a lost message; the other
+                # processes drop their copy when its TTL ends
+                logger.warning("Cache notification not sent: %s", error_message(error))
+
+    def cache_stats(self) -> dict | None:
+        """
+        Hit and miss counters of the task cache.
+        :return: Dictionary of cache counters or None when caching is disabled
+        """
+        return self.cache.stats() if self.cache is not None else None
+
+    def add_write_listener(self, listener: Callable[[WriteOp | None, object], None]) -> None:
+        """
+        Registers a function called after every write made through this manager is applied, with the
+        write and the result the store returned for it, or with None and None after a bulk import.
+        Listeners run on the thread applying the write, which is the write-behind thread in that mode.
+        :param listener: Function to call
+        :return: None
+        """
+        self._write_listeners.append(listener)
+
+    def remove_write_listener(self, listener: Callable[[WriteOp | None, object], None]) -> None:
+        """
+        Stops calling a write listener.
+        :param listener: Function registered with add_write_listener
+        :return: None
+        """
+        if listener in self._write_listeners:
+            self._write_listeners.remove(listener)
+
+    def _notify_listeners(self, op: WriteOp | None, result) -> None:
+        """
+        Calls the write listeners, a failing listener is reported and does not stop the others.
+        :param op: Applied write or None after a bulk import
+        :param result: Result returned by the store for the write
+        :return: None
+        """
+        for listener in list(self._write_listeners):
+            try:
+                listener(op, result)
+            except Exception:
+                logger.exception("Error in write listener")
+
+    def add_error_listener(self, listener: Callable[[list[WriteOp], Exception], None]) -> None:
+        """
+        Registers a function called when a batch of write-behind writes fails, with the writes,
+        none of which were applied, and the error. Listeners run on the write-behind thread.
+        :param listener: Function to call
         :return: None
         """
-        if self.is_task(task.task_id):
-            print(f"{task.title} already exists")
+        self._error_listeners.append(listener)
+
+    def remove_error_listener(self, listener: Callable[[list[WriteOp], Exception], None]) -> None:
+        """
+        Stops calling an error listener.
+        :param listener: Function registered with add_error_listener
+        :return: None
+        """
+        if listener in self._error_listeners:
+            self._error_listeners.remove(listener)
+
+    def _write(self, op: WriteOp) -> WriteResult | None:
+        """
+        Applies a write now, or queues it inside atomic() or in write-behind mode.
+        :param op: Write to apply
+        :return: Outcome of the write or None when it was queued
+        """
+        atomic_ops: list[WriteOp] | None = getattr(self._local, "atomic_ops", None)
+        if atomic_ops is not None:
+            atomic_ops.append(op)
+        elif self.write_queue is not None:
+            self.write_queue.put(op)
         else:
-            query_stmt: str = "INSERT INTO tasks (task_id, title, created_at, due_date, is_complete, note) VALUES (%s, %s, %s, %s, %s, %s)"
-            self.db.insert_task(query_stmt,
-                                (task.task_id, task.title, task.created_at, task.due_date, task.is_complete, task.note))
-            print(f"{task.title} inserted to database")
+            result = self.store.apply_write(op)
+            self._applied(op, result)
+            return WriteResult.from_store(op, result)
+        return None
+
+    def _applied(self, op: WriteOp, result) -> None:
+        """
+        Updates the cache and calls the write listeners after a write was applied.
+        :param op: Applied write
+        :param result: Result returned by the store for the write
+        :return: None
+        """
+        if not result:
+            if self.cache is not None:
+                self.cache.invalidate(op.task_id)
+        elif op.kind in (INSERT, UPDATE):
+            self._cache_changed(op.task_id, op.task)
+        elif op.kind == DELETE:
+            self._cache_changed(op.task_id, exists=False)
+        elif not result[1]:
+            self._cache_changed(op.task_id)
+        self._notify_listeners(op, result)
+
+    def _apply_ops(self, ops: list[WriteOp]) -> list:
+        """
+        Applies writes in one transaction and updates the cache and the write listeners.
+        :param ops: Writes in the order they were made
+        :return: Result of every write, as returned by the store
+        """
+        try:
+            results: list = self.store.apply_writes(ops)
+        except Exception:
+            if self.cache is not None:
+                for op in ops:
+                    self.cache.invalidate(op.task_id)
+            raise
+        for op, result in zip(ops, results):
+            self._applied(op, result)
+        return results
+
+    def apply_writes(self, ops: list[WriteOp]) -> list:
+        """
+        Applies writes in one transaction, all or none, and returns the raw store results.
+        Queued writes are applied first. Errors are raised and nothing of the batch is applied.
+        :param ops: Writes in the order they were made
+        :return: Result of every write, as returned by TaskStore.insert, update, delete or complete
+        """
+        self._flush_pending()
+        return self._apply_ops(ops)
+
+    def _apply_batch(self, ops: list[WriteOp]) -> None:
+        """
+        Applies a batch of write-behind writes, a failure is passed to the error listeners.
+        :param ops: Writes in the order they were made
+        :return: None
+        """
+        try:
+            self._apply_ops(ops)
+        except Exception as error:
+            logger.error("Error applying %d queued writes, none were applied: %s", len(ops), error)
+            for listener in list(self._error_listeners):
+                try:
+                    listener(ops, error)
+                except Exception:
+                    logger.exception("Error in error listener")
+            raise
+
+    def _flush_pending(self) -> None:
+        """
+        Flushes queued writes before a read so it sees them.
+        :return: None
+        """
+        if self.write_queue is not None and self.write_queue.pending():
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Applies every write waiting in the write-behind queue.
+        A batch that fails is rolled back, passed to the error listeners and its error raised,
+        usually a StorageError; its writes are dropped from the queue.
+        :return: Number of writes flushed
+        """
+        if self.write_queue is None:
+            return 0
+        return self.write_queue.flush()
+
+    @contextmanager
+    def atomic(self) -> Iterator[list[WriteResult]]:
+        """
+        Collects the writes made in the with block and applies them in one transaction when it ends,
+        all or none. Writes are discarded if the block raises, and reads inside the block do not see
+        them yet. Nested blocks join the outer one.
+        :return: List filled with the outcome of every write when the outermost block ends
+        """
+        if getattr(self._local, "atomic_results", None) is not None:
+            yield self._local.atomic_results
+            return
+        # Writes queued before the block are applied first
+        self.flush()
+        ops: list[WriteOp] = []
+        results: list[WriteResult] = []
+        self._local.atomic_ops = ops
+        self._local.atomic_results = results
+        try:
+            yield results
+        finally:
+            self._local.atomic_ops = None
+            self._local.atomic_results = None
+        if ops:
+            results.extend(WriteResult.from_store(op, result) for op, result in zip(ops, self._apply_ops(ops)))
+
+    def add_task(self, task: Task) -> WriteResult | None:
+        """
+        Adds a task to the database.
+        :param task: task to add
+        :return: Outcome of the write, None when it was queued by atomic() or write-behind
+        """
+        return self._write(WriteOp(INSERT, task.task_id, task))
 
     def is_task(self, task_id: int) -> bool:
         """
@@ -38,113 +328,117 @@ class TaskManager:
         :param task_id: Task id to check
         :return: True if task is in the database else False
         """
-        query_stmt = "SELECT COUNT(*) FROM tasks WHERE task_id = %s"
-        result: int | None = self.db.fetch_value(query_stmt, (task_id,))
-        return result > 0
+        if self.cache is not None:
+            return self.get_task(task_id) is not None
+        self._flush_pending()
+        return self.store.exists(task_id)
 
-    def delete_task(self, task_id: int) -> None:
+    def delete_task(self, task_id: int) -> WriteResult | None:
         """
         Deletes a task from the database.
         :param task_id: Task id to delete
-        :return: None
+        :return: Outcome of the write, None when it was queued by atomic() or write-behind
         """
-        if self.is_task(task_id):
-            query_stmt: str = "SELECT * FROM tasks WHERE task_id = %s"
-            task: Task | None = self.db.fetch_task(query_stmt, (task_id,))
-            query_stmt: str = "DELETE FROM tasks WHERE task_id = %s"
-            result = self.db.delete_task(query_stmt, (task_id,))
-            task_title: str | int = task.title if task else task_id
-            if result:
-                print(f"{task_title} deleted successfully")
-        else:
-            print(f"Task ID {task_id} does not exist")
+        return self._write(WriteOp(DELETE, task_id))
 
-    def update_task(self, task: Task) -> None:
+    def update_task(self, task: Task) -> WriteResult | None:
         """
         Updates a task from the database.
         :param task: Task id to update
-        :return: None
+        :return: Outcome of the write, None when it was queued by atomic() or write-behind
         """
-        if self.is_task(task.task_id):
-            query_stmt: str = "UPDATE tasks SET title = %s, created_at = %s, due_date = %s, is_complete = %s, note = %s WHERE task_id = %s"
-            result: bool = self.db.update_task(query_stmt,
-                                               (task.title, task.created_at, task.due_date, task.is_complete, task.note,
-                                                task.task_id))
-            if result:
-                print(f"{task.title} updated successfully")
-            else:
-                print(f"Task ID {task.task_id} does not exist")
+        return self._write(WriteOp(UPDATE, task.task_id, task))
 
-    def set_complete(self, task_id: int) -> None:
+    def set_complete(self, task_id: int) -> WriteResult | None:
         """
         Sets a task complete.
+        The lookup and the update are atomic, so concurrent callers see the completed state.
         :param task_id: Task id to change the status
-        :return: None
+        :return: Outcome of the write, None when it was queued by atomic() or write-behind
         """
-        if self.is_task(task_id):
-            query_stmt: str = "SELECT * FROM tasks WHERE task_id = %s"
-            result: Task | None = self.db.fetch_task(query_stmt, (task_id,))
-            if result:
-                if not result.is_complete:
-                    query_stmt: str = "UPDATE tasks SET is_complete = %s WHERE task_id = %s"
-                    update_query: bool = self.db.execute_query(query_stmt, (True, task_id))
-                    if update_query:
-                        print(f"{result.title} marked complete")
-                else:
-                    print(f"{result.title} is already complete")
-            else:
-                print(f"Task ID {task_id} does not exist")
+        return self._write(WriteOp(COMPLETE, task_id))
+
+    def stats(self, now: datetime | None = None) -> TaskStats:
+        """
+        Counts total, completed, incomplete and overdue tasks in one pass over the storage.
+        With cached stats the first three come from precomputed counters and only the overdue
+        tasks are counted.
+        :param now: Tasks due before this time are overdue, defaults to the current time
+        :return: Task counts, all -1 if the store returned none
+        """
+        self._flush_pending()
+        result: TaskStats | None = self.store.stats(now or datetime.now())
+        if result is None:
+            return TaskStats(-1, -1, -1, -1)
+        return result
 
     def count_total_tasks(self) -> int:
         """
         Counts the total number of tasks in the database.
         :return: number of tasks in the database
         """
-        query_stmt: str = "SELECT COUNT(*) FROM tasks"
-        result: int | None = self.db.fetch_value(query_stmt)
-        if result is not None:
-            return result
-        return -1
+        self._flush_pending()
+        return self.store.count()
 
     def count_completed_task(self) -> int:
         """
         Counts the total number of completed tasks in the database.
         :return: Number of completed tasks in the database
         """
-        query_stmt: str = "SELECT COUNT(*) FROM tasks WHERE is_complete = %s"
-        result: int | None = self.db.fetch_value(query_stmt, (True,))
-        if result is not None:
-            return result
-        return -1
+        self._flush_pending()
+        return self.store.count(is_complete=True)
 
     def count_incompleted_tasks(self) -> int:
         """
         Counts the total number of incompleted tasks in the database.
         :return: number of incompleted tasks in the database
         """
-        query_stmt: str = "SELECT COUNT(*) FROM tasks WHERE is_complete = %s"
-        result: int | None = self.db.fetch_value(query_stmt, (False,))
-        if result is not None:
-            return result
-        return -1
+        self._flush_pending()
+        return self.store.count(is_complete=False)
 
-    def show_completed_task(self) -> None:
+    def iter_tasks(self, is_complete: bool | None = None) -> Iterator[Task]:
         """
-        Shows the completed task in the database.
-        :return: None
+        Streams tasks from the database without loading them all into memory.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :return: Iterator of tasks
         """
-        query_stmt: str = "SELECT * FROM tasks WHERE is_complete = %s"
-        result: list[Task] = self.db.fetch_all_tasks(query_stmt, (True,))
-        self.display_tasks(result)
+        self._flush_pending()
+        return self.store.iter_tasks(is_complete)
 
-    def show_uncompleted_task(self) -> None:
+    def list_tasks(self, is_complete: bool | None = None, due_after: datetime | None = None,
+                   due_before: datetime | None = None, order_by: str = "due_date", page_size: int = 50,
+                   cursor: str | None = None) -> TaskPage:
         """
-        Shows the uncompleted task in the database.
-        :return: None
+        Gets one page of tasks using keyset pagination.
+        Every page seeks directly to the position after the previous page, so deep pages cost the same as
+        the first one. Tasks without a value in the order column come last, ordered by task id.
+        :param is_complete: Only completed (True) or incomplete (False) tasks, None for all tasks
+        :param due_after: Only tasks due at or after this time
+        :param due_before: Only tasks due before this time
+        :param order_by: Column to order by, one of due_date, created_at or task_id
+        :param page_size: Maximum number of tasks in the page
+        :param cursor: Cursor from the previous page, None for the first page
+        :return: Page of tasks and the cursor of the next page
+        """
+        self._flush_pending()
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        return self.store.list_page(is_complete, due_after, due_before, order_by, page_size, cursor)
+
+    def search(self, query: str, limit: int = 20) -> list[Task]:
+        """
+        Full-text search over task titles and notes.
+        Every word of the query must match the start of a word in the title or note, titles count
+        more than notes in the ranking. Postgres also finds titles with misspelled words when the
+        pg_trgm extension is installed.
+        :param query: Words to search for
+        :param limit: Maximum number of tasks to return
+        :return: Matching tasks, best match first
         """
-        query_stmt: str = "SELECT * FROM tasks WHERE is_complete = %s"
-        result: list[Task] = self.db.fetch_all_tasks(query_stmt, (False,))
-        self.display_tasks(result)
+        self._flush_pending()
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        return self.store.search(query, limit)
 
     def get_task(self, task_id: int) -> Task | None:
         """
@@ -152,37 +446,127 @@ class TaskManager:
         :param task_id: Task to get
         :return: Task or None if task does not exist
         """
-        if self.is_task(task_id):
-            query_stmt: str = "SELECT * FROM tasks WHERE task_id = %s"
-            result: Task | None = self.db.fetch_task(query_stmt, (task_id,))
-            return result
-        return None
+        self._flush_pending()
+        if self.cache is None:
+            return self.store.get(task_id)
+        cached, cached_task = self.cache.get(task_id)
+        if cached:
+            return cached_task
+        # A write or notification landing during the read makes the result too old to cache
+        generation: int = self.cache.generation()
+        task: Task | None = self.store.get(task_id)
+        self.cache.put(task_id, task, generation)
+        return task
 
-    @staticmethod
-    def display_tasks(tasks_list: list[Task]) -> None:
+    def add_tasks(self, tasks: Iterable[Task], batch_size: int = 5000, on_conflict: str = "skip",
+                  progress: Callable[[int, int], None] | None = None) -> tuple[int, int]:
         """
-        Displays the tasks in the database.
-        :param tasks_list: List of task to display
-        :return: None
+        Bulk adds tasks, one batch per transaction (COPY on Postgres).
+        :param tasks: Tasks to add, consumed lazily
+        :param batch_size: Number of tasks sent per batch
+        :param on_conflict: "skip" keeps existing tasks, "update" overwrites them
+        :param progress: Called after every batch with the tasks read and tasks written so far
+        :return: Tuple of tasks read and tasks inserted or updated
         """
-        for task in tasks_list:
-            print("*" * 40)
-            print(task)
-            print("*" * 40)
+        self._flush_pending()
+        try:
+            return self.store.bulk_insert(tasks, batch_size=batch_size, on_conflict=on_conflict, progress=progress)
+        finally:
+            self._cache_changed(None)
+            self._notify_listeners(None, None)
 
-    def show_all_tasks(self) -> None:
+    def export_tasks(self, stream: TextIO, fmt: str = "csv") -> int:
         """
-        Shows all tasks in the database.
-        :return: None
+        Streams all tasks ordered by task id to a file-like object (COPY on Postgres).
+        :param stream: Text stream to write to
+        :param fmt: "csv" or "jsonl"
+        :return: Number of tasks written
+        """
+        self._flush_pending()
+        return self.store.export(stream, fmt)
+
+    def archive_completed(self, older_than_days: int | None = None, batch_size: int = 1000,
+                          pause: float = 0.0) -> int | None:
+        """
+        Moves tasks completed more than some days ago out of the live tasks into the archive (Postgres only),
+        one short transaction per batch. Archived tasks no longer appear in listings, counts or stats.
+        A failure raises StorageError; the batches committed before it stay archived.
+        :param older_than_days: Age of the completion in days, defaults to TODO_ARCHIVE_DAYS (30)
+        :param batch_size: Maximum number of tasks moved per transaction
+        :param pause: Seconds to wait between batches
+        :return: Number of tasks archived or None when the backend has no archive
+        """
+        self._flush_pending()
+        if older_than_days is None:
+            older_than_days = int(os.getenv("TODO_ARCHIVE_DAYS", "30"))
+        before: datetime = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        archived: int | None = self.store.archive_completed(before, batch_size, pause)
+        if archived:
+            self._cache_changed(None)
+        return archived
+
+    def archived_tasks(self, completed_after: datetime | None = None, completed_before: datetime | None = None,
+                       limit: int = 100) -> list[Task]:
+        """
+        Gets archived tasks, most recently completed first. Only the archive months in the range are read.
+        :param completed_after: Only tasks completed at or after this time
+        :param completed_before: Only tasks completed before this time
+        :param limit: Maximum number of tasks to return
+        :return: Archived tasks
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        return self.store.archived(completed_after, completed_before, limit)
+
+    def restore_task(self, task_id: int) -> bool:
+        """
+        Moves an archived task back to the live tasks, keeping its completion time.
+        :param task_id: Task id to restore
+        :return: True if restored, False if it is not archived or a live task has the same id
+        """
+        self._flush_pending()
+        restored: bool = self.store.restore(task_id)
+        if restored:
+            self._cache_changed(task_id)
+        return restored
+
+    def drop_archived(self, keep_months: int | None = None) -> list[str] | None:
+        """
+        Retention for the archive: removes the tasks of completion months older than the months kept.
+        Whole months are dropped at once, which costs the same however many tasks they hold.
+        A failure raises StorageError.
+        :param keep_months: Months kept besides the current one, defaults to TODO_ARCHIVE_RETENTION_MONTHS (12)
+        :return: Names of the dropped months or None when the backend has no archive
+        """
+        if keep_months is None:
+            keep_months = int(os.getenv("TODO_ARCHIVE_RETENTION_MONTHS", "12"))
+        today: date = datetime.now(timezone.utc).date()
+        return self.store.drop_archive(add_months(today, -keep_months))
+
+    def change_feed(self, after: int | None = None) -> ChangeFeed | None:
+        """
+        Opens a feed of the task changes made by every process (Postgres only). Iterating the feed
+        blocks until changes are committed; keep the seq of the last handled event and pass it as
+        after to resume without missing any.
+        :param after: Sequence number of the last change already handled, 0 for the whole log,
+                      None for changes committed from now on
+        :return: Change feed, close it when done, or None when the backend has no change log
         """
-        query_stmt = "SELECT * FROM tasks"
-        result: list[Task] = self.db.fetch_all_tasks(query_stmt)
-        self.display_tasks(result)
+        self._flush_pending()
+        return self.store.change_feed(after)
 
     def close_connection(self) -> None:
         """
         Closes the database connection.
+        Queued writes are applied first; if that fails the connection is still closed and the error
+        raised, so the caller knows the writes were lost.
         :return: None
         """
-        self.db.close()
-        print("DB connection closed")
+        try:
+            if self.write_queue is not None:
+                self.write_queue.close()
+        finally:
+            if self._cache_listener is not None:
+                self._cache_listener.stop()
+            self.store.close()
+            logger.info("DB connection closed")
@@ -0,0 +1,20 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/task_stats.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Summary counts of the tasks shown on the welcome screen
+############################################################
+
+from typing import NamedTuple
+
+
+class TaskStats(NamedTuple):
+    """
+    Task counts, every field is -1 when the counts could not be loaded.
+    """
+    total: int
+    completed: int
+    incomplete: int
+    overdue: int
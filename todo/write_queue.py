@@ -0,0 +1,135 @@
+############################################################
+# Project Name : Todo App
+# File Name    : todo/write_queue.py
+# Author       : @nissubba1
+# Created Date : 2026-10-18
+# Updated Date : 2026-10-18
+# Description  : Write-behind queue flushing task writes in grouped transactions
+############################################################
+
+from typing import Callable
+import threading
+import time
+
+from db_config.task_store import WriteOp
+
+
+class WriteQueue:
+    def __init__(self, apply: Callable[[list[WriteOp]], None], max_batch: int = 500,
+                 max_delay: float = 0.05) -> None:
+        """
+        Starts the background flusher.
+        Writes are flushed when max_batch of them are waiting, when the oldest has waited max_delay
+        seconds, or when flush() is called.
+        :param apply: Called with every batch of writes in the order they were queued
+        :param max_batch: Number of waiting writes that triggers a flush
+        :param max_delay: Seconds the oldest write may wait before it is flushed
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be positive")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._apply = apply
+        self._cond = threading.Condition()
+        # Serializes flushes so batches reach the database in queue order
+        self._flush_lock = threading.Lock()
+        self._ops: list[WriteOp] = []
+        self._oldest: float = 0.0
+        self._closed = False
+        self._flushes = 0
+        self._flushed_ops = 0
+        self._failed_ops = 0
+        self._thread = threading.Thread(target=self._run, name="todo-write-queue", daemon=True)
+        self._thread.start()
+
+    def put(self, op: WriteOp) -> None:
+        """
+        Queues a write, flushing in the calling thread when the batch is full.
+        :param op: Write to queue
+        :return: None
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write queue is closed")
+            if not self._ops:
+                self._oldest = time.monotonic()
+                self._cond.notify()
+            self._ops.append(op)
+            full: bool = len(self._ops) >= self.max_batch
+        if full:
+            self.flush()
+
+    def pending(self) -> int:
+        """
+        Number of writes waiting to be flushed.
+        :return: Number of queued writes
+        """
+        with self._cond:
+            return len(self._ops)
+
+    def flush(self) -> int:
+        """
+        Applies every queued write now.
+        A batch that fails is dropped and the error raised, apply is expected to report it.
+        :return: Number of writes flushed
+        """
+        with self._flush_lock:
+            with self._cond:
+                ops, self._ops = self._ops, []
+            if not ops:
+                return 0
+            try:
+                self._apply(ops)
+            except Exception:
+                self._failed_ops += len(ops)
+                raise
+            self._flushes += 1
+            self._flushed_ops += len(ops)
+            return len(ops)
+
+    def _run(self) -> None:
+        """
+        Flushes writes once the oldest one has waited max_delay seconds.
+        :return: None
+        """
+        while True:
+            with self._cond:
+                while not self._ops and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                remaining: float = self._oldest + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+            try:
+                self.flush()
+            except Exception:
+                # apply reports the failure, the thread keeps serving later writes
+                pass
+
+    def stats(self) -> dict:
+        """
+        Counters of the queue.
+        :return: Dictionary with pending, flushes, flushed_ops, failed_ops and avg_batch
+        """
+        with self._cond:
+            pending: int = len(self._ops)
+        return {
+            "pending": pending,
+            "flushes": self._flushes,
+            "flushed_ops": self._flushed_ops,
+            "failed_ops": self._failed_ops,
+            "avg_batch": self._flushed_ops / self._flushes if self._flushes else 0.0,
+        }
+
+    def close(self) -> None:
+        """
+        Stops the background flusher and flushes the remaining writes.
+        :return: None
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.flush()